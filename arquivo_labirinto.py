@@ -0,0 +1,277 @@
+"""
+Leitura e gravação de labirintos
+
+Formatos:
+- Texto: uma linha por linha da grade, com '#' parede, ' ' caminho, 'S' início e 'E' fim;
+  terreno como dígitos '2'..'9' (custo da célula); custos acima de 9 ou em S/E não
+  cabem no texto e salvar_texto recusa a grade (ValueError)
+- Binário (.lab): cabeçalho fixo + células em uma de três codificações
+    * bruto: 1 byte por célula (carregado via mmap com uma única cópia, do mapa para a grade)
+    * bits:  1 bit por célula (parede = 1), bit k do byte i = célula 8*i + k
+    * zlib:  bits comprimidos com zlib (padrão; ótimo para labirintos com muita regularidade)
+  Versão 2: depois das células vem o bloco de terreno (tamanho + crc32 + custos
+  comprimidos com zlib, 1 byte por célula; tamanho 0 = sem terreno). Arquivos da
+  versão 1 (sem o bloco) continuam sendo lidos.
+
+Nenhum dos caminhos de leitura/gravação percorre célula por célula em Python:
+a conversão usa bytes.translate, array e tabelas de 256 entradas (ou NumPy, se instalado).
+"""
+
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+
+from labirinto import PAREDE, GradeLabirinto
+
+try:
+    import numpy
+except ImportError:  # NumPy é opcional; sem ele usamos os caminhos em Python puro
+    numpy = None
+
+MAGICO = b"LABZ"
+VERSAO = 2
+VERSOES_SUPORTADAS = (1, 2)
+# magic, versão, codificação, linhas, colunas, S (r, c), E (r, c), tamanho dos dados, crc32
+CABECALHO = struct.Struct("<4sBBIIiiiiQI")
+# bloco de terreno (versão 2): tamanho dos custos comprimidos, crc32
+CABECALHO_TERRENO = struct.Struct("<QI")
+
+CODIFICACOES = {"bruto": 0, "bits": 1, "zlib": 2}
+_NOMES_CODIFICACAO = {v: k for k, v in CODIFICACOES.items()}
+
+# Tabelas de conversão
+_TEXTO_PARA_CELULA = bytes(PAREDE if b == ord('#') else 0 for b in range(256))
+_CELULA_PARA_TEXTO = bytes(ord('#') if b == PAREDE else ord(' ') for b in range(256))
+_CELULA_PARA_BIT = bytes(1 if b == PAREDE else 0 for b in range(256))
+# terreno no texto: dígitos '2'..'9' são custos; qualquer outro caractere tem custo 1
+_TEXTO_PARA_CUSTO = bytes(b - ord('0') if ord('2') <= b <= ord('9') else 1 for b in range(256))
+# custo -> caractere (0 = custo que o texto não representa)
+_CUSTO_PARA_TEXTO = bytes(ord(' ') if b == 1 else ord('0') + b if 2 <= b <= 9 else 0 for b in range(256))
+# célula -> máscara que mantém o byte do terreno só nas células livres
+_MASCARA_LIVRE = bytes(0 if b == PAREDE else 0xFF for b in range(256))
+# byte empacotado -> 8 células (uma por bit, menos significativo primeiro)
+_BYTE_PARA_CELULAS = [bytes(PAREDE if (b >> k) & 1 else 0 for k in range(8)) for b in range(256)]
+# multiplicar 8 bytes 0/1 (little-endian) por este número leva o byte k ao bit 56 + k
+_JUNTAR_BITS = sum(1 << (56 - 7 * k) for k in range(8))
+
+
+class ErroFormatoLabirinto(ValueError):
+    """Arquivo de labirinto inválido ou corrompido."""
+
+
+# -------------------
+# EMPACOTAMENTO DE BITS
+# -------------------
+def empacotar_bits(celulas):
+    """Converte as células (1 byte cada) em bits (parede = 1)."""
+    uns = bytes(celulas).translate(_CELULA_PARA_BIT)
+    if numpy is not None:
+        return numpy.packbits(numpy.frombuffer(uns, dtype=numpy.uint8), bitorder="little").tobytes()
+    resto = len(uns) % 8
+    if resto:
+        uns += bytes(8 - resto)
+    if sys.byteorder != "little":
+        # plataforma big-endian: caminho lento, porém correto
+        return bytes(sum(uns[i + k] << k for k in range(8)) for i in range(0, len(uns), 8))
+    palavras = array('Q')
+    palavras.frombytes(uns)
+    juntar = _JUNTAR_BITS
+    return bytes(((p * juntar) >> 56) & 0xFF for p in palavras)
+
+
+def desempacotar_bits(dados, n):
+    """Inverso de empacotar_bits: devolve bytearray com n células."""
+    if numpy is not None:
+        bits = numpy.unpackbits(numpy.frombuffer(dados, dtype=numpy.uint8), count=n, bitorder="little")
+        if PAREDE != 1:
+            bits *= PAREDE
+        return bytearray(bits.tobytes())
+    celulas = bytearray(b"".join(map(_BYTE_PARA_CELULAS.__getitem__, dados)))
+    del celulas[n:]
+    return celulas
+
+
+# -------------------
+# TEXTO
+# -------------------
+def _texto_com_terreno(grade, corpo):
+    """Troca o ' ' das células livres pelo dígito do custo; '#' fica nas paredes."""
+    n = len(corpo)
+    digitos = int.from_bytes(bytes(grade.custos).translate(_CUSTO_PARA_TEXTO), "little")
+    livres = int.from_bytes(bytes(grade.celulas).translate(_MASCARA_LIVRE), "little")
+    # byte a byte, com operações em inteiros grandes (em C): dígito onde livre, corpo onde parede
+    corpo = ((digitos & livres) | (int.from_bytes(corpo, "little") & ~livres)).to_bytes(n, "little")
+    if 0 in corpo:
+        raise ValueError("O formato texto só guarda custos de 1 a 9; salve como .lab.")
+    for pos in (grade.inicio, grade.fim):
+        if pos is not None and grade.custo(*pos) != 1:
+            raise ValueError("O formato texto não guarda custo nas células S/E; salve como .lab.")
+    return corpo
+
+
+def salvar_texto(grade, caminho):
+    corpo = bytes(grade.celulas).translate(_CELULA_PARA_TEXTO)
+    if grade.custos is not None:
+        corpo = _texto_com_terreno(grade, corpo)
+    corpo = bytearray(corpo)
+    for pos, letra in ((grade.inicio, b"S"), (grade.fim, b"E")):
+        if pos is not None:
+            corpo[grade.indice(*pos)] = letra[0]
+    colunas = grade.colunas
+    with open(caminho, "wb") as f:
+        if colunas:
+            f.writelines(corpo[i:i + colunas] + b"\n" for i in range(0, len(corpo), colunas))
+
+
+def ler_texto(conteudo):
+    """Cria a grade a partir do conteúdo (str ou bytes) no formato texto."""
+    if isinstance(conteudo, str):
+        conteudo = conteudo.encode("ascii")
+    linhas_texto = conteudo.replace(b"\r\n", b"\n").split(b"\n")
+    while linhas_texto and linhas_texto[-1] == b"":
+        linhas_texto.pop()
+    linhas = len(linhas_texto)
+    colunas = max((len(linha) for linha in linhas_texto), default=0)
+    # linhas curtas (espaços finais removidos por editores) são completadas com caminho
+    corpo = b"".join(linha.ljust(colunas) for linha in linhas_texto)
+    custos = corpo.translate(_TEXTO_PARA_CUSTO)
+    custos = bytearray(custos) if custos.count(1) != len(custos) else None
+    grade = GradeLabirinto(linhas, colunas, bytearray(corpo.translate(_TEXTO_PARA_CELULA)), custos=custos)
+    for letra, atributo in ((b"S", "inicio"), (b"E", "fim")):
+        i = corpo.find(letra)
+        if i != -1:
+            if corpo.find(letra, i + 1) != -1:
+                raise ErroFormatoLabirinto(f"Mais de uma posição {letra.decode()} no arquivo.")
+            setattr(grade, atributo, divmod(i, colunas))
+    return grade
+
+
+def carregar_texto(caminho):
+    with open(caminho, "rb") as f:
+        return ler_texto(f.read())
+
+
+# -------------------
+# BINÁRIO
+# -------------------
+def salvar_binario(grade, caminho, codificacao="zlib", nivel=6):
+    if codificacao not in CODIFICACOES:
+        raise ValueError(f"Codificação desconhecida: {codificacao!r}. Opções: {', '.join(CODIFICACOES)}.")
+    if codificacao == "bruto":
+        dados = bytes(grade.celulas)
+    else:
+        dados = empacotar_bits(grade.celulas)
+        if codificacao == "zlib":
+            dados = zlib.compress(dados, nivel)
+    terreno = zlib.compress(grade.custos, nivel) if grade.custos is not None else b""
+    inicio = grade.inicio or (-1, -1)
+    fim = grade.fim or (-1, -1)
+    cabecalho = CABECALHO.pack(MAGICO, VERSAO, CODIFICACOES[codificacao], grade.linhas, grade.colunas,
+                               inicio[0], inicio[1], fim[0], fim[1], len(dados), zlib.crc32(dados))
+    with open(caminho, "wb") as f:
+        f.write(cabecalho)
+        f.write(dados)
+        f.write(CABECALHO_TERRENO.pack(len(terreno), zlib.crc32(terreno)))
+        f.write(terreno)
+
+
+def _posicao_do_cabecalho(r, c, linhas, colunas, letra):
+    """(r, c) do cabeçalho como posição da grade; (-1, -1) indica que não há S/E."""
+    if (r, c) == (-1, -1):
+        return None
+    if not (0 <= r < linhas and 0 <= c < colunas):
+        raise ErroFormatoLabirinto(f"Posição {letra} ({r}, {c}) fora da grade {linhas}x{colunas}.")
+    return r, c
+
+
+def carregar_binario(caminho):
+    """
+    Carrega um arquivo .lab mapeando-o em memória (mmap): os dados são lidos por
+    uma memoryview do mapa, sem cópia intermediária; no formato bruto a única
+    cópia é a do mapa para as células da grade.
+    """
+    with open(caminho, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if len(mm) < CABECALHO.size:
+            raise ErroFormatoLabirinto("Arquivo menor que o cabeçalho.")
+        (magico, versao, codigo, linhas, colunas,
+         sr, sc, er, ec, tamanho, crc) = CABECALHO.unpack_from(mm, 0)
+        if magico != MAGICO:
+            raise ErroFormatoLabirinto("Assinatura inválida (não é um arquivo .lab).")
+        if versao not in VERSOES_SUPORTADAS:
+            raise ErroFormatoLabirinto(f"Versão {versao} não suportada.")
+        if codigo not in _NOMES_CODIFICACAO:
+            raise ErroFormatoLabirinto(f"Codificação {codigo} desconhecida.")
+        inicio = _posicao_do_cabecalho(sr, sc, linhas, colunas, "S")
+        fim = _posicao_do_cabecalho(er, ec, linhas, colunas, "E")
+        inicio_dados = CABECALHO.size
+        if len(mm) < inicio_dados + tamanho:
+            raise ErroFormatoLabirinto("Arquivo truncado.")
+
+        n = linhas * colunas
+        codificacao = _NOMES_CODIFICACAO[codigo]
+        # a visão precisa ser liberada antes de o mmap fechar
+        with memoryview(mm)[inicio_dados:inicio_dados + tamanho] as dados:
+            if zlib.crc32(dados) != crc:
+                raise ErroFormatoLabirinto("CRC inválido: dados corrompidos.")
+            if codificacao == "bruto":
+                celulas = bytearray(dados)
+            else:
+                bits = dados
+                if codificacao == "zlib":
+                    try:
+                        bits = zlib.decompress(dados)
+                    except zlib.error as e:
+                        raise ErroFormatoLabirinto(f"Células corrompidas: {e}") from None
+                if len(bits) * 8 < n:
+                    raise ErroFormatoLabirinto("Dados de células incompletos.")
+                celulas = desempacotar_bits(bits, n)
+        custos = _ler_terreno(mm, inicio_dados + tamanho, n) if versao >= 2 else None
+    if len(celulas) != n:
+        raise ErroFormatoLabirinto("Quantidade de células não confere com o cabeçalho.")
+    return GradeLabirinto(linhas, colunas, celulas, inicio, fim, custos)
+
+
+def _ler_terreno(mm, posicao, n):
+    """Bloco de terreno da versão 2 a partir de `posicao` no mapa (None se a grade não tem terreno)."""
+    if len(mm) < posicao + CABECALHO_TERRENO.size:
+        raise ErroFormatoLabirinto("Arquivo truncado (bloco de terreno).")
+    tamanho, crc = CABECALHO_TERRENO.unpack_from(mm, posicao)
+    posicao += CABECALHO_TERRENO.size
+    if len(mm) < posicao + tamanho:
+        raise ErroFormatoLabirinto("Arquivo truncado (bloco de terreno).")
+    if tamanho == 0:
+        return None
+    with memoryview(mm)[posicao:posicao + tamanho] as dados:
+        if zlib.crc32(dados) != crc:
+            raise ErroFormatoLabirinto("CRC inválido: terreno corrompido.")
+        try:
+            custos = bytearray(zlib.decompress(dados))
+        except zlib.error as e:
+            raise ErroFormatoLabirinto(f"Terreno corrompido: {e}") from None
+    if len(custos) != n:
+        raise ErroFormatoLabirinto("Quantidade de custos não confere com o cabeçalho.")
+    if 0 in custos:
+        raise ErroFormatoLabirinto("Custo 0 no terreno (os custos vão de 1 a 255).")
+    return custos
+
+
+# -------------------
+# FORMATO AUTOMÁTICO
+# -------------------
+def salvar(grade, caminho, codificacao="zlib"):
+    """Salva em texto se a extensão for .txt; caso contrário no formato binário."""
+    if str(caminho).lower().endswith(".txt"):
+        salvar_texto(grade, caminho)
+    else:
+        salvar_binario(grade, caminho, codificacao)
+
+
+def carregar(caminho):
+    """Detecta o formato pela assinatura do arquivo."""
+    with open(caminho, "rb") as f:
+        assinatura = f.read(len(MAGICO))
+    if assinatura == MAGICO:
+        return carregar_binario(caminho)
+    return carregar_texto(caminho)
@@ -0,0 +1,201 @@
+"""
+Árvore splay (autoajustável), top-down e sem recursão
+
+- Métodos com os nomes da BinarySearchTree (atividade_2): insert, search, delete,
+  height, depth e os mesmos nós (Node com valor/left/right); diferenças: a árvore
+  é um conjunto (insert ignora valores repetidos) e insert/delete devolvem bool
+- Cada acesso faz o splay top-down da chave: uma única descida que vai rotacionando
+  (zig-zig) e pendurando os nós visitados em duas árvores auxiliares (menores e
+  maiores), remontadas no fim com a chave acessada (ou a última visitada) na raiz
+- Chaves acessadas com frequência ficam perto da raiz; acessos em sequência custam
+  O(1) amortizado; o custo amortizado de qualquer sequência é O(log n) por acesso
+- Nada é recursivo (nem height/inorder): a árvore pode ficar temporariamente com
+  profundidade n, por exemplo depois de inserções em ordem
+- Custo registrado: nós visitados por acesso (acessos, nos_visitados, custo_amortizado)
+
+Uso:
+    arvore = ArvoreSplay()
+    for v in [50, 30, 70]:
+        arvore.insert(v)
+    arvore.search(30)          # True, e 30 vira a raiz
+    print(arvore.custo_amortizado)
+"""
+
+from atividade_2 import Node
+
+
+class ArvoreSplay:
+    """
+    Conjunto ordenado autoajustável (sem valores repetidos, ao contrário da
+    BinarySearchTree, que guarda cada repetição em um nó à direita).
+    insert devolve True se o valor era novo (False: repetido, nada inserido) e
+    delete devolve True se o valor estava na árvore; as outras árvores devolvem None.
+    """
+    def __init__(self):
+        self.root = None
+        self.acessos = 0
+        self.nos_visitados = 0
+
+    @property
+    def custo_amortizado(self):
+        """Média de nós visitados por acesso (insert, search e delete)."""
+        return self.nos_visitados / self.acessos if self.acessos else 0.0
+
+    def zerar_custo(self):
+        self.acessos = self.nos_visitados = 0
+
+    # -----------------------------
+    # SPLAY TOP-DOWN
+    # -----------------------------
+    def _splay(self, valor):
+        """Leva à raiz o nó de valor (ou o último nó visitado na busca por ele)."""
+        t = self.root
+        cabeca = Node(None)  # cabeca.right: árvore dos menores; cabeca.left: dos maiores
+        menores = maiores = cabeca
+        visitados = 1
+        while True:
+            if valor < t.valor:
+                if t.left is None:
+                    break
+                if valor < t.left.valor:
+                    # zig-zig: rotação à direita
+                    filho = t.left
+                    t.left = filho.right
+                    filho.right = t
+                    t = filho
+                    visitados += 1
+                    if t.left is None:
+                        break
+                # pendura t na árvore dos maiores
+                maiores.left = t
+                maiores = t
+                t = t.left
+            elif valor > t.valor:
+                if t.right is None:
+                    break
+                if valor > t.right.valor:
+                    # zag-zag: rotação à esquerda
+                    filho = t.right
+                    t.right = filho.left
+                    filho.left = t
+                    t = filho
+                    visitados += 1
+                    if t.right is None:
+                        break
+                # pendura t na árvore dos menores
+                menores.right = t
+                menores = t
+                t = t.right
+            else:
+                break
+            visitados += 1
+        # remonta: subárvores de t vão para as pontas das árvores auxiliares
+        menores.right = t.left
+        maiores.left = t.right
+        t.left = cabeca.right
+        t.right = cabeca.left
+        self.root = t
+        self.acessos += 1
+        self.nos_visitados += visitados
+        return t
+
+    # -----------------------------
+    # INSERIR / BUSCAR / REMOVER
+    # -----------------------------
+    def insert(self, valor):
+        """Insere valor na raiz; valores repetidos não são inseridos de novo (devolve False)."""
+        if self.root is None:
+            self.root = Node(valor)
+            self.acessos += 1
+            self.nos_visitados += 1
+            return True
+        raiz = self._splay(valor)
+        if raiz.valor == valor:
+            return False
+        novo = Node(valor)
+        if valor < raiz.valor:
+            novo.left, novo.right = raiz.left, raiz
+            raiz.left = None
+        else:
+            novo.left, novo.right = raiz, raiz.right
+            raiz.right = None
+        self.root = novo
+        return True
+
+    def search(self, valor):
+        if self.root is None:
+            return False
+        return self._splay(valor).valor == valor
+
+    def delete(self, valor):
+        """Remove valor (devolve False se ele não estava na árvore)."""
+        if self.root is None or self._splay(valor).valor != valor:
+            return False
+        raiz = self.root
+        if raiz.left is None:
+            self.root = raiz.right
+        else:
+            # o maior da subárvore esquerda sobe (splay de valor, maior que todos ali)
+            # e fica sem filho direito, onde entra a subárvore direita
+            direita = raiz.right
+            self.root = raiz.left
+            self._splay(valor)
+            self.root.right = direita
+        return True
+
+    # -----------------------------
+    # ALTURA, PROFUNDIDADE E PERCURSO (sem splay, sem recursão)
+    # -----------------------------
+    def height(self):
+        if self.root is None:
+            return -1  # altura da árvore vazia é -1, como na BinarySearchTree
+        altura = -1
+        nivel = [self.root]
+        while nivel:
+            altura += 1
+            nivel = [filho for no in nivel for filho in (no.left, no.right) if filho is not None]
+        return altura
+
+    def depth(self, valor):
+        no, nivel = self.root, 0
+        while no is not None:
+            if valor == no.valor:
+                return nivel
+            no = no.left if valor < no.valor else no.right
+            nivel += 1
+        return None
+
+    def inorder(self):
+        lista, pilha, no = [], [], self.root
+        while pilha or no is not None:
+            if no is not None:
+                pilha.append(no)
+                no = no.left
+            else:
+                no = pilha.pop()
+                lista.append(no.valor)
+                no = no.right
+        return lista
+
+
+# -----------------------------
+# DEMONSTRAÇÃO
+# -----------------------------
+if __name__ == "__main__":
+    import random
+
+    arvore = ArvoreSplay()
+    for v in range(1, 1001):
+        arvore.insert(v)
+    print(f"1000 inserções em ordem: altura {arvore.height()}, custo amortizado {arvore.custo_amortizado:.2f}")
+
+    arvore.zerar_custo()
+    arvore.search(1)
+    print(f"Busca do 1 (no fundo da árvore): {arvore.nos_visitados} nós visitados, altura agora {arvore.height()}")
+
+    quentes = random.sample(range(1, 1001), 10)
+    arvore.zerar_custo()
+    for _ in range(10000):
+        arvore.search(random.choice(quentes) if random.random() < 0.9 else random.randint(1, 1000))
+    print(f"10000 buscas (90% em 10 chaves): custo amortizado {arvore.custo_amortizado:.2f} nós por acesso")
+    print(f"Profundidade das chaves quentes: {sorted(arvore.depth(v) for v in quentes)}")
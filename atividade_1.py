@@ -1,5 +1,7 @@
-from graphviz import Digraph
+import math
+import operator
 import random
+import time
 
 # -----------------------------
 # CLASSE DO NÓ DA ÁRVORE
@@ -9,6 +11,10 @@ class Node:
         self.value = value
         self.left = left
         self.right = right
+        # usados só pela avaliação incremental (AvaliadorIncremental)
+        self.parent = None
+        self.cached = None
+        self.depth = 0
 
 
 # -----------------------------
@@ -33,11 +39,132 @@ def build_tree(tokens):
         return Node(token)
 
 
+# -----------------------------
+# AVALIAÇÃO DA EXPRESSÃO
+# -----------------------------
+OPERADORES = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv}
+
+
+def numero(token):
+    """Valor numérico de uma folha (aceita o texto do parser ou um número)."""
+    if isinstance(token, str):
+        return float(token) if any(ch in token for ch in ".eE") else int(token)
+    return token
+
+
+def aplicar(op, a, b):
+    # divisão por zero vira nan (em vez de exceção) para uma atualização nunca parar no meio
+    if op == "/" and b == 0:
+        return math.nan
+    return OPERADORES[op](a, b)
+
+
+def evaluate(node):
+    """Avaliação completa (pós-ordem iterativa): O(n) a cada chamada."""
+    valores = {}
+    pilha = [(node, False)]
+    while pilha:
+        atual, visitado = pilha.pop()
+        if atual.left is None and atual.right is None:
+            valores[id(atual)] = numero(atual.value)
+        elif visitado:
+            valores[id(atual)] = aplicar(atual.value, valores.pop(id(atual.left)), valores.pop(id(atual.right)))
+        else:
+            pilha.append((atual, True))
+            pilha.append((atual.right, False))
+            pilha.append((atual.left, False))
+    return valores[id(node)]
+
+
+class AvaliadorIncremental:
+    """
+    Avaliação com cache: cada nó guarda o próprio valor (cached) e o pai (parent).
+    Mudar uma folha recalcula só o caminho dela até a raiz (O(profundidade)) e
+    para antes se um nó interno não mudou de valor.
+    Várias folhas mudadas de uma vez (atualizar_folhas) são propagadas em uma só
+    passada, da maior profundidade para a raiz: cada ancestral comum é recalculado uma vez.
+    """
+    def __init__(self, raiz):
+        self.raiz = raiz
+        self.recalculos = 0  # nós internos recalculados desde a criação
+        self._preparar()
+
+    @property
+    def valor(self):
+        return self.raiz.cached
+
+    def _preparar(self):
+        # pais e profundidades de cima para baixo; valores de baixo para cima
+        self.raiz.parent = None
+        self.raiz.depth = 0
+        ordem = [self.raiz]
+        for node in ordem:
+            for filho in (node.left, node.right):
+                if filho is not None:
+                    filho.parent = node
+                    filho.depth = node.depth + 1
+                    ordem.append(filho)
+        for node in reversed(ordem):
+            if node.left is None and node.right is None:
+                node.cached = numero(node.value)
+            else:
+                node.cached = aplicar(node.value, node.left.cached, node.right.cached)
+
+    def folhas(self):
+        """Folhas da esquerda para a direita."""
+        resultado, pilha = [], [self.raiz]
+        while pilha:
+            node = pilha.pop()
+            if node.left is None and node.right is None:
+                resultado.append(node)
+            else:
+                pilha.append(node.right)
+                pilha.append(node.left)
+        return resultado
+
+    def _recalcular(self, node):
+        """Recalcula um nó interno; devolve True se o valor mudou."""
+        self.recalculos += 1
+        novo = aplicar(node.value, node.left.cached, node.right.cached)
+        mudou = not (novo == node.cached or (novo != novo and node.cached != node.cached))  # nan == nan
+        node.cached = novo
+        return mudou
+
+    def atualizar_folha(self, folha, valor):
+        """Troca o valor de uma folha e devolve o novo valor da raiz."""
+        folha.value = valor
+        folha.cached = numero(valor)
+        node = folha.parent
+        while node is not None and self._recalcular(node):
+            node = node.parent
+        return self.raiz.cached
+
+    def atualizar_folhas(self, mudancas):
+        """mudancas: pares (folha, valor) ou dict folha -> valor. Devolve o novo valor da raiz."""
+        if isinstance(mudancas, dict):
+            mudancas = mudancas.items()
+        # nós a recalcular agrupados por profundidade; cada nível só depende dos de baixo
+        por_nivel = {}
+        for folha, valor in mudancas:
+            folha.value = valor
+            folha.cached = numero(valor)
+            if folha.parent is not None:
+                por_nivel.setdefault(folha.parent.depth, {})[id(folha.parent)] = folha.parent
+        while por_nivel:
+            nivel = max(por_nivel)
+            for node in por_nivel.pop(nivel).values():
+                if self._recalcular(node) and node.parent is not None:
+                    por_nivel.setdefault(nivel - 1, {})[id(node.parent)] = node.parent
+        return self.raiz.cached
+
+
 # -----------------------------
 # FUNÇÃO PARA DESENHAR A ÁRVORE COM GRAPHVIZ
 # -----------------------------
 def draw_tree(node, graph=None, parent=None):
     if graph is None:
+        # Graphviz só é carregado quando alguma árvore é desenhada
+        from graphviz import Digraph
         graph = Digraph()
         graph.attr("node", shape="circle", fontsize="14")
 
@@ -71,21 +198,53 @@ def gerar_expressao_randomica():
 
 
 # -----------------------------
-# PARTE 1 – ÁRVORE FIXA
+# GERAR ÁRVORE BALANCEADA (PARA MEDIR A AVALIAÇÃO)
 # -----------------------------
-expr_fixa = "( ( 7 + 3 ) * ( 5 - 2 ) )"
-arvore_fixa = parse_expression(expr_fixa)
-graph_fixa = draw_tree(arvore_fixa)
-graph_fixa.render("arvore_fixa", format="png", cleanup=True)
+def gerar_arvore_balanceada(folhas):
+    """Árvore completa com `folhas` folhas (potência de 2) e operadores + e -."""
+    nivel = [Node(str(random.randint(1, 9))) for _ in range(folhas)]
+    while len(nivel) > 1:
+        nivel = [Node(random.choice("+-"), nivel[i], nivel[i + 1]) for i in range(0, len(nivel), 2)]
+    return nivel[0]
 
 
 # -----------------------------
-# PARTE 2 – ÁRVORE RANDÔMICA
+# DEMONSTRAÇÃO
 # -----------------------------
-expr_random = gerar_expressao_randomica()
-arvore_random = parse_expression(expr_random)
-graph_random = draw_tree(arvore_random)
-graph_random.render("arvore_random", format="png", cleanup=True)
-
-print("Árvore fixa e árvore randômica geradas com sucesso!")
-print(f"Expressão randômica utilizada: {expr_random}")
+if __name__ == "__main__":
+    # PARTE 1 – ÁRVORE FIXA
+    expr_fixa = "( ( 7 + 3 ) * ( 5 - 2 ) )"
+    arvore_fixa = parse_expression(expr_fixa)
+    graph_fixa = draw_tree(arvore_fixa)
+    graph_fixa.render("arvore_fixa", format="png", cleanup=True)
+
+    # PARTE 2 – ÁRVORE RANDÔMICA
+    expr_random = gerar_expressao_randomica()
+    arvore_random = parse_expression(expr_random)
+    graph_random = draw_tree(arvore_random)
+    graph_random.render("arvore_random", format="png", cleanup=True)
+
+    print("Árvore fixa e árvore randômica geradas com sucesso!")
+    print(f"Expressão randômica utilizada: {expr_random}")
+
+    # PARTE 3 – AVALIAÇÃO INCREMENTAL
+    avaliador = AvaliadorIncremental(arvore_fixa)
+    folhas_fixa = avaliador.folhas()
+    print(f"{expr_fixa} = {avaliador.valor}")
+    print(f"7 -> 10: {avaliador.atualizar_folha(folhas_fixa[0], 10)}")
+    print(f"3 -> 0 e 2 -> 4 (em lote): {avaliador.atualizar_folhas([(folhas_fixa[1], 0), (folhas_fixa[3], 4)])}")
+
+    arvore_grande = gerar_arvore_balanceada(1 << 16)
+    avaliador = AvaliadorIncremental(arvore_grande)
+    folhas_grande = avaliador.folhas()
+    t0 = time.perf_counter()
+    for _ in range(10000):
+        avaliador.atualizar_folha(random.choice(folhas_grande), random.randint(1, 9))
+    t_incremental = (time.perf_counter() - t0) / 10000
+    t0 = time.perf_counter()
+    for _ in range(10):
+        valor_completo = evaluate(arvore_grande)
+    t_completa = (time.perf_counter() - t0) / 10
+    assert avaliador.valor == valor_completo
+    print(f"Árvore com {len(folhas_grande)} folhas: reavaliação completa {t_completa * 1000:.1f} ms, "
+          f"atualização incremental {t_incremental * 1e6:.1f} µs")
@@ -1,4 +1,3 @@
-from graphviz import Digraph
 import random
 
 # -----------------------------------------------------------
@@ -125,6 +124,8 @@ class BinarySearchTree:
     # DESENHAR ÁRVORE COM GRAPHVIZ
     # -----------------------------
     def visualize(self, filename):
+        # Graphviz só é carregado quando a árvore é desenhada
+        from graphviz import Digraph
         graph = Digraph()
         graph.attr("node", shape="circle", fontsize="14")
 
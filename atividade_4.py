@@ -1,4 +1,3 @@
-from graphviz import Digraph
 import random
 
 # -----------------------------------------------------------
@@ -57,6 +56,59 @@ class AVLTree:
 
         return root
 
+    # -----------------------------------------------------------
+    # REMOÇÃO
+    # -----------------------------------------------------------
+    def delete(self, root, key):
+        """
+        Remoção padrão de BST + rebalanceamento AVL (chave ausente: nada muda)
+        """
+        # 1 — Remoção normal de BST
+        if not root:
+            return root
+        elif key < root.valor:
+            root.left = self.delete(root.left, key)
+        elif key > root.valor:
+            root.right = self.delete(root.right, key)
+        else:
+            if not root.left:
+                return root.right
+            if not root.right:
+                return root.left
+            # Dois filhos: copia o sucessor e o remove da subárvore direita
+            sucessor = self.get_min_value_node(root.right)
+            root.valor = sucessor.valor
+            root.right = self.delete(root.right, sucessor.valor)
+
+        # 2 — Atualizar altura
+        root.height = 1 + max(self.get_height(root.left),
+                              self.get_height(root.right))
+
+        # 3 — Casos de desbalanceamento: ao contrário da inserção (que compara as chaves),
+        # a deleção escolhe o caso pelo fator de balanceamento do filho
+        balance = self.get_balance(root)
+
+        if balance > 1 and self.get_balance(root.left) >= 0:
+            return self.rotate_right(root)
+
+        if balance > 1 and self.get_balance(root.left) < 0:
+            root.left = self.rotate_left(root.left)
+            return self.rotate_right(root)
+
+        if balance < -1 and self.get_balance(root.right) <= 0:
+            return self.rotate_left(root)
+
+        if balance < -1 and self.get_balance(root.right) > 0:
+            root.right = self.rotate_right(root.right)
+            return self.rotate_left(root)
+
+        return root
+
+    def get_min_value_node(self, node):
+        while node.left:
+            node = node.left
+        return node
+
     # -----------------------------------------------------------
     # ALTURA E FATOR DE BALANCEAMENTO
     # -----------------------------------------------------------
@@ -106,6 +158,8 @@ class AVLTree:
     # VISUALIZAÇÃO COM GRAPHVIZ
     # -----------------------------------------------------------
     def visualize(self, root, filename):
+        # Graphviz só é carregado quando a árvore é desenhada
+        from graphviz import Digraph
         graph = Digraph()
         graph.attr("node", shape="circle", fontsize="14")
 
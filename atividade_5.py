@@ -4,19 +4,28 @@ class No:
     """
     Representa um nó na Árvore AVL.
     Cada nó armazena uma chave, referências para os filhos e sua altura.
+    Em árvores encadeadas, também o antecessor e o sucessor em ordem.
     """
     def __init__(self, chave):
         self.chave = chave
         self.esquerda = None
         self.direita = None
         self.altura = 1  # A altura de um novo nó (folha) é sempre 1
+        self.anterior = None  # antecessor em ordem (só em árvores encadeadas)
+        self.proximo = None   # sucessor em ordem (só em árvores encadeadas)
 
 class ArvoreAVL:
     """
     Implementa a estrutura e as operações de uma Árvore AVL.
+    Com encadeada=True cada nó aponta para o antecessor e o sucessor em ordem e a
+    árvore guarda o menor e o maior nó: percursos, cursores e pop_min/pop_max não
+    precisam descer a árvore a cada passo.
     """
-    def __init__(self):
+    def __init__(self, encadeada=False):
         self.raiz = None
+        self.encadeada = encadeada
+        self.no_minimo = None  # só mantidos em árvores encadeadas
+        self.no_maximo = None
 
     # ===============================================================
     # TAREFA 0: IMPLEMENTAR MÉTODOS AUXILIARES E ROTAÇÕES
@@ -96,15 +105,20 @@ class ArvoreAVL:
         """Método público para inserir uma chave na árvore."""
         self.raiz = self._inserir_recursivo(self.raiz, chave)
 
-    def _inserir_recursivo(self, no_atual, chave):
+    def _inserir_recursivo(self, no_atual, chave, anterior=None, proximo=None):
+        # anterior/proximo: último ancestral em que a descida foi para a direita/esquerda,
+        # ou seja, os vizinhos em ordem do novo nó
         # Passo 1: Realiza a inserção padrão de uma BST.
         if no_atual is None:
-            return No(chave)
+            novo = No(chave)
+            if self.encadeada:
+                self._encadear(novo, anterior, proximo)
+            return novo
 
         if chave < no_atual.chave:
-            no_atual.esquerda = self._inserir_recursivo(no_atual.esquerda, chave)
+            no_atual.esquerda = self._inserir_recursivo(no_atual.esquerda, chave, anterior, no_atual)
         elif chave > no_atual.chave:
-            no_atual.direita = self._inserir_recursivo(no_atual.direita, chave)
+            no_atual.direita = self._inserir_recursivo(no_atual.direita, chave, no_atual, proximo)
         else:
             # Chaves duplicadas não são permitidas
             raise ValueError(f"Chave {chave} já existe na árvore.")
@@ -156,24 +170,39 @@ class ArvoreAVL:
             # Caso 1: Nó com um filho ou nenhum filho.
             if no_atual.esquerda is None:
                 temp = no_atual.direita
+                self._desencadear(no_atual)
                 no_atual = None
                 return temp
             elif no_atual.direita is None:
                 temp = no_atual.esquerda
+                self._desencadear(no_atual)
                 no_atual = None
                 return temp
 
             # Caso 2: Nó com dois filhos: obter o sucessor (menor na subárvore direita)
-            temp = self.obter_no_valor_minimo(no_atual.direita)
-            # Copiar o valor do sucessor para este nó
-            no_atual.chave = temp.chave
-            # Deletar o sucessor
-            no_atual.direita = self._deletar_recursivo(no_atual.direita, temp.chave)
+            sucessor = self.obter_no_valor_minimo(no_atual.direita)
+            # O nó do sucessor sai da subárvore direita e ocupa o lugar deste nó
+            # (sem copiar a chave: cada chave continua no seu nó, então cursores
+            # em outras chaves seguem válidos; só este nó sai do encadeamento)
+            sucessor.direita = self._destacar_minimo(no_atual.direita)
+            sucessor.esquerda = no_atual.esquerda
+            self._desencadear(no_atual)
+            no_atual = sucessor
 
         # Se a árvore tinha apenas um nó, retornamos
         if no_atual is None:
             return no_atual
 
+        return self._rebalancear_apos_delecao(no_atual)
+
+    def _destacar_minimo(self, no_atual):
+        """Tira o menor nó da subárvore (sem mexer no encadeamento) e devolve a nova raiz dela."""
+        if no_atual.esquerda is None:
+            return no_atual.direita
+        no_atual.esquerda = self._destacar_minimo(no_atual.esquerda)
+        return self._rebalancear_apos_delecao(no_atual)
+
+    def _rebalancear_apos_delecao(self, no_atual):
         # ---- LÓGICA DE BALANCEAMENTO AVL APÓS DELEÇÃO ----
         # Passo 2: Atualiza a altura do nó atual.
         self._atualizar_altura(no_atual)
@@ -212,6 +241,13 @@ class ArvoreAVL:
         """
         Encontra e retorna uma lista com todas as chaves no intervalo [chave1, chave2].
         """
+        if self.encadeada:
+            resultado = []
+            for no in self._nos_a_partir(self._primeiro_no_maior_igual(chave1)):
+                if no.chave > chave2:
+                    break
+                resultado.append(no.chave)
+            return resultado
         resultado = []
         def inorder_intervalo(no):
             if no is None:
@@ -247,6 +283,8 @@ class ArvoreAVL:
 
     # --- Método auxiliar para percorrer em-ordem (útil para debugging/testes) ---
     def percurso_em_ordem(self):
+        if self.encadeada:
+            return [no.chave for no in self._nos_a_partir(self.no_minimo)]
         res = []
         def inorder(no):
             if no is None:
@@ -257,6 +295,146 @@ class ArvoreAVL:
         inorder(self.raiz)
         return res
 
+    # ===============================================================
+    # EXTRA: ENCADEAMENTO EM ORDEM (ANTECESSOR/SUCESSOR), MÍNIMO E MÁXIMO
+    # ===============================================================
+    # Rotações não mudam a ordem das chaves, então não mexem no encadeamento:
+    # só a criação de um nó (inserção) e a retirada física de um nó (deleção) mexem.
+
+    def _encadear(self, novo, anterior, proximo):
+        novo.anterior, novo.proximo = anterior, proximo
+        if anterior is None:
+            self.no_minimo = novo
+        else:
+            anterior.proximo = novo
+        if proximo is None:
+            self.no_maximo = novo
+        else:
+            proximo.anterior = novo
+
+    def _desencadear(self, no):
+        if not self.encadeada:
+            return
+        if no.anterior is None:
+            self.no_minimo = no.proximo
+        else:
+            no.anterior.proximo = no.proximo
+        if no.proximo is None:
+            self.no_maximo = no.anterior
+        else:
+            no.proximo.anterior = no.anterior
+        no.anterior = no.proximo = None
+
+    def _nos_a_partir(self, no):
+        while no is not None:
+            yield no
+            no = no.proximo
+
+    def _primeiro_no_maior_igual(self, chave):
+        """Nó com a menor chave >= chave (None se não houver)."""
+        candidato = None
+        atual = self.raiz
+        while atual is not None:
+            if chave <= atual.chave:
+                candidato = atual
+                atual = atual.esquerda
+            else:
+                atual = atual.direita
+        return candidato
+
+    def minimo(self):
+        """Menor chave (O(1) em árvores encadeadas)."""
+        no = self.no_minimo if self.encadeada else self.obter_no_valor_minimo(self.raiz)
+        if no is None:
+            raise ValueError("Árvore vazia.")
+        return no.chave
+
+    def maximo(self):
+        """Maior chave (O(1) em árvores encadeadas)."""
+        no = self.no_maximo if self.encadeada else self.raiz
+        if not self.encadeada:
+            while no is not None and no.direita is not None:
+                no = no.direita
+        if no is None:
+            raise ValueError("Árvore vazia.")
+        return no.chave
+
+    def pop_min(self):
+        """Remove e retorna a menor chave, descendo só pela esquerda (sem comparar chaves)."""
+        if self.raiz is None:
+            raise ValueError("Árvore vazia.")
+        chave = self.minimo()
+        self.raiz = self._remover_minimo(self.raiz)
+        return chave
+
+    def pop_max(self):
+        """Remove e retorna a maior chave, descendo só pela direita (sem comparar chaves)."""
+        if self.raiz is None:
+            raise ValueError("Árvore vazia.")
+        chave = self.maximo()
+        self.raiz = self._remover_maximo(self.raiz)
+        return chave
+
+    def _remover_minimo(self, no_atual):
+        if no_atual.esquerda is None:
+            # o menor nó tem no máximo um filho, à direita
+            self._desencadear(no_atual)
+            return no_atual.direita
+        no_atual.esquerda = self._remover_minimo(no_atual.esquerda)
+        return self._rebalancear_apos_delecao(no_atual)
+
+    def _remover_maximo(self, no_atual):
+        if no_atual.direita is None:
+            self._desencadear(no_atual)
+            return no_atual.esquerda
+        no_atual.direita = self._remover_maximo(no_atual.direita)
+        return self._rebalancear_apos_delecao(no_atual)
+
+    def cursor(self, chave=None):
+        """Cursor na menor chave >= chave (ou na menor chave da árvore)."""
+        if not self.encadeada:
+            raise ValueError("Cursores exigem uma árvore encadeada (ArvoreAVL(encadeada=True)).")
+        return Cursor(self.no_minimo if chave is None else self._primeiro_no_maior_igual(chave))
+
+
+class Cursor:
+    """
+    Posição em uma ArvoreAVL encadeada; avancar()/recuar() custam O(1).
+    A deleção nunca move chaves entre nós, então deletar outras chaves (inclusive
+    o antecessor ou o sucessor) não afeta o cursor. Deletar a chave em que o cursor
+    está o invalida: o nó sai do encadeamento e avancar()/recuar() terminam.
+    """
+    def __init__(self, no):
+        self.no = no
+
+    @property
+    def valido(self):
+        return self.no is not None
+
+    @property
+    def chave(self):
+        if self.no is None:
+            raise ValueError("Cursor fora da árvore.")
+        return self.no.chave
+
+    def avancar(self):
+        self.no = self.no.proximo
+        return self.valido
+
+    def recuar(self):
+        self.no = self.no.anterior
+        return self.valido
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.no is None:
+            raise StopIteration
+        chave = self.no.chave
+        self.no = self.no.proximo
+        return chave
+
 # --- Bloco de Teste e Demonstração da Atividade AVL ---
 if __name__ == "__main__":
     arvore_avl = ArvoreAVL()
@@ -305,3 +483,16 @@ if __name__ == "__main__":
             print("Método `obter_profundidade_no` ainda não implementado.")
     except Exception as e:
         print(f"\nERRO DURANTE O CÁLCULO DE PROFUNDIDADE: {e}")
+
+    print("\n--- 5. Árvore encadeada: cursor e fila de prioridade ---")
+    try:
+        arvore_encadeada = ArvoreAVL(encadeada=True)
+        for chave in chaves_para_inserir:
+            arvore_encadeada.inserir(chave)
+        cursor = arvore_encadeada.cursor(5)
+        print(f"Chaves a partir de 5 (cursor): {list(cursor)}")
+        print(f"Mínimo {arvore_encadeada.minimo()}, máximo {arvore_encadeada.maximo()}")
+        menores = [arvore_encadeada.pop_min() for _ in range(3)]
+        print(f"pop_min três vezes: {menores}; restam {arvore_encadeada.percurso_em_ordem()}")
+    except Exception as e:
+        print(f"\nERRO NA ÁRVORE ENCADEADA: {e}")
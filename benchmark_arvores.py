@@ -0,0 +1,396 @@
+"""
+Benchmark da coleção ordenada (colecao_ordenada.py): adaptativa contra cada backend fixo
+
+Uso:
+    python benchmark_arvores.py [tamanhos separados por vírgula] [operacoes] [chaves_blocos] [chaves_mapa]
+                                [chaves_encadeada] [chaves_splay]
+
+- Cada carga é uma sequência fixa de operações (mesma para todos os backends) sobre
+  uma coleção pré-carregada com `tamanho` chaves aleatórias (construir(), O(n)):
+    leitura     95% buscas, 5% inserções/remoções
+    escrita     50% inserções de chaves novas, 50% remoções de chaves existentes
+    intervalos  90% consultas de intervalo (~100 chaves), 10% escritas
+    fases       metade só escritas, depois metade só buscas (a adaptativa migra e volta)
+- Cada par (carga, backend) roda em um processo novo: no CPython, liberar uma árvore
+  de centenas de milhares de nós deixa a memória fragmentada e deixa mais lento o
+  que for medido depois, então a ordem dos backends mudaria o resultado
+- Mostra µs por operação de cada backend e as migrações da coleção adaptativa
+- ListaBlocos contra ArvoreAVL com 10^6 chaves: inserção, busca, intervalos, remoção
+  e memória por chave (tracemalloc, com um décimo das chaves, sem contar os objetos
+  das próprias chaves)
+- Vazão do MapaFragmentado com 1, 2, 4 e 8 threads (operações pontuais e inserção
+  em lote), contra o mesmo mapa com um só fragmento (uma trava global); só escala
+  em CPython sem GIL (3.13t+) e com núcleos livres
+- Verifica que deletar chaves não afeta cursores da ArvoreAVL encadeada em outras chaves
+- ArvoreAVL encadeada (antecessor/sucessor em cada nó) contra a comum: custo extra
+  na inserção, percurso e intervalos pelo encadeamento, passos de cursor contra
+  uma descida por sucessor, e pop_min como fila de prioridade
+- ArvoreSplay contra as AVL em acessos Zipf (poucas chaves quentes), sequenciais e
+  uniformes: µs por busca e nós visitados por busca
+"""
+
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+from atividade_5 import ArvoreAVL
+from colecao_ordenada import BACKENDS, ColecaoAdaptativa, ColecaoArvoreAVL, ColecaoAVLTree, ColecaoSplay
+from lista_blocos import ListaBlocos
+from mapa_fragmentado import MapaFragmentado
+
+INSERIR, REMOVER, CONTEM, INTERVALO = range(4)
+CARGAS = ("leitura", "escrita", "intervalos", "fases")
+TIPOS = {**BACKENDS, "adaptativa": ColecaoAdaptativa}
+
+
+# -------------------
+# CARGAS DE TRABALHO
+# -------------------
+def gerar_carga(tipo, tamanho, operacoes, semente=42):
+    """Devolve (chaves iniciais ordenadas, lista de (operação, chave))."""
+    rnd = random.Random(semente)
+    universo = 10 * tamanho
+    presentes = rnd.sample(range(universo), tamanho)
+    chaves_iniciais = sorted(presentes)
+    conjunto = set(presentes)
+    largura = 100 * universo // tamanho  # intervalos com ~100 chaves
+
+    def escrita():
+        if rnd.random() < 0.5 or not presentes:
+            chave = rnd.randrange(universo)
+            while chave in conjunto:
+                chave = rnd.randrange(universo)
+            presentes.append(chave)
+            conjunto.add(chave)
+            return INSERIR, chave
+        # remove uma chave existente (troca com a última para remover em O(1))
+        i = rnd.randrange(len(presentes))
+        presentes[i], presentes[-1] = presentes[-1], presentes[i]
+        chave = presentes.pop()
+        conjunto.discard(chave)
+        return REMOVER, chave
+
+    sequencia = []
+    for passo in range(operacoes):
+        if tipo == "leitura":
+            sequencia.append(escrita() if rnd.random() < 0.05 else (CONTEM, rnd.randrange(universo)))
+        elif tipo == "escrita":
+            sequencia.append(escrita())
+        elif tipo == "intervalos":
+            sequencia.append(escrita() if rnd.random() < 0.1 else (INTERVALO, rnd.randrange(universo)))
+        elif tipo == "fases":
+            sequencia.append(escrita() if passo < operacoes // 2 else (CONTEM, rnd.randrange(universo)))
+        else:
+            raise ValueError(f"Carga desconhecida: {tipo!r}. Opções: {', '.join(CARGAS)}.")
+    return chaves_iniciais, sequencia, largura
+
+
+def executar(colecao, sequencia, largura):
+    inserir, remover, contem, intervalo = colecao.inserir, colecao.remover, colecao.contem, colecao.intervalo
+    encontrados = 0
+    t0 = time.perf_counter()
+    for operacao, chave in sequencia:
+        if operacao == CONTEM:
+            encontrados += contem(chave)
+        elif operacao == INSERIR:
+            inserir(chave)
+        elif operacao == REMOVER:
+            remover(chave)
+        else:
+            encontrados += len(intervalo(chave, chave + largura))
+    return time.perf_counter() - t0, encontrados
+
+
+# -------------------
+# EXECUÇÃO
+# -------------------
+def medir(tarefa):
+    """Executado no processo filho: gera a carga (determinística) e mede um backend."""
+    carga, tipo, tamanho, operacoes = tarefa
+    chaves, sequencia, largura = gerar_carga(carga, tamanho, operacoes)
+    colecao = TIPOS[tipo].construir(chaves)
+    del chaves
+    tempo, encontrados = executar(colecao, sequencia, largura)
+    return tempo, encontrados, getattr(colecao, "migracoes", 0)
+
+
+def comparar_backends(tamanho, operacoes):
+    print(f"\n=== {tamanho} chaves, {operacoes} operações (µs por operação) ===")
+    print(f"{'carga':<12}" + "".join(f"{TIPOS[tipo].nome:>14}" for tipo in TIPOS) + "   migrações")
+    contexto = multiprocessing.get_context("spawn")
+    with contexto.Pool(1, maxtasksperchild=1) as pool:
+        for carga in CARGAS:
+            medidas = pool.map(medir, [(carga, tipo, tamanho, operacoes) for tipo in TIPOS], chunksize=1)
+            assert len({encontrados for _, encontrados, _ in medidas}) == 1, "backends deram resultados diferentes"
+            linha = "".join(f"{tempo * 1e6 / operacoes:>14.2f}" for tempo, _, _ in medidas)
+            print(f"{carga:<12}{linha}   {medidas[-1][2]:>9}")
+
+
+def _medir_estrutura(tarefa):
+    """Executado no processo filho: uma estrutura (ListaBlocos ou ArvoreAVL) com n chaves."""
+    nome, n, consultas, semente = tarefa
+    rnd = random.Random(semente)
+    chaves = rnd.sample(range(10 * n), n)
+    buscas = [rnd.randrange(10 * n) for _ in range(consultas)]
+    inicios = buscas[:consultas // 100]
+    estrutura = ListaBlocos() if nome == "ListaBlocos" else ArvoreAVL()
+    if nome == "ListaBlocos":
+        contem = estrutura.__contains__
+    else:
+        def contem(chave):
+            return estrutura.obter_profundidade_no(chave) >= 0
+
+    tempos = {}
+    t0 = time.perf_counter()
+    for chave in chaves:
+        estrutura.inserir(chave)
+    tempos["inserção"] = (time.perf_counter() - t0) / n
+    t0 = time.perf_counter()
+    encontrados = sum(1 for chave in buscas if contem(chave))
+    tempos["busca"] = (time.perf_counter() - t0) / consultas
+    t0 = time.perf_counter()
+    for inicio in inicios:
+        encontrados += len(estrutura.encontrar_nos_intervalo(inicio, inicio + 1000))  # ~100 chaves
+    tempos["intervalo"] = (time.perf_counter() - t0) / len(inicios)
+    removidas = chaves[:consultas]
+    t0 = time.perf_counter()
+    for chave in removidas:
+        estrutura.deletar(chave)
+    tempos["remoção"] = (time.perf_counter() - t0) / len(removidas)
+
+    # memória em uma rodada separada (tracemalloc deixa tudo mais lento)
+    del estrutura
+    tracemalloc.start()
+    estrutura = ListaBlocos() if nome == "ListaBlocos" else ArvoreAVL()
+    amostra = chaves[:n // 10]
+    for chave in amostra:
+        estrutura.inserir(chave)
+    memoria = tracemalloc.get_traced_memory()[0] / len(amostra)
+    tracemalloc.stop()
+    return tempos, memoria, encontrados
+
+
+def comparar_blocos_avl(n, consultas=100_000, semente=7):
+    print(f"\n=== ListaBlocos x ArvoreAVL: {n} chaves (µs por operação) ===")
+    contexto = multiprocessing.get_context("spawn")
+    with contexto.Pool(1, maxtasksperchild=1) as pool:
+        medidas = pool.map(_medir_estrutura, [(nome, n, consultas, semente) for nome in ("ListaBlocos", "ArvoreAVL")],
+                           chunksize=1)
+    (blocos, memoria_blocos, total_blocos), (avl, memoria_avl, total_avl) = medidas
+    assert total_blocos == total_avl, "ListaBlocos e ArvoreAVL deram resultados diferentes"
+    print(f"{'operação':<12}{'ListaBlocos':>14}{'ArvoreAVL':>14}{'ganho':>10}")
+    for operacao in blocos:
+        print(f"{operacao:<12}{blocos[operacao] * 1e6:>14.2f}{avl[operacao] * 1e6:>14.2f}"
+              f"{avl[operacao] / blocos[operacao]:>9.1f}x")
+    print(f"{'bytes/chave':<12}{memoria_blocos:>14.0f}{memoria_avl:>14.0f}{memoria_avl / memoria_blocos:>9.1f}x")
+
+
+def _vazao(mapa, sequencias):
+    """Roda cada sequência de operações em uma thread; devolve operações por segundo."""
+    def trabalho(sequencia):
+        inserir, remover, contem = mapa.inserir, mapa.remover, mapa.contem
+        for operacao, chave in sequencia:
+            if operacao == CONTEM:
+                contem(chave)
+            elif operacao == INSERIR:
+                inserir(chave)
+            else:
+                remover(chave)
+
+    threads = [threading.Thread(target=trabalho, args=(sequencia,)) for sequencia in sequencias]
+    t0 = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(map(len, sequencias)) / (time.perf_counter() - t0)
+
+
+def medir_mapa_fragmentado(n, operacoes=200_000, fragmentos=16, threads=(1, 2, 4, 8), semente=11):
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"\n=== MapaFragmentado: {n} chaves, {fragmentos} fragmentos "
+          f"({'com' if gil else 'sem'} GIL, {os.cpu_count()} núcleo(s)) ===")
+    rnd = random.Random(semente)
+    chaves = rnd.sample(range(10 * n), n)
+    mapas = {
+        f"{fragmentos} fragmentos": MapaFragmentado.de_amostra(chaves[:1000], fragmentos),
+        "1 fragmento": MapaFragmentado(),
+    }
+    print(f"{'threads':<10}" + "".join(f"{nome + ' (op/s)':>26}" for nome in mapas))
+    for mapa in mapas.values():
+        mapa.inserir_lote(chaves)
+    for quantidade in threads:
+        # mesma carga total dividida entre as threads: 80% buscas, 10% inserções, 10% remoções
+        sequencias = []
+        for _ in range(quantidade):
+            sequencia = []
+            for _ in range(operacoes // quantidade):
+                sorteio = rnd.random()
+                operacao = CONTEM if sorteio < 0.8 else INSERIR if sorteio < 0.9 else REMOVER
+                sequencia.append((operacao, rnd.randrange(10 * n)))
+            sequencias.append(sequencia)
+        print(f"{quantidade:<10}" + "".join(f"{_vazao(mapa, sequencias):>26,.0f}" for mapa in mapas.values()))
+
+    print(f"{'threads':<10}{'inserir_lote (chaves/s)':>26}")
+    for quantidade in threads:
+        mapa = MapaFragmentado(mapas[f"{fragmentos} fragmentos"].fronteiras)
+        t0 = time.perf_counter()
+        mapa.inserir_lote(chaves, threads=quantidade)
+        print(f"{quantidade:<10}{n / (time.perf_counter() - t0):>26,.0f}")
+
+
+def _proxima_chave(arvore, chave):
+    """Sucessor de chave por uma descida a partir da raiz (sem encadeamento)."""
+    candidato, no = None, arvore.raiz
+    while no is not None:
+        if chave < no.chave:
+            candidato, no = no.chave, no.esquerda
+        else:
+            no = no.direita
+    return candidato
+
+
+def verificar_cursores(n=1000, semente=17):
+    """Deletar chaves (inclusive de nós com dois filhos) não afeta cursores em outras chaves."""
+    rnd = random.Random(semente)
+    arvore = ArvoreAVL(encadeada=True)
+    presentes = rnd.sample(range(10 * n), n)
+    for chave in presentes:
+        arvore.inserir(chave)
+    presentes.sort()
+    dois_filhos = 0
+    while len(presentes) > 2:
+        i = rnd.randrange(1, len(presentes) - 1)
+        antes, alvo, depois = presentes[i - 1:i + 2]
+        no = arvore.raiz
+        while no.chave != alvo:
+            no = no.esquerda if alvo < no.chave else no.direita
+        dois_filhos += no.esquerda is not None and no.direita is not None
+        no_antes, no_depois = arvore.cursor(antes), arvore.cursor(depois)
+        arvore.deletar(alvo)
+        del presentes[i]
+        assert no_antes.chave == antes and no_depois.chave == depois
+        assert no_antes.avancar() and no_antes.chave == depois
+        assert no_depois.recuar() and no_depois.chave == antes
+        assert list(arvore.cursor(depois)) == presentes[i:]
+    assert arvore.percurso_em_ordem() == presentes and dois_filhos > 0
+    print(f"Cursores válidos após {n - 2} deleções ({dois_filhos} de nós com dois filhos)")
+
+
+def medir_encadeamento(n, passos=100_000, semente=5):
+    print(f"\n=== ArvoreAVL encadeada x comum: {n} chaves (µs por operação) ===")
+    passos = min(passos, n // 2)  # cursor e retiradas não passam do número de chaves
+    rnd = random.Random(semente)
+    chaves = rnd.sample(range(10 * n), n)
+    arvores, tempos = {}, {}
+    for encadeada in (False, True):
+        arvore = ArvoreAVL(encadeada=encadeada)
+        t0 = time.perf_counter()
+        for chave in chaves:
+            arvore.inserir(chave)
+        tempos["inserção", encadeada] = (time.perf_counter() - t0) / n
+        t0 = time.perf_counter()
+        em_ordem = arvore.percurso_em_ordem()
+        tempos["percurso (por chave)", encadeada] = (time.perf_counter() - t0) / n
+        inicios = [rnd.randrange(10 * n) for _ in range(1000)]
+        t0 = time.perf_counter()
+        for inicio in inicios:
+            arvore.encontrar_nos_intervalo(inicio, inicio + 1000)  # ~100 chaves
+        tempos["intervalo", encadeada] = (time.perf_counter() - t0) / len(inicios)
+        arvores[encadeada] = arvore
+    assert arvores[False].percurso_em_ordem() == em_ordem
+
+    # próxima chave, `passos` vezes a partir do mínimo: descida por passo x cursor
+    comum, encadeada = arvores[False], arvores[True]
+    t0 = time.perf_counter()
+    chave = comum.minimo()
+    for _ in range(passos - 1):
+        chave = _proxima_chave(comum, chave)
+    tempos["próxima chave", False] = (time.perf_counter() - t0) / passos
+    t0 = time.perf_counter()
+    cursor = encadeada.cursor()
+    for _ in range(passos - 1):
+        cursor.avancar()
+    tempos["próxima chave", True] = (time.perf_counter() - t0) / passos
+    assert cursor.chave == chave
+
+    # fila de prioridade: retirar o mínimo `passos` vezes
+    t0 = time.perf_counter()
+    for _ in range(passos):
+        comum.deletar(comum.minimo())
+    tempos["retirar mínimo", False] = (time.perf_counter() - t0) / passos
+    t0 = time.perf_counter()
+    for _ in range(passos):
+        encadeada.pop_min()
+    tempos["retirar mínimo", True] = (time.perf_counter() - t0) / passos
+    assert comum.minimo() == encadeada.minimo()
+
+    print(f"{'operação':<22}{'comum':>10}{'encadeada':>12}")
+    for operacao in dict.fromkeys(operacao for operacao, _ in tempos):
+        print(f"{operacao:<22}{tempos[operacao, False] * 1e6:>10.2f}{tempos[operacao, True] * 1e6:>12.2f}")
+
+
+def gerar_acessos(tipo, chaves, acessos, semente=3):
+    """Sequência de chaves buscadas: 'zipf' (expoente 1.1 sobre uma ordem aleatória), 'sequencial' ou 'uniforme'."""
+    rnd = random.Random(semente)
+    if tipo == "sequencial":
+        return [chaves[i % len(chaves)] for i in range(acessos)]
+    if tipo == "uniforme":
+        return [rnd.choice(chaves) for _ in range(acessos)]
+    if tipo == "zipf":
+        populares = rnd.sample(chaves, len(chaves))  # posição = popularidade
+        pesos = [1 / posicao ** 1.1 for posicao in range(1, len(chaves) + 1)]
+        return rnd.choices(populares, weights=pesos, k=acessos)
+    raise ValueError(f"Acesso desconhecido: {tipo!r}.")
+
+
+def _medir_acessos(tarefa):
+    """Executado no processo filho: µs por busca e nós visitados por busca de uma estrutura."""
+    tipo, estrutura, n, acessos = tarefa
+    chaves = list(range(0, 2 * n, 2))
+    sequencia = gerar_acessos(tipo, chaves, acessos)
+    colecao = {"splay": ColecaoSplay, "AVLTree": ColecaoAVLTree, "ArvoreAVL": ColecaoArvoreAVL}[estrutura].construir(chaves)
+    if estrutura == "ArvoreAVL":
+        # a própria busca por profundidade dá os nós visitados (profundidade + 1)
+        profundidade = colecao.arvore.obter_profundidade_no
+        t0 = time.perf_counter()
+        visitados = sum(profundidade(chave) + 1 for chave in sequencia)
+        tempo = time.perf_counter() - t0
+        return tempo / acessos, visitados / acessos
+    contem = colecao.contem
+    t0 = time.perf_counter()
+    for chave in sequencia:
+        contem(chave)
+    tempo = time.perf_counter() - t0
+    visitados = colecao.arvore.custo_amortizado if estrutura == "splay" else float("nan")
+    return tempo / acessos, visitados
+
+
+def medir_splay(n, acessos=200_000):
+    print(f"\n=== ArvoreSplay x AVL: {n} chaves, {acessos} buscas ===")
+    estruturas = ("splay", "AVLTree", "ArvoreAVL")
+    print(f"{'acessos':<12}" + "".join(f"{nome + ' (µs)':>16}" for nome in estruturas)
+          + f"{'nós splay':>12}{'nós AVL':>10}")
+    contexto = multiprocessing.get_context("spawn")
+    with contexto.Pool(1, maxtasksperchild=1) as pool:
+        for tipo in ("zipf", "sequencial", "uniforme"):
+            medidas = pool.map(_medir_acessos, [(tipo, estrutura, n, acessos) for estrutura in estruturas],
+                               chunksize=1)
+            linha = "".join(f"{tempo * 1e6:>16.2f}" for tempo, _ in medidas)
+            print(f"{tipo:<12}{linha}{medidas[0][1]:>12.1f}{medidas[2][1]:>10.1f}")
+
+
+if __name__ == "__main__":
+    verificar_cursores()
+    tamanhos = [int(t) for t in sys.argv[1].split(",")] if len(sys.argv) > 1 else [10_000, 300_000]
+    operacoes = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    for tamanho in tamanhos:
+        comparar_backends(tamanho, operacoes)
+    comparar_blocos_avl(int(sys.argv[3]) if len(sys.argv) > 3 else 1_000_000)
+    medir_mapa_fragmentado(int(sys.argv[4]) if len(sys.argv) > 4 else 200_000)
+    medir_encadeamento(int(sys.argv[5]) if len(sys.argv) > 5 else 200_000)
+    medir_splay(int(sys.argv[6]) if len(sys.argv) > 6 else 100_000)
@@ -0,0 +1,117 @@
+"""
+Benchmark do tempo de importação dos módulos (guarda contra regressões)
+
+Uso:
+    python benchmark_importacao.py [limite_ms] [repeticoes]
+
+- Cada módulo é importado em um interpretador novo (sem cache de módulos), várias
+  vezes; vale a mediana do tempo do `import` medido dentro do processo
+- Além do tempo, verifica que a importação não tem efeitos colaterais:
+  nada impresso, nenhum arquivo criado no diretório de trabalho e Graphviz/Tkinter
+  não carregados (só devem ser importados ao desenhar ou abrir o editor)
+- NumPy é opcional e pode ser importado pelos módulos que o usam; o tempo dele
+  aparece separado e não conta para o limite
+- Sai com código 1 se algum módulo passar do limite ou tiver efeito colateral
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+MODULOS = (
+    "estruturas",
+    "atividade_1", "atividade_2", "atividade_3", "atividade_4", "atividade_5",
+    "arvore_splay", "colecao_ordenada", "lista_blocos", "mapa_fragmentado",
+    "labirinto", "gerador_labirinto", "arquivo_labirinto", "componentes_labirinto",
+    "replanejamento", "historico_labirinto", "busca_segundo_plano", "lote_labirinto",
+    "grafo_csr", "multiplas_origens", "hpa_labirinto", "grafos",
+)
+
+# Módulos que não podem ser carregados só por importar a biblioteca
+PROIBIDOS = ("graphviz", "tkinter")
+
+# Limite padrão por módulo (ms), sem contar o NumPy
+LIMITE_MS = 50
+
+_SONDA = r"""
+import io, json, sys, time
+try:
+    t0 = time.perf_counter()
+    import numpy
+    tempo_numpy = time.perf_counter() - t0
+except ImportError:
+    tempo_numpy = 0.0
+saida, sys.stdout = sys.stdout, io.StringIO()
+t0 = time.perf_counter()
+__import__(sys.argv[1])
+tempo = time.perf_counter() - t0
+impresso, sys.stdout = sys.stdout.getvalue(), saida
+print(json.dumps({
+    "tempo_ms": tempo * 1000,
+    "numpy_ms": tempo_numpy * 1000,
+    "impresso": impresso,
+    "proibidos": [m for m in sys.argv[2:] if m in sys.modules],
+}))
+"""
+
+
+def medir_modulo(modulo, repeticoes=5):
+    """Importa o módulo em `repeticoes` processos novos; retorna a mediana e os problemas encontrados."""
+    ambiente = dict(os.environ)
+    ambiente["PYTHONPATH"] = os.pathsep.join(filter(None, (RAIZ, ambiente.get("PYTHONPATH"))))
+    tempos, tempos_numpy, problemas = [], [], set()
+    with tempfile.TemporaryDirectory() as diretorio:
+        for _ in range(repeticoes):
+            processo = subprocess.run(
+                [sys.executable, "-c", _SONDA, modulo, *PROIBIDOS],
+                cwd=diretorio, env=ambiente, capture_output=True, text=True)
+            if processo.returncode != 0:
+                ultima = processo.stderr.strip().splitlines()[-1:] or ["?"]
+                problemas.add(f"falhou: {ultima[0]}")
+                break
+            dados = json.loads(processo.stdout)
+            tempos.append(dados["tempo_ms"])
+            tempos_numpy.append(dados["numpy_ms"])
+            if dados["impresso"]:
+                problemas.add("imprime ao ser importado")
+            for nome in dados["proibidos"]:
+                problemas.add(f"carrega {nome}")
+        if os.listdir(diretorio):
+            problemas.add(f"cria arquivos: {', '.join(sorted(os.listdir(diretorio)))}")
+    mediana = statistics.median(tempos) if tempos else float("nan")
+    mediana_numpy = statistics.median(tempos_numpy) if tempos_numpy else 0.0
+    return mediana, mediana_numpy, sorted(problemas)
+
+
+def medir_importacoes(limite_ms=LIMITE_MS, repeticoes=5):
+    print(f"{'módulo':<24}{'import (ms)':>12}  situação")
+    regressoes = 0
+    numpy_ms = 0.0
+    for modulo in MODULOS:
+        tempo, tempo_numpy, problemas = medir_modulo(modulo, repeticoes)
+        numpy_ms = max(numpy_ms, tempo_numpy)
+        if tempo > limite_ms:
+            problemas.append(f"acima do limite de {limite_ms} ms")
+        regressoes += bool(problemas)
+        print(f"{modulo:<24}{tempo:>12.1f}  {'; '.join(problemas) or 'ok'}")
+    if numpy_ms:
+        print(f"(NumPy importado à parte em {numpy_ms:.1f} ms, fora do limite)")
+    return regressoes
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    limite = float(sys.argv[1]) if len(sys.argv) > 1 else LIMITE_MS
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    regressoes = medir_importacoes(limite, repeticoes)
+    if regressoes:
+        print(f"{regressoes} módulo(s) com regressão na importação.")
+        sys.exit(1)
+    print("Todos os módulos importam sem efeitos colaterais e dentro do limite.")
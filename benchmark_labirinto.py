@@ -0,0 +1,346 @@
+"""
+Benchmarks do solver headless (labirinto.py)
+
+Uso:
+    python benchmark_labirinto.py [tamanho] [tamanho_arquivos] [lado_geradores] [grades_lote] [lado_hpa]
+
+- Verifica que S ou E em uma parede nunca dá caminho, em todos os algoritmos, e que
+  todos concordam no comprimento do caminho em grades pequenas aleatórias.
+- Compara nós expandidos e tempo de cada algoritmo em uma grade aberta,
+  em uma grade com obstáculos aleatórios e em uma grade de corredores (tipo labirinto).
+- Compara os algoritmos ponderados (Dijkstra com heap, com baldes e A*) em terreno com custos 1..9.
+- Mede tempo de gravação/leitura e tamanho em disco de cada formato de arquivo
+  (também com terreno).
+- Mede o tempo de cada gerador procedural.
+- Mede o índice de alcance (construção, edições e rejeição de labirintos sem caminho).
+- Compara o replanejamento incremental (D* Lite) com refazer a busca a cada edição.
+- Mede a vazão da resolução em lote com 1, 2, 4, ... processos (até o número de núcleos).
+- Compara a BFS de várias origens com paralelismo de bits com k BFS independentes.
+- Mede a busca hierárquica (HPA*): preparo, consultas contra A*, qualidade do caminho e edições.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+import arquivo_labirinto
+from componentes_labirinto import IndiceAlcance
+from gerador_labirinto import GERADORES, gerar, gerar_densidade
+from hpa_labirinto import AbstracaoHPA
+from labirinto import ALGORITMOS, PAREDE, GradeLabirinto, buscar, buscar_bfs
+from lote_labirinto import resolver_lote
+from multiplas_origens import bfs_multiplas_origens
+from replanejamento import PlanejadorIncremental
+
+
+# -------------------
+# GRADES DE TESTE
+# -------------------
+def grade_aberta(n):
+    grade = GradeLabirinto(n, n)
+    grade.inicio, grade.fim = (0, 0), (n - 1, n - 1)
+    return grade
+
+
+def grade_obstaculos(n, densidade=0.25, semente=42):
+    grade = gerar_densidade(n, n, densidade, semente)
+    grade.inicio, grade.fim = (0, 0), (n - 1, n - 1)
+    grade.definir_parede(0, 0, False)
+    grade.definir_parede(n - 1, n - 1, False)
+    return grade
+
+
+def grade_corredores(n, semente=42):
+    """Paredes horizontais a cada duas linhas, cada uma com poucas passagens aleatórias."""
+    rnd = random.Random(semente)
+    grade = GradeLabirinto(n, n, inicio=(0, 0), fim=(n - 1, n - 1))
+    for r in range(1, n - 1, 2):
+        for c in range(n):
+            grade.definir_parede(r, c)
+        for _ in range(max(1, n // 40)):
+            grade.definir_parede(r, rnd.randrange(n), False)
+    return grade
+
+
+def grade_terreno(n, custo_maximo=9, semente=42):
+    """
+    Obstáculos aleatórios (20%) e custo uniforme em 1..custo_maximo em cada célula livre
+    (paredes, S e E ficam com custo 1, como no editor e no formato texto).
+    """
+    grade = grade_obstaculos(n, 0.2, semente)
+    rnd = random.Random(semente)
+    tabela = bytes(1 + b % custo_maximo for b in range(256))
+    custos = bytearray(rnd.randbytes(n * n).translate(tabela))
+    i = grade.celulas.find(PAREDE)
+    while i != -1:
+        custos[i] = 1
+        i = grade.celulas.find(PAREDE, i + 1)
+    custos[0] = custos[-1] = 1
+    grade.custos = custos
+    return grade
+
+
+# -------------------
+# VERIFICAÇÕES
+# -------------------
+def verificar_extremos_em_parede():
+    """S ou E em uma parede: nenhum algoritmo (nem índice, D* Lite, HPA* ou lote) devolve caminho."""
+    grade = GradeLabirinto.de_texto(["   ", "   ", "   "])
+    grade.definir_parede(2, 2)
+    for inicio, fim in (((2, 2), (0, 0)), ((0, 0), (2, 2)), ((2, 2), (2, 2))):
+        for nome in ALGORITMOS:
+            assert buscar(grade, nome, inicio, fim).comprimento == -1, (nome, inicio, fim)
+        assert buscar(grade, "bfs", inicio, fim, indice=IndiceAlcance(grade)).comprimento == -1
+        assert PlanejadorIncremental(grade, inicio, fim).calcular().comprimento == -1
+        hpa = AbstracaoHPA(grade)
+        hpa.preparar()
+        assert hpa.buscar(inicio, fim).comprimento == -1
+        assert resolver_lote([(grade, [(inicio, fim)])], processos=1) == [[(-1, [])]]
+    # lote com várias consultas da mesma origem (uma BFS sem fim a partir de S)
+    assert resolver_lote([(grade, [((2, 2), (0, 0)), ((2, 2), (1, 1))])], processos=1) == [[(-1, []), (-1, [])]]
+    print("S/E em parede: nenhum algoritmo devolve caminho")
+
+
+def verificar_concordancia(consultas=300, semente=13):
+    """Em grades pequenas sem terreno, todos os algoritmos concordam no comprimento (S/E em qualquer célula)."""
+    rnd = random.Random(semente)
+    for _ in range(consultas):
+        grade = gerar_densidade(rnd.randrange(2, 12), rnd.randrange(2, 12), 0.3, rnd.randrange(10 ** 6))
+        inicio = (rnd.randrange(grade.linhas), rnd.randrange(grade.colunas))
+        fim = (rnd.randrange(grade.linhas), rnd.randrange(grade.colunas))
+        comprimentos = {nome: buscar(grade, nome, inicio, fim).comprimento for nome in ALGORITMOS}
+        assert len(set(comprimentos.values())) == 1, (inicio, fim, comprimentos)
+    print(f"{consultas} consultas aleatórias: todos os algoritmos concordam no comprimento")
+
+
+# -------------------
+# EXECUÇÃO
+# -------------------
+def comparar_algoritmos(nome, grade, repeticoes=3, algoritmos=ALGORITMOS):
+    print(f"\n=== {nome} ({grade.linhas}x{grade.colunas}) ===")
+    print(f"{'algoritmo':<18}{'compr.':>8}{'custo':>8}{'expandidos':>12}{'tempo (ms)':>12}{'vs 1º':>10}")
+    base = None
+    for algoritmo in algoritmos:
+        melhor = min((buscar(grade, algoritmo) for _ in range(repeticoes)), key=lambda r: r.tempo_ms)
+        if base is None:
+            base = melhor
+        print(f"{algoritmo:<18}{melhor.comprimento:>8}{melhor.custo:>8}{melhor.nos_expandidos:>12}"
+              f"{melhor.tempo_ms:>12.1f}{base.tempo_ms / melhor.tempo_ms:>9.1f}x")
+
+
+def medir_alcance(nome, grade, edicoes=200, semente=3):
+    """Constrói o índice, fecha E com paredes e compara a rejeição instantânea com a BFS."""
+    grade = grade.copia()
+    t0 = time.perf_counter()
+    indice = IndiceAlcance(grade)
+    t_construcao = time.perf_counter() - t0
+    print(f"\n=== Índice de alcance: {nome} ({grade.linhas}x{grade.colunas}) ===")
+    print(f"construção: {t_construcao * 1000:.1f} ms, {indice.quantidade_componentes} componentes")
+
+    # E cercado de paredes: nenhuma busca encontra caminho
+    fr, fc = grade.fim
+    for r, c in ((fr - 1, fc), (fr + 1, fc), (fr, fc - 1), (fr, fc + 1)):
+        if grade.dentro(r, c) and (r, c) != grade.inicio:
+            grade.definir_parede(r, c)
+            indice.atualizar_celula(r, c)
+    sem_indice = buscar(grade, "bfs", registrar=False)
+    t0 = time.perf_counter()
+    com_indice = buscar(grade, "bfs", registrar=False, indice=indice)
+    t_rejeicao = (time.perf_counter() - t0) * 1000
+    assert not sem_indice.encontrado and not com_indice.encontrado
+    print(f"sem caminho: BFS {sem_indice.tempo_ms:.1f} ms ({sem_indice.nos_expandidos} expandidos), "
+          f"com índice {t_rejeicao:.3f} ms")
+
+    rnd = random.Random(semente)
+    t0 = time.perf_counter()
+    for _ in range(edicoes):
+        r, c = rnd.randrange(grade.linhas), rnd.randrange(grade.colunas)
+        grade.definir_parede(r, c, not grade.eh_parede(r, c))
+        indice.atualizar_celula(r, c)
+    print(f"edições aleatórias: {(time.perf_counter() - t0) * 1000 / edicoes:.2f} ms por edição")
+
+
+def medir_replanejamento(nome, grade, edicoes=100, semente=7):
+    """
+    Alterna paredes (metade sobre o caminho atual, metade em qualquer lugar) e
+    compara o reparo incremental com uma busca completa por edição.
+    """
+    grade = grade.copia()
+    rnd = random.Random(semente)
+    planejador = PlanejadorIncremental(grade)
+    inicial = planejador.calcular()
+    caminho = inicial.caminho
+    t_incremental = t_bfs = t_a_estrela = 0.0
+    expandidos = 0
+    for k in range(edicoes):
+        if k % 2 == 0 and len(caminho) > 2:
+            r, c = caminho[rnd.randrange(1, len(caminho) - 1)]
+        else:
+            r, c = rnd.randrange(grade.linhas), rnd.randrange(grade.colunas)
+        if (r, c) in (grade.inicio, grade.fim):
+            continue
+        grade.definir_parede(r, c, not grade.eh_parede(r, c))
+        t0 = time.perf_counter()
+        planejador.atualizar_celula(r, c)
+        res = planejador.calcular()
+        t_incremental += time.perf_counter() - t0
+        expandidos += res.expandidos
+        caminho = res.caminho or caminho
+        t_bfs += buscar(grade, "bfs", registrar=False).tempo_ms / 1000.0
+        t_a_estrela += buscar(grade, "a_estrela", registrar=False).tempo_ms / 1000.0
+    print(f"\n=== Replanejamento: {nome} ({grade.linhas}x{grade.colunas}, {edicoes} edições) ===")
+    print(f"busca inicial D* Lite: {inicial.tempo_ms:.1f} ms, {inicial.nos_expandidos} expandidos")
+    print(f"{'método':<18}{'ms por edição':>15}")
+    for metodo, total in (("D* Lite", t_incremental), ("BFS completa", t_bfs), ("A* completo", t_a_estrela)):
+        print(f"{metodo:<18}{total * 1000 / edicoes:>15.2f}")
+    print(f"D* Lite: {expandidos / edicoes:.0f} expansões por edição em média")
+
+
+def medir_lote(quantidade, lado=301, consultas=4, semente=5):
+    """Vazão (consultas/s) da resolução em lote conforme o número de processos."""
+    rnd = random.Random(semente)
+    entradas = []
+    for k in range(quantidade):
+        grade = gerar("backtracker", lado, lado, semente + k)
+        # consultas entre salas (coordenadas ímpares) aleatórias
+        pares = [((rnd.randrange(1, lado, 2), rnd.randrange(1, lado, 2)),
+                  (rnd.randrange(1, lado, 2), rnd.randrange(1, lado, 2))) for _ in range(consultas)]
+        entradas.append((grade, pares))
+    total = quantidade * consultas
+    nucleos = os.cpu_count() or 1
+    print(f"\n=== Lote ({quantidade} grades {lado}x{lado}, {total} consultas, {nucleos} núcleos) ===")
+    print(f"{'processos':<12}{'tempo (s)':>10}{'consultas/s':>13}{'aceleração':>12}")
+    niveis = [1]
+    while niveis[-1] * 2 <= nucleos:
+        niveis.append(niveis[-1] * 2)
+    if niveis[-1] != nucleos:
+        niveis.append(nucleos)
+    base = referencia = None
+    for processos in niveis:
+        t0 = time.perf_counter()
+        resultados = resolver_lote(entradas, "a_estrela", processos=processos)
+        dt = time.perf_counter() - t0
+        if referencia is None:
+            base, referencia = dt, resultados
+        assert [[c for c, _ in r] for r in resultados] == [[c for c, _ in r] for r in referencia]
+        print(f"{processos:<12}{dt:>10.2f}{total / dt:>13.0f}{base / dt:>11.1f}x")
+
+
+def medir_multiplas_origens(nome, grade, quantidades=(8, 64, 256), semente=9):
+    """k origens aleatórias: uma BFS de várias origens contra k BFS da grade, uma por origem."""
+    grade = grade.copia()
+    grade.inicio = grade.fim = None
+    rnd = random.Random(semente)
+    livres = [i for i in range(grade.linhas * grade.colunas) if grade.celulas[i] != PAREDE]
+    print(f"\n=== Várias origens: {nome} ({grade.linhas}x{grade.colunas}) ===")
+    print(f"{'origens':<9}{'k BFS (ms)':>12}{'bits (ms)':>11}{'só alcance (ms)':>17}{'aceleração':>12}")
+    for k in quantidades:
+        origens = [grade.posicao(i) for i in rnd.sample(livres, k)]
+        t0 = time.perf_counter()
+        independentes = [buscar_bfs(grade, pos, registrar=False) for pos in origens]
+        t_independentes = time.perf_counter() - t0
+        res = bfs_multiplas_origens(grade, origens)
+        alcance = bfs_multiplas_origens(grade, origens, com_distancias=False)
+        for j in (0, k - 1):
+            assert list(independentes[j].distancias) == list(map(int, res.distancias[j]))
+        print(f"{k:<9}{t_independentes * 1000:>12.0f}{res.tempo_ms:>11.0f}{alcance.tempo_ms:>17.0f}"
+              f"{t_independentes * 1000 / res.tempo_ms:>11.1f}x")
+
+
+def medir_hpa(nome, grade, consultas=20, edicoes=50, semente=11):
+    """Consultas aleatórias com HPA* (abstração preparada) contra A*; depois edições de paredes."""
+    grade = grade.copia()
+    rnd = random.Random(semente)
+    t0 = time.perf_counter()
+    hpa = AbstracaoHPA(grade)
+    t_entradas = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    hpa.preparar()
+    t_preparo = time.perf_counter() - t0
+    print(f"\n=== HPA*: {nome} ({grade.linhas}x{grade.colunas}) ===")
+    print(f"{hpa}: entradas {t_entradas:.2f} s, distâncias internas {t_preparo:.2f} s")
+    livres = [i for i in range(grade.linhas * grade.colunas) if grade.celulas[i] != PAREDE]
+    t_hpa = t_a_estrela = 0.0
+    razoes = []
+    for _ in range(consultas):
+        inicio, fim = grade.posicao(rnd.choice(livres)), grade.posicao(rnd.choice(livres))
+        res = hpa.buscar(inicio, fim)
+        ref = buscar(grade, "a_estrela", inicio, fim, registrar=False)
+        assert res.encontrado == ref.encontrado
+        t_hpa += res.tempo_ms
+        t_a_estrela += ref.tempo_ms
+        if ref.comprimento > 0:
+            razoes.append(res.comprimento / ref.comprimento)
+    print(f"consulta: HPA* {t_hpa / consultas:.1f} ms, A* {t_a_estrela / consultas:.1f} ms "
+          f"({t_a_estrela / t_hpa:.1f}x); caminho {(sum(razoes) / max(len(razoes), 1) - 1) * 100:.1f}% "
+          f"acima do mínimo em média (pior {(max(razoes, default=1) - 1) * 100:.1f}%)")
+    t0 = time.perf_counter()
+    for _ in range(edicoes):
+        r, c = rnd.randrange(grade.linhas), rnd.randrange(grade.colunas)
+        grade.definir_parede(r, c, not grade.eh_parede(r, c))
+        hpa.atualizar_celula(r, c)
+    print(f"edições aleatórias: {(time.perf_counter() - t0) * 1000 / edicoes:.2f} ms por edição")
+
+
+def medir_geradores(linhas, colunas, semente=1):
+    n = linhas * colunas
+    print(f"\n=== Geradores ({linhas}x{colunas} = {n / 1e6:.1f} Mcélulas) ===")
+    for nome in GERADORES:
+        t0 = time.perf_counter()
+        grade = gerar(nome, linhas, colunas, semente)
+        dt = time.perf_counter() - t0
+        print(f"{nome:<12}{dt:>8.2f} s{n / dt / 1e6:>8.2f} Mcélulas/s  S={grade.inicio} E={grade.fim}")
+
+
+def medir_arquivos(grade):
+    n = grade.linhas * grade.colunas
+    terreno = ", com terreno" if grade.custos is not None else ""
+    print(f"\n=== Arquivos ({grade.linhas}x{grade.colunas} = {n / 1e6:.1f} Mcélulas{terreno}) ===")
+    print(f"{'formato':<10}{'tamanho (KB)':>14}{'salvar (ms)':>13}{'carregar (ms)':>15}")
+    with tempfile.TemporaryDirectory() as pasta:
+        formatos = [("texto", ".txt", None)] + [(c, ".lab", c) for c in arquivo_labirinto.CODIFICACOES]
+        for nome, extensao, codificacao in formatos:
+            caminho = os.path.join(pasta, "labirinto" + extensao)
+            t0 = time.perf_counter()
+            if codificacao is None:
+                arquivo_labirinto.salvar_texto(grade, caminho)
+            else:
+                arquivo_labirinto.salvar_binario(grade, caminho, codificacao)
+            t1 = time.perf_counter()
+            carregada = arquivo_labirinto.carregar(caminho)
+            t2 = time.perf_counter()
+            assert carregada.celulas == grade.celulas and carregada.custos == grade.custos
+            print(f"{nome:<10}{os.path.getsize(caminho) / 1024:>14.0f}"
+                  f"{(t1 - t0) * 1000:>13.1f}{(t2 - t1) * 1000:>15.1f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    verificar_extremos_em_parede()
+    verificar_concordancia()
+    comparar_algoritmos("Grade aberta", grade_aberta(n))
+    comparar_algoritmos("Obstáculos aleatórios (25%)", grade_obstaculos(n))
+    comparar_algoritmos("Corredores", grade_corredores(n))
+    comparar_algoritmos("Labirinto perfeito (backtracker)", gerar("backtracker", n + 1 - n % 2, n + 1 - n % 2, 42))
+    comparar_algoritmos("Terreno com custos 1..9", grade_terreno(n),
+                        algoritmos=("dijkstra", "dijkstra_baldes", "a_estrela"))
+    medir_alcance("Obstáculos aleatórios (25%)", grade_obstaculos(n))
+    medir_alcance("Labirinto perfeito (backtracker)", gerar("backtracker", n + 1 - n % 2, n + 1 - n % 2, 42))
+    medir_replanejamento("Obstáculos aleatórios (25%)", grade_obstaculos(n))
+    medir_replanejamento("Labirinto perfeito (backtracker)", gerar("backtracker", n + 1 - n % 2, n + 1 - n % 2, 42))
+    medir_multiplas_origens("Obstáculos aleatórios (25%)", grade_obstaculos(n))
+    medir_multiplas_origens("Grade aberta", grade_aberta(n))
+    n_arquivos = int(sys.argv[2]) if len(sys.argv) > 2 else 2048
+    medir_arquivos(grade_corredores(n_arquivos))
+    medir_arquivos(grade_obstaculos(n_arquivos))
+    medir_arquivos(gerar("backtracker", n_arquivos - 1, n_arquivos - 1, 42))
+    medir_arquivos(grade_terreno(n_arquivos))
+    lado_geradores = int(sys.argv[3]) if len(sys.argv) > 3 else 1001
+    medir_geradores(lado_geradores, lado_geradores)
+    medir_lote(int(sys.argv[4]) if len(sys.argv) > 4 else 64)
+    lado_hpa = int(sys.argv[5]) if len(sys.argv) > 5 else 1000
+    medir_hpa("Obstáculos aleatórios (25%)", grade_obstaculos(lado_hpa))
+    medir_hpa("Labirinto perfeito (backtracker)", gerar("backtracker", lado_hpa + 1 - lado_hpa % 2,
+                                                          lado_hpa + 1 - lado_hpa % 2, 42))
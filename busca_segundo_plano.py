@@ -0,0 +1,157 @@
+"""
+Busca do labirinto fora da thread da interface
+
+- A busca roda em uma thread ou em um processo separado (modo "thread" ou "processo")
+- A cada LOTE_PROGRESSO expansões o trabalhador envia por uma fila só o trecho novo
+  do registro (células expandidas e descobertas); a interface drena a fila uma vez
+  por quadro com coletar(), que estende um ResultadoBusca espelho
+- cancelar() é atendido no próximo lote (a thread para sozinha; o processo também
+  é encerrado na hora)
+
+No modo "thread" a busca em Python puro ainda divide o GIL com a interface, que
+recebe uma fatia a cada intervalo de troca do interpretador; no modo "processo"
+a busca roda em outro núcleo e a grade é copiada uma vez para o processo filho.
+"""
+
+import queue
+import threading
+
+from labirinto import ResultadoBusca, buscar
+
+
+# -------------------
+# LADO DO TRABALHADOR
+# -------------------
+def _enviar_trecho(resultado, enviados, fila):
+    """Envia o registro entre a última expansão enviada e a atual."""
+    a, b = enviados[0], len(resultado.ordem_expansao)
+    if b > a:
+        inicio = resultado.inicio_descobertas
+        fila.put(("progresso",
+                  resultado.ordem_expansao[a:b],
+                  resultado.descobertas[inicio[a]:inicio[b]],
+                  inicio[a + 1:b + 1]))
+        enviados[0] = b
+
+
+def _executar(grade, algoritmo, inicio, fim, fila, cancelar):
+    enviados = [0]
+
+    def progresso(resultado):
+        _enviar_trecho(resultado, enviados, fila)
+        return cancelar.is_set()
+
+    try:
+        resultado = buscar(grade, algoritmo, inicio, fim, progresso=progresso)
+        _enviar_trecho(resultado, enviados, fila)
+        fila.put(("fim", resultado.caminho, resultado.expandidos, resultado.tempo_ms, resultado.cancelado))
+    except Exception as e:  # o erro é mostrado pela interface
+        fila.put(("erro", f"{type(e).__name__}: {e}"))
+
+
+# -------------------
+# LADO DA INTERFACE
+# -------------------
+class BuscaEmSegundoPlano:
+    """
+    Uma busca em andamento.
+    resultado: ResultadoBusca espelho com o registro recebido até agora;
+    caminho, expandidos e tempo_ms são preenchidos quando a busca termina.
+    """
+    MODOS = ("thread", "processo")
+
+    def __init__(self, grade, algoritmo="bfs", inicio=None, fim=None, modo="thread"):
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo desconhecido: {modo!r}. Opções: {', '.join(self.MODOS)}.")
+        self.grade = grade
+        self.algoritmo = algoritmo
+        self.inicio = inicio
+        self.fim = fim
+        self.modo = modo
+        self.resultado = ResultadoBusca(algoritmo, grade)
+        self.concluida = False
+        self.erro = None
+        self._fila = None
+        self._cancelar = None
+        self._trabalhador = None
+
+    def iniciar(self):
+        args = (self.grade, self.algoritmo, self.inicio, self.fim)
+        if self.modo == "thread":
+            self._fila = queue.Queue()
+            self._cancelar = threading.Event()
+            self._trabalhador = threading.Thread(target=_executar, args=args + (self._fila, self._cancelar),
+                                                 daemon=True)
+        else:
+            # carregado só no modo "processo"; "spawn": o filho não herda o estado do Tk do processo pai
+            import multiprocessing
+            contexto = multiprocessing.get_context("spawn")
+            self._fila = contexto.Queue()
+            self._cancelar = contexto.Event()
+            self._trabalhador = contexto.Process(target=_executar, args=args + (self._fila, self._cancelar),
+                                                 daemon=True)
+        self._trabalhador.start()
+        return self
+
+    def cancelar(self):
+        if self._cancelar is None or self.concluida:
+            return
+        self._cancelar.set()
+        if self.modo == "processo" and self._trabalhador.is_alive():
+            self._trabalhador.terminate()
+        self.concluida = True
+        self.resultado.cancelado = True
+
+    def coletar(self):
+        """Aplica no espelho tudo o que chegou na fila (sem bloquear). Retorna as expansões novas."""
+        if self.concluida:
+            return 0
+        res = self.resultado
+        novas = 0
+        while True:
+            try:
+                mensagem = self._fila.get_nowait()
+            except queue.Empty:
+                break
+            tipo = mensagem[0]
+            if tipo == "progresso":
+                _, ordem, descobertas, limites = mensagem
+                res.ordem_expansao.extend(ordem)
+                res.descobertas.extend(descobertas)
+                res.inicio_descobertas.extend(limites)
+                novas += len(ordem)
+            elif tipo == "fim":
+                _, res.caminho, res.expandidos, res.tempo_ms, res.cancelado = mensagem
+                self._encerrar()
+                break
+            else:
+                self.erro = mensagem[1]
+                self._encerrar()
+                break
+        return novas
+
+    def _encerrar(self):
+        self.concluida = True
+        if self.modo == "processo":
+            self._trabalhador.join(timeout=1.0)
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    import time
+
+    from gerador_labirinto import gerar
+
+    grade = gerar("backtracker", 1001, 1001, semente=1)
+    for modo in BuscaEmSegundoPlano.MODOS:
+        busca = BuscaEmSegundoPlano(grade, "bfs", modo=modo).iniciar()
+        t0 = time.perf_counter()
+        quadros = 0
+        while not busca.concluida:
+            busca.coletar()
+            quadros += 1
+            time.sleep(0.016)
+        print(f"{modo}: {busca.resultado.expandidos} expansões, caminho com {len(busca.resultado.caminho)} "
+              f"células, {time.perf_counter() - t0:.2f} s em {quadros} quadros")
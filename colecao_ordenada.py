@@ -0,0 +1,561 @@
+"""
+Coleção ordenada (conjunto/mapa) com uma interface única para todas as árvores
+
+- ColecaoOrdenada: inserir/remover/contem/obter/intervalo/minimo/maximo, len(),
+  iteração em ordem e acesso de mapa (colecao[chave] = valor)
+- Backends:
+    ListaOrdenada     lista Python ordenada + bisect
+    ColecaoBST        atividade_2.BinarySearchTree (sem balanceamento)
+    ColecaoAVLTree    atividade_4.AVLTree (insert/delete devolvem a nova raiz)
+    ColecaoArvoreAVL  atividade_5.ArvoreAVL
+    ColecaoBlocos     lista_blocos.ListaBlocos (lista de blocos ordenados)
+    ColecaoSplay      arvore_splay.ArvoreSplay (buscas reorganizam a árvore)
+- As árvores só ordenam e buscam as chaves; os valores do mapa ficam em um dicionário
+  ao lado (nós de chave duplicada/cópia do sucessor na remoção não carregam dados)
+- Os nós das árvores têm nomes diferentes (valor/left/right, chave/esquerda/direita):
+  percurso em ordem, busca e intervalo são escritos uma vez, iterativos, para ambos
+- construir(chaves_ordenadas) monta qualquer backend em O(n) (árvores perfeitamente
+  balanceadas, sem uma inserção por chave)
+- ColecaoAdaptativa: começa como ListaOrdenada e migra para uma árvore balanceada
+  quando as escritas em uma lista grande passam a custar mais que a árvore (e volta
+  para a lista quando a carga fica de leitura); ver _avaliar()
+
+Uso:
+    precos = ColecaoAdaptativa()
+    precos["banana"] = 3
+    precos.inserir("abacate", 7)
+    print(precos.intervalo("a", "b"), precos.minimo())
+"""
+
+from bisect import bisect_left, bisect_right
+
+from atividade_2 import BinarySearchTree, Node as NoBST
+from atividade_4 import AVLTree, Node as NoAVLTree
+from arvore_splay import ArvoreSplay
+from atividade_5 import ArvoreAVL, No
+from lista_blocos import ListaBlocos
+
+# Custos estimados (ns) no CPython, medidos com benchmark_arvores.py: uma escrita na
+# lista desloca em média metade das posições; na árvore custa uma descida + rotações
+LISTA_ESCRITA_NS = 1000
+LISTA_NS_POR_POSICAO = 0.4
+LISTA_LEITURA_NS = 500
+ARVORE_ESCRITA_NS = 20000
+ARVORE_LEITURA_NS = 8000
+# Migrar copia todas as chaves; no sentido lista -> árvore ainda cria um nó por chave
+MIGRACAO_ARVORE_NS_POR_CHAVE = 3000
+MIGRACAO_LISTA_NS_POR_CHAVE = 1000
+# Operações por janela de medição da ColecaoAdaptativa
+JANELA = 4096
+
+_AUSENTE = object()
+
+
+class ColecaoOrdenada:
+    """
+    Conjunto ordenado de chaves distintas, com um valor opcional por chave (mapa).
+    Subclasses implementam _inserir_chave/_remover_chave (devolvem se algo mudou),
+    _carregar, contem, intervalo, minimo, maximo e __iter__.
+    """
+    nome = "?"
+
+    def __init__(self, chaves=()):
+        self._tamanho = 0
+        self._valores = {}  # só chaves com valor diferente de None
+        for chave in chaves:
+            self.inserir(chave)
+
+    @classmethod
+    def construir(cls, chaves_ordenadas, valores=None):
+        """Coleção a partir de chaves já ordenadas e distintas, em O(n)."""
+        chaves = list(chaves_ordenadas)
+        if any(a >= b for a, b in zip(chaves, chaves[1:])):
+            raise ValueError("As chaves devem estar em ordem crescente e sem repetição.")
+        colecao = cls()
+        colecao._carregar(chaves)
+        colecao._tamanho = len(chaves)
+        if valores:
+            colecao._valores = {chave: valor for chave, valor in valores.items() if valor is not None}
+        return colecao
+
+    # -------------------
+    # CONJUNTO
+    # -------------------
+    def inserir(self, chave, valor=None):
+        """Insere a chave (ou troca o valor dela); devolve True se a chave é nova."""
+        nova = self._inserir_chave(chave)
+        self._tamanho += nova
+        if valor is None:
+            self._valores.pop(chave, None)
+        else:
+            self._valores[chave] = valor
+        return nova
+
+    def remover(self, chave):
+        """Remove a chave; devolve False se ela não estava na coleção."""
+        if not self._remover_chave(chave):
+            return False
+        self._tamanho -= 1
+        self._valores.pop(chave, None)
+        return True
+
+    def obter(self, chave, padrao=None):
+        if not self.contem(chave):
+            return padrao
+        return self._valores.get(chave)
+
+    def itens(self):
+        valores = self._valores
+        return ((chave, valores.get(chave)) for chave in self)
+
+    def __len__(self):
+        return self._tamanho
+
+    def __contains__(self, chave):
+        return self.contem(chave)
+
+    # -------------------
+    # MAPA
+    # -------------------
+    def __getitem__(self, chave):
+        valor = self.obter(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            raise KeyError(chave)
+        return valor
+
+    def __setitem__(self, chave, valor):
+        self.inserir(chave, valor)
+
+    def __delitem__(self, chave):
+        if not self.remover(chave):
+            raise KeyError(chave)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self)} chaves)"
+
+
+# -------------------
+# LISTA ORDENADA (BISECT)
+# -------------------
+class ListaOrdenada(ColecaoOrdenada):
+    """Chaves em uma lista ordenada: buscas em C (bisect), escritas O(n) por deslocamento."""
+    nome = "lista+bisect"
+
+    def __init__(self, chaves=()):
+        self._chaves = []
+        super().__init__(chaves)
+
+    def _carregar(self, chaves):
+        self._chaves = chaves
+
+    def _inserir_chave(self, chave):
+        chaves = self._chaves
+        i = bisect_left(chaves, chave)
+        if i < len(chaves) and chaves[i] == chave:
+            return False
+        chaves.insert(i, chave)
+        return True
+
+    def _remover_chave(self, chave):
+        chaves = self._chaves
+        i = bisect_left(chaves, chave)
+        if i == len(chaves) or chaves[i] != chave:
+            return False
+        del chaves[i]
+        return True
+
+    def contem(self, chave):
+        chaves = self._chaves
+        i = bisect_left(chaves, chave)
+        return i < len(chaves) and chaves[i] == chave
+
+    def intervalo(self, inicio, fim):
+        chaves = self._chaves
+        return chaves[bisect_left(chaves, inicio):bisect_right(chaves, fim)]
+
+    def minimo(self):
+        if not self._chaves:
+            raise ValueError("Coleção vazia.")
+        return self._chaves[0]
+
+    def maximo(self):
+        if not self._chaves:
+            raise ValueError("Coleção vazia.")
+        return self._chaves[-1]
+
+    def __iter__(self):
+        return iter(self._chaves)
+
+
+# -------------------
+# ADAPTADORES DAS ÁRVORES
+# -------------------
+class _ColecaoArvore(ColecaoOrdenada):
+    """Busca, percurso e intervalo iterativos sobre os nós de qualquer uma das árvores."""
+    CHAVE, ESQUERDA, DIREITA = "valor", "left", "right"
+
+    def _raiz(self):
+        raise NotImplementedError
+
+    def _criar_no(self, chave, esquerda, direita):
+        raise NotImplementedError
+
+    def _montar(self, chaves, inicio, fim):
+        if inicio >= fim:
+            return None
+        meio = (inicio + fim) // 2
+        return self._criar_no(chaves[meio], self._montar(chaves, inicio, meio), self._montar(chaves, meio + 1, fim))
+
+    def contem(self, chave):
+        no, atributo, esquerda, direita = self._raiz(), self.CHAVE, self.ESQUERDA, self.DIREITA
+        while no is not None:
+            atual = getattr(no, atributo)
+            if chave == atual:
+                return True
+            no = getattr(no, esquerda if chave < atual else direita)
+        return False
+
+    def _em_ordem(self, inicio=None, fim=None):
+        """Chaves em ordem, com poda das subárvores fora de [inicio, fim]."""
+        atributo, esquerda, direita = self.CHAVE, self.ESQUERDA, self.DIREITA
+        pilha = []
+        no = self._raiz()
+        while pilha or no is not None:
+            if no is not None:
+                if inicio is not None and getattr(no, atributo) < inicio:
+                    no = getattr(no, direita)  # o nó e a subárvore esquerda ficam antes do intervalo
+                    continue
+                pilha.append(no)
+                no = getattr(no, esquerda)
+            else:
+                no = pilha.pop()
+                chave = getattr(no, atributo)
+                if fim is not None and chave > fim:
+                    return
+                yield chave
+                no = getattr(no, direita)
+
+    def intervalo(self, inicio, fim):
+        return list(self._em_ordem(inicio, fim))
+
+    def _extremo(self, lado):
+        no = self._raiz()
+        if no is None:
+            raise ValueError("Coleção vazia.")
+        proximo = getattr(no, lado)
+        while proximo is not None:
+            no, proximo = proximo, getattr(proximo, lado)
+        return getattr(no, self.CHAVE)
+
+    def minimo(self):
+        return self._extremo(self.ESQUERDA)
+
+    def maximo(self):
+        return self._extremo(self.DIREITA)
+
+    def __iter__(self):
+        return self._em_ordem()
+
+
+class ColecaoBST(_ColecaoArvore):
+    """BinarySearchTree (atividade 2): sem balanceamento; chaves em ordem aleatória."""
+    nome = "BST"
+
+    def __init__(self, chaves=()):
+        self.arvore = BinarySearchTree()
+        super().__init__(chaves)
+
+    def _raiz(self):
+        return self.arvore.root
+
+    def _criar_no(self, chave, esquerda, direita):
+        no = NoBST(chave)
+        no.left, no.right = esquerda, direita
+        return no
+
+    def _carregar(self, chaves):
+        self.arvore.root = self._montar(chaves, 0, len(chaves))
+
+    def _inserir_chave(self, chave):
+        # a BST aceita repetidas (vão para a direita): verificar antes
+        if self.contem(chave):
+            return False
+        self.arvore.insert(chave)
+        return True
+
+    def _remover_chave(self, chave):
+        if not self.contem(chave):
+            return False
+        self.arvore.delete(chave)
+        return True
+
+
+class ColecaoAVLTree(_ColecaoArvore):
+    """AVLTree (atividade 4): a raiz fica no adaptador, já que insert/delete a devolvem."""
+    nome = "AVLTree"
+
+    def __init__(self, chaves=()):
+        self.arvore = AVLTree()
+        self.raiz = None
+        super().__init__(chaves)
+
+    def _raiz(self):
+        return self.raiz
+
+    def _criar_no(self, chave, esquerda, direita):
+        no = NoAVLTree(chave)
+        no.left, no.right = esquerda, direita
+        no.height = 1 + max(self.arvore.get_height(esquerda), self.arvore.get_height(direita))
+        return no
+
+    def _carregar(self, chaves):
+        self.raiz = self._montar(chaves, 0, len(chaves))
+
+    def _inserir_chave(self, chave):
+        if self.contem(chave):
+            return False
+        self.raiz = self.arvore.insert(self.raiz, chave)
+        return True
+
+    def _remover_chave(self, chave):
+        if not self.contem(chave):
+            return False
+        self.raiz = self.arvore.delete(self.raiz, chave)
+        return True
+
+
+class ColecaoArvoreAVL(_ColecaoArvore):
+    """ArvoreAVL (atividade 5)."""
+    nome = "ArvoreAVL"
+    CHAVE, ESQUERDA, DIREITA = "chave", "esquerda", "direita"
+
+    def __init__(self, chaves=()):
+        self.arvore = ArvoreAVL()
+        super().__init__(chaves)
+
+    def _raiz(self):
+        return self.arvore.raiz
+
+    def _criar_no(self, chave, esquerda, direita):
+        no = No(chave)
+        no.esquerda, no.direita = esquerda, direita
+        no.altura = 1 + max(self.arvore.obter_altura(esquerda), self.arvore.obter_altura(direita))
+        return no
+
+    def _carregar(self, chaves):
+        self.arvore.raiz = self._montar(chaves, 0, len(chaves))
+
+    def _inserir_chave(self, chave):
+        try:
+            self.arvore.inserir(chave)  # recusa repetidas sem alterar a árvore
+        except ValueError:
+            return False
+        return True
+
+    def _remover_chave(self, chave):
+        if not self.contem(chave):
+            return False
+        self.arvore.deletar(chave)
+        return True
+
+    def intervalo(self, inicio, fim):
+        return self.arvore.encontrar_nos_intervalo(inicio, fim)
+
+
+class ColecaoSplay(_ColecaoArvore):
+    """
+    ArvoreSplay: contem() faz o splay da chave (chaves quentes sobem para a raiz).
+    A ArvoreSplay já é um conjunto: insert/delete devolvem se algo mudou (False para
+    chave repetida ou ausente), que é o que _inserir_chave/_remover_chave devolvem.
+    """
+    nome = "splay"
+
+    def __init__(self, chaves=()):
+        self.arvore = ArvoreSplay()
+        super().__init__(chaves)
+
+    def _raiz(self):
+        return self.arvore.root
+
+    def _criar_no(self, chave, esquerda, direita):
+        no = NoBST(chave)
+        no.left, no.right = esquerda, direita
+        return no
+
+    def _carregar(self, chaves):
+        self.arvore.root = self._montar(chaves, 0, len(chaves))
+
+    def _inserir_chave(self, chave):
+        return self.arvore.insert(chave)
+
+    def _remover_chave(self, chave):
+        return self.arvore.delete(chave)
+
+    def contem(self, chave):
+        return self.arvore.search(chave)
+
+
+class ColecaoBlocos(ColecaoOrdenada):
+    """ListaBlocos: buscas com dois bisects, escritas deslocam só um bloco."""
+    nome = "ListaBlocos"
+
+    def __init__(self, chaves=()):
+        self.lista = ListaBlocos()
+        super().__init__(chaves)
+
+    def _carregar(self, chaves):
+        self.lista = ListaBlocos(chaves)
+
+    def _inserir_chave(self, chave):
+        try:
+            self.lista.inserir(chave)
+        except ValueError:
+            return False
+        return True
+
+    def _remover_chave(self, chave):
+        if chave not in self.lista:
+            return False
+        self.lista.deletar(chave)
+        return True
+
+    def contem(self, chave):
+        return chave in self.lista
+
+    def intervalo(self, inicio, fim):
+        return self.lista.encontrar_nos_intervalo(inicio, fim)
+
+    def minimo(self):
+        return self.lista.minimo()
+
+    def maximo(self):
+        return self.lista.maximo()
+
+    def __iter__(self):
+        return iter(self.lista)
+
+
+BACKENDS = {
+    "lista": ListaOrdenada,
+    "bst": ColecaoBST,
+    "avltree": ColecaoAVLTree,
+    "arvore_avl": ColecaoArvoreAVL,
+    "blocos": ColecaoBlocos,
+    "splay": ColecaoSplay,
+}
+
+
+# -------------------
+# COLEÇÃO ADAPTATIVA
+# -------------------
+class ColecaoAdaptativa(ColecaoOrdenada):
+    """
+    Começa como ListaOrdenada e troca de backend conforme a carga.
+    A cada `janela` operações compara o custo estimado das escritas e leituras da
+    janela na lista (deslocamentos proporcionais ao tamanho) e na árvore; a economia
+    do outro backend se acumula entre janelas (e zera quando deixa de existir) e a
+    migração, O(n), só acontece quando a economia acumulada já pagou o custo dela.
+    Assim listas pequenas ou de leitura nunca migram e cargas alternadas não oscilam.
+    """
+    nome = "adaptativa"
+
+    def __init__(self, chaves=(), arvore=ColecaoArvoreAVL, janela=JANELA):
+        self.backend = ListaOrdenada()
+        self.tipo_arvore = arvore
+        self.janela = janela
+        self.migracoes = 0
+        self._escritas = self._leituras = 0
+        self._saldo_ns = 0.0
+        super().__init__(chaves)
+
+    @property
+    def em_arvore(self):
+        return not isinstance(self.backend, ListaOrdenada)
+
+    def _carregar(self, chaves):
+        self.backend = ListaOrdenada.construir(chaves)
+
+    # -------------------
+    # MEDIÇÃO E MIGRAÇÃO
+    # -------------------
+    def _contar(self, escrita):
+        if escrita:
+            self._escritas += 1
+        else:
+            self._leituras += 1
+        if self._escritas + self._leituras >= self.janela:
+            self._avaliar()
+
+    def _avaliar(self):
+        n = len(self)
+        escritas, leituras = self._escritas, self._leituras
+        self._escritas = self._leituras = 0
+        custo_lista = escritas * (LISTA_ESCRITA_NS + n * LISTA_NS_POR_POSICAO / 2) + leituras * LISTA_LEITURA_NS
+        custo_arvore = escritas * ARVORE_ESCRITA_NS + leituras * ARVORE_LEITURA_NS
+        if self.em_arvore:
+            economia, custo_migracao = custo_arvore - custo_lista, n * MIGRACAO_LISTA_NS_POR_CHAVE
+        else:
+            economia, custo_migracao = custo_lista - custo_arvore, n * MIGRACAO_ARVORE_NS_POR_CHAVE
+        self._saldo_ns = max(0.0, self._saldo_ns + economia)
+        if self._saldo_ns > custo_migracao:
+            self._migrar()
+
+    def _migrar(self):
+        destino = ListaOrdenada if self.em_arvore else self.tipo_arvore
+        self.backend = destino.construir(list(self.backend))
+        self.migracoes += 1
+        self._saldo_ns = 0.0
+
+    # -------------------
+    # OPERAÇÕES (delegadas ao backend atual)
+    # -------------------
+    def _inserir_chave(self, chave):
+        self._contar(True)
+        return self.backend.inserir(chave)
+
+    def _remover_chave(self, chave):
+        self._contar(True)
+        return self.backend.remover(chave)
+
+    def contem(self, chave):
+        self._contar(False)
+        return self.backend.contem(chave)
+
+    def intervalo(self, inicio, fim):
+        self._contar(False)
+        return self.backend.intervalo(inicio, fim)
+
+    def minimo(self):
+        return self.backend.minimo()
+
+    def maximo(self):
+        return self.backend.maximo()
+
+    def __iter__(self):
+        return iter(self.backend)
+
+    def __repr__(self):
+        return f"ColecaoAdaptativa({len(self)} chaves, {self.backend.nome})"
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    import random
+
+    chaves = random.sample(range(1000), 20)
+    for tipo in (*BACKENDS.values(), ColecaoAdaptativa):
+        colecao = tipo(chaves)
+        colecao.remover(chaves[0])
+        colecao[500] = "quinhentos"
+        print(f"{tipo.nome:>12}: {len(colecao)} chaves, mínimo {colecao.minimo()}, máximo {colecao.maximo()}, "
+              f"[200, 600] = {colecao.intervalo(200, 600)}, [500] = {colecao[500]!r}")
+
+    adaptativa = ColecaoAdaptativa()
+    for chave in random.sample(range(10 ** 7), 200_000):
+        adaptativa.inserir(chave)
+    print(f"Após 200 mil inserções: {adaptativa} ({adaptativa.migracoes} migração(ões))")
+    for chave in random.sample(range(10 ** 7), 200_000):
+        adaptativa.contem(chave)
+    print(f"Após 200 mil buscas: {adaptativa} ({adaptativa.migracoes} migração(ões))")
@@ -0,0 +1,220 @@
+"""
+Índice de alcance do labirinto (componentes conexos das células livres)
+
+- Construção por varredura de linhas: as sequências de células livres de cada
+  linha (encontradas com regex, em C) viram um rótulo cada, e rótulos de linhas
+  vizinhas que se sobrepõem são unidos com union-find
+- "E é alcançável a partir de S?" vira a comparação de duas raízes (O(α(n)))
+- Edições incrementais:
+    * parede removida: a célula ganha um rótulo e é unida aos vizinhos livres
+    * parede adicionada: pode dividir um componente; buscas simultâneas a partir
+      dos vizinhos da nova parede param assim que se encontram, e só as regiões
+      que ficaram isoladas (as menores, esgotadas primeiro) recebem rótulo novo
+"""
+
+import re
+from array import array
+from collections import deque
+
+from labirinto import LIVRE, PAREDE, _validar_extremos, vetor_int32
+
+_SEQUENCIA_LIVRE = re.compile(re.escape(bytes([LIVRE])) + b"+")
+
+
+class IndiceAlcance:
+    """
+    Componentes conexos (4-vizinhança) das células livres de uma GradeLabirinto.
+
+    - rotulo: array('i') por célula (-1 = parede); o componente é a raiz do rótulo no union-find
+    - pai: union-find dos rótulos (lista; cresce quando um componente é dividido)
+    Depois de mudar uma célula da grade, chame atualizar_celula(r, c).
+    """
+    def __init__(self, grade):
+        self.grade = grade
+        self.reconstruir()
+
+    # -------------------
+    # CONSTRUÇÃO
+    # -------------------
+    def reconstruir(self):
+        grade = self.grade
+        linhas, colunas, celulas = grade.linhas, grade.colunas, grade.celulas
+        rotulo = vetor_int32(linhas * colunas)
+        pai = []
+        self.rotulo, self.pai = rotulo, pai
+        unioes = 0
+        anteriores = []  # sequências (início, fim, rótulo) da linha de cima
+        for r in range(linhas):
+            base = r * colunas
+            atuais = []
+            j = 0
+            for m in _SEQUENCIA_LIVRE.finditer(celulas, base, base + colunas):
+                a, b = m.start() - base, m.end() - base
+                ident = len(pai)
+                pai.append(ident)
+                rotulo[base + a:base + b] = array('i', [ident]) * (b - a)
+                # sequências de cima que terminam antes desta não tocam as próximas
+                while j < len(anteriores) and anteriores[j][1] <= a:
+                    j += 1
+                k = j
+                while k < len(anteriores) and anteriores[k][0] < b:
+                    if self._unir(ident, anteriores[k][2]):
+                        unioes += 1
+                    k += 1
+                atuais.append((a, b, ident))
+            anteriores = atuais
+        self.quantidade_componentes = len(pai) - unioes
+
+    # -------------------
+    # UNION-FIND
+    # -------------------
+    def _raiz(self, x):
+        pai = self.pai
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]  # path halving
+            x = pai[x]
+        return x
+
+    def _unir(self, a, b):
+        a, b = self._raiz(a), self._raiz(b)
+        if a == b:
+            return False
+        # o rótulo mais novo aponta para o mais antigo
+        if a < b:
+            a, b = b, a
+        self.pai[a] = b
+        return True
+
+    def _novo_rotulo(self):
+        ident = len(self.pai)
+        self.pai.append(ident)
+        return ident
+
+    # -------------------
+    # CONSULTAS
+    # -------------------
+    def componente(self, r, c):
+        """Identificador do componente da célula (-1 para parede)."""
+        ident = self.rotulo[self.grade.indice(r, c)]
+        return -1 if ident == -1 else self._raiz(ident)
+
+    def alcancavel(self, origem=None, destino=None):
+        """True se existe caminho entre as duas posições (padrão: S e E da grade)."""
+        origem, destino = _validar_extremos(self.grade, origem, destino)
+        if destino is None:
+            raise ValueError("Posição de fim (E) não definida.")
+        a = self.componente(*origem)
+        return a != -1 and a == self.componente(*destino)
+
+    # -------------------
+    # ATUALIZAÇÃO INCREMENTAL
+    # -------------------
+    def _vizinhos_livres(self, u):
+        grade = self.grade
+        colunas, celulas = grade.colunas, grade.celulas
+        r, c = divmod(u, colunas)
+        if r > 0 and celulas[u - colunas] != PAREDE:
+            yield u - colunas
+        if r < grade.linhas - 1 and celulas[u + colunas] != PAREDE:
+            yield u + colunas
+        if c > 0 and celulas[u - 1] != PAREDE:
+            yield u - 1
+        if c < colunas - 1 and celulas[u + 1] != PAREDE:
+            yield u + 1
+
+    def atualizar_celula(self, r, c):
+        """Chame depois de mudar a célula (r, c) na grade (parede <-> caminho)."""
+        u = self.grade.indice(r, c)
+        parede = self.grade.celulas[u] == PAREDE
+        if parede == (self.rotulo[u] == -1):
+            return  # nada mudou para o índice
+        if parede:
+            self.rotulo[u] = -1
+            self._dividir(u)
+        else:
+            self.rotulo[u] = self._novo_rotulo()
+            self.quantidade_componentes += 1
+            for v in self._vizinhos_livres(u):
+                if self._unir(self.rotulo[u], self.rotulo[v]):
+                    self.quantidade_componentes -= 1
+
+    def _dividir(self, parede):
+        """
+        Religa o componente depois que `parede` foi fechada.
+        Uma busca em largura por vizinho livre, intercaladas: buscas que se
+        encontram viram um grupo; um grupo cuja fila esvazia é uma região isolada
+        e ganha rótulo novo. Para quando resta um só grupo (que mantém o rótulo antigo).
+        """
+        inicios = list(self._vizinhos_livres(parede))
+        if not inicios:
+            self.quantidade_componentes -= 1  # a célula era um componente sozinha
+            return
+        if len(inicios) == 1:
+            return  # tirar uma ponta não desconecta nada
+        rotulo = self.rotulo
+        vizinhos = self._vizinhos_livres
+        dono = {v: i for i, v in enumerate(inicios)}
+        grupo = list(range(len(inicios)))
+        filas = [deque([v]) for v in inicios]
+        visitadas = [[v] for v in inicios]
+        ativos = set(range(len(inicios)))
+
+        def raiz(i):
+            while grupo[i] != i:
+                i = grupo[i]
+            return i
+
+        while len(ativos) > 1:
+            for i in list(ativos):
+                if i not in ativos:
+                    continue  # absorvido por outro grupo nesta rodada
+                fila = filas[i]
+                if not fila:
+                    # região isolada: componente novo
+                    novo = self._novo_rotulo()
+                    for celula in visitadas[i]:
+                        rotulo[celula] = novo
+                    self.quantidade_componentes += 1
+                    ativos.discard(i)
+                    if len(ativos) == 1:
+                        break
+                    continue
+                atual = fila.popleft()
+                for v in vizinhos(atual):
+                    d = dono.get(v)
+                    if d is None:
+                        dono[v] = i
+                        visitadas[i].append(v)
+                        fila.append(v)
+                        continue
+                    j = raiz(d)
+                    if j != i:
+                        # as buscas se encontraram: o grupo j passa a fazer parte de i
+                        grupo[j] = i
+                        fila.extend(filas[j])
+                        visitadas[i].extend(visitadas[j])
+                        filas[j] = visitadas[j] = None
+                        ativos.discard(j)
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    from labirinto import GradeLabirinto
+
+    grade = GradeLabirinto.de_texto([
+        "S   #     ",
+        " ## # ### ",
+        "  #   #   ",
+        "# ##### # ",
+        "        #E",
+    ])
+    indice = IndiceAlcance(grade)
+    print("Componentes:", indice.quantidade_componentes, "| S alcança E:", indice.alcancavel())
+    grade.definir_parede(3, 9)
+    indice.atualizar_celula(3, 9)
+    print("Parede em (3, 9):", indice.quantidade_componentes, "| S alcança E:", indice.alcancavel())
+    grade.definir_parede(3, 9, False)
+    indice.atualizar_celula(3, 9)
+    print("Parede (3, 9) removida:", indice.quantidade_componentes, "| S alcança E:", indice.alcancavel())
@@ -0,0 +1,90 @@
+"""
+Pacote com as árvores e o labirinto/grafos, para uso como biblioteca
+
+- Importar o pacote não importa nenhum módulo: cada nome é carregado na primeira
+  vez que é acessado (PEP 562), então `from estruturas import ArvoreAVL` só paga
+  pelo módulo da AVL
+- Nenhum módulo tem efeitos colaterais ao ser importado (as demonstrações ficam em
+  `if __name__ == "__main__"`); Graphviz só é carregado ao desenhar uma árvore e
+  Tkinter só ao abrir o editor
+- Limitação: o pacote é só uma fachada. Os módulos continuam na raiz do repositório
+  (atividade_5.py, labirinto.py, ...) e são importados pelo nome de topo, então a
+  raiz precisa estar no sys.path (rodar a partir dela ou PYTHONPATH); o pacote não
+  pode ser instalado nem copiado sozinho para outro projeto
+
+Uso:
+    from estruturas import ArvoreAVL, GradeLabirinto, buscar
+    arvore = ArvoreAVL()
+    arvore.inserir(10)
+"""
+
+import importlib
+
+# nome exportado -> (módulo, atributo)
+_EXPORTS = {
+    # árvores de expressão (atividade 1)
+    "NoExpressao": ("atividade_1", "Node"),
+    "parse_expression": ("atividade_1", "parse_expression"),
+    "evaluate": ("atividade_1", "evaluate"),
+    "AvaliadorIncremental": ("atividade_1", "AvaliadorIncremental"),
+    "draw_tree": ("atividade_1", "draw_tree"),
+    # árvores de busca (atividades 2 a 5)
+    "BinarySearchTree": ("atividade_2", "BinarySearchTree"),
+    "BinarySearchTreePercursos": ("atividade_3", "BinarySearchTree"),
+    "AVLTree": ("atividade_4", "AVLTree"),
+    "ArvoreAVL": ("atividade_5", "ArvoreAVL"),
+    "No": ("atividade_5", "No"),
+    "ArvoreSplay": ("arvore_splay", "ArvoreSplay"),
+    # coleção ordenada com interface única sobre as árvores
+    "ColecaoOrdenada": ("colecao_ordenada", "ColecaoOrdenada"),
+    "ListaOrdenada": ("colecao_ordenada", "ListaOrdenada"),
+    "ColecaoBST": ("colecao_ordenada", "ColecaoBST"),
+    "ColecaoAVLTree": ("colecao_ordenada", "ColecaoAVLTree"),
+    "ColecaoArvoreAVL": ("colecao_ordenada", "ColecaoArvoreAVL"),
+    "ColecaoBlocos": ("colecao_ordenada", "ColecaoBlocos"),
+    "ColecaoSplay": ("colecao_ordenada", "ColecaoSplay"),
+    "ColecaoAdaptativa": ("colecao_ordenada", "ColecaoAdaptativa"),
+    "ListaBlocos": ("lista_blocos", "ListaBlocos"),
+    "MapaFragmentado": ("mapa_fragmentado", "MapaFragmentado"),
+    # labirinto e buscas
+    "GradeLabirinto": ("labirinto", "GradeLabirinto"),
+    "ResultadoBusca": ("labirinto", "ResultadoBusca"),
+    "buscar": ("labirinto", "buscar"),
+    "gerar": ("gerador_labirinto", "gerar"),
+    "salvar": ("arquivo_labirinto", "salvar"),
+    "carregar": ("arquivo_labirinto", "carregar"),
+    "IndiceAlcance": ("componentes_labirinto", "IndiceAlcance"),
+    "PlanejadorIncremental": ("replanejamento", "PlanejadorIncremental"),
+    "AbstracaoHPA": ("hpa_labirinto", "AbstracaoHPA"),
+    "resolver_lote": ("lote_labirinto", "resolver_lote"),
+    # grafos gerais
+    "GrafoCSR": ("grafo_csr", "GrafoCSR"),
+    "carregar_lista_arestas": ("grafo_csr", "carregar_lista_arestas"),
+    "bfs_niveis": ("grafo_csr", "bfs_niveis"),
+    "bfs_multiplas_origens": ("multiplas_origens", "bfs_multiplas_origens"),
+    # interface gráfica (Tkinter só é carregado ao criar o editor)
+    "MazeEditorGUI": ("grafos", "MazeEditorGUI"),
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(nome):
+    try:
+        modulo, atributo = _EXPORTS[nome]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}") from None
+    try:
+        carregado = importlib.import_module(modulo)
+    except ModuleNotFoundError as e:
+        if e.name != modulo:
+            raise
+        raise ImportError(f"{__name__}.{nome} vem do módulo {modulo!r} da raiz do repositório, que não está "
+                          f"no sys.path (rode a partir da raiz ou inclua-a no PYTHONPATH).", name=modulo) from e
+    valor = getattr(carregado, atributo)
+    globals()[nome] = valor  # próximos acessos não passam mais por aqui
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
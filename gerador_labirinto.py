@@ -0,0 +1,228 @@
+"""
+Geradores procedurais de labirintos (reprodutíveis por semente)
+
+Geradores:
+- backtracker: busca em profundidade aleatória, iterativa (sem limite de recursão)
+- prim: Prim aleatório sobre as paredes da fronteira
+- kruskal: Kruskal aleatório com union-find (compressão por "path halving" + união por tamanho)
+- densidade: campo de obstáculos aleatórios com a densidade pedida
+
+Os três primeiros geram labirintos perfeitos: salas nas coordenadas ímpares
+(2i+1, 2j+1) e paredes entre elas; existe exatamente um caminho entre duas salas.
+Todos escrevem direto na grade compacta (GradeLabirinto) e definem S e E.
+"""
+
+import random
+from array import array
+
+from labirinto import LIVRE, PAREDE, GradeLabirinto
+
+
+# -------------------
+# AUXILIARES
+# -------------------
+def _grade_de_salas(linhas, colunas):
+    """
+    Grade toda de paredes com as salas (coordenadas ímpares) já abertas.
+    As salas são abertas por fatiamento com passo 2 (uma operação por linha).
+    """
+    if linhas < 3 or colunas < 3:
+        raise ValueError("Labirintos perfeitos precisam de pelo menos 3x3 células.")
+    celulas = bytearray([PAREDE]) * (linhas * colunas)
+    h, w = (linhas - 1) // 2, (colunas - 1) // 2
+    livre = bytes([LIVRE]) * w
+    for i in range(h):
+        base = (2 * i + 1) * colunas + 1
+        celulas[base:base + 2 * w:2] = livre
+    return celulas, h, w
+
+
+def _finalizar_perfeito(linhas, colunas, celulas, h, w):
+    # S na primeira sala, E na última (canto oposto)
+    return GradeLabirinto(linhas, colunas, celulas, (1, 1), (2 * h - 1, 2 * w - 1))
+
+
+def _salas_da_parede(parede, colunas, w):
+    """As duas salas (índices) separadas por uma célula de parede."""
+    r, c = divmod(parede, colunas)
+    if r & 1:
+        # parede horizontal entre (i, j) e (i, j + 1)
+        a = (r >> 1) * w + ((c - 1) >> 1)
+        return a, a + 1
+    # parede vertical entre (i, j) e (i + 1, j)
+    a = ((r - 1) >> 1) * w + (c >> 1)
+    return a, a + w
+
+
+# -------------------
+# BACKTRACKER (DFS ITERATIVA)
+# -------------------
+def gerar_backtracker(linhas, colunas, semente=None):
+    celulas, h, w = _grade_de_salas(linhas, colunas)
+    rnd = random.Random(semente)
+    aleatorio = rnd.random
+    visitada = bytearray(h * w)
+    inicial = rnd.randrange(h * w)
+    visitada[inicial] = 1
+    pilha = [inicial]
+    opcoes = []
+    while pilha:
+        k = pilha[-1]
+        i, j = divmod(k, w)
+        celula = (2 * i + 1) * colunas + 2 * j + 1
+        opcoes.clear()
+        # (sala vizinha, deslocamento da parede em relação à célula da sala)
+        if i > 0 and not visitada[k - w]:
+            opcoes.append((k - w, -colunas))
+        if i < h - 1 and not visitada[k + w]:
+            opcoes.append((k + w, colunas))
+        if j > 0 and not visitada[k - 1]:
+            opcoes.append((k - 1, -1))
+        if j < w - 1 and not visitada[k + 1]:
+            opcoes.append((k + 1, 1))
+        if not opcoes:
+            pilha.pop()
+            continue
+        v, desloc = opcoes[int(aleatorio() * len(opcoes))]
+        visitada[v] = 1
+        celulas[celula + desloc] = LIVRE
+        pilha.append(v)
+    return _finalizar_perfeito(linhas, colunas, celulas, h, w)
+
+
+# -------------------
+# PRIM ALEATÓRIO
+# -------------------
+def gerar_prim(linhas, colunas, semente=None):
+    celulas, h, w = _grade_de_salas(linhas, colunas)
+    rnd = random.Random(semente)
+    aleatorio = rnd.random
+    visitada = bytearray(h * w)
+    fronteira = []  # células de parede entre uma sala visitada e outra (talvez) não
+
+    def visitar(k):
+        visitada[k] = 1
+        i, j = divmod(k, w)
+        celula = (2 * i + 1) * colunas + 2 * j + 1
+        if i > 0 and not visitada[k - w]:
+            fronteira.append(celula - colunas)
+        if i < h - 1 and not visitada[k + w]:
+            fronteira.append(celula + colunas)
+        if j > 0 and not visitada[k - 1]:
+            fronteira.append(celula - 1)
+        if j < w - 1 and not visitada[k + 1]:
+            fronteira.append(celula + 1)
+
+    visitar(rnd.randrange(h * w))
+    while fronteira:
+        # escolhe uma parede aleatória e remove em O(1) trocando com a última
+        idx = int(aleatorio() * len(fronteira))
+        fronteira[idx], fronteira[-1] = fronteira[-1], fronteira[idx]
+        parede = fronteira.pop()
+        a, b = _salas_da_parede(parede, colunas, w)
+        if visitada[a] and visitada[b]:
+            continue
+        celulas[parede] = LIVRE
+        visitar(b if visitada[a] else a)
+    return _finalizar_perfeito(linhas, colunas, celulas, h, w)
+
+
+# -------------------
+# KRUSKAL ALEATÓRIO (UNION-FIND)
+# -------------------
+def gerar_kruskal(linhas, colunas, semente=None):
+    celulas, h, w = _grade_de_salas(linhas, colunas)
+    rnd = random.Random(semente)
+    # todas as paredes internas entre salas, em ordem aleatória
+    paredes = array('i')
+    for i in range(h):
+        base = (2 * i + 1) * colunas
+        paredes.extend(range(base + 2, base + 2 * w, 2))          # horizontais
+        if i < h - 1:
+            base_v = (2 * i + 2) * colunas
+            paredes.extend(range(base_v + 1, base_v + 2 * w, 2))  # verticais
+    rnd.shuffle(paredes)
+
+    # listas (e não array) porque o laço abaixo é dominado por leituras de pai[]
+    pai = list(range(h * w))
+    tamanho = [1] * (h * w)
+    restantes = h * w - 1
+    for parede in paredes:
+        # salas separadas pela parede (mesma conta de _salas_da_parede, em linha por desempenho)
+        r, c = divmod(parede, colunas)
+        if r & 1:
+            a = (r >> 1) * w + ((c - 1) >> 1)
+            b = a + 1
+        else:
+            a = ((r - 1) >> 1) * w + (c >> 1)
+            b = a + w
+        while pai[a] != a:
+            pai[a] = pai[pai[a]]
+            a = pai[a]
+        while pai[b] != b:
+            pai[b] = pai[pai[b]]
+            b = pai[b]
+        if a == b:
+            continue
+        if tamanho[a] < tamanho[b]:
+            a, b = b, a
+        pai[b] = a
+        tamanho[a] += tamanho[b]
+        celulas[parede] = LIVRE
+        restantes -= 1
+        if restantes == 0:
+            break
+    return _finalizar_perfeito(linhas, colunas, celulas, h, w)
+
+
+# -------------------
+# CAMPO DE DENSIDADE
+# -------------------
+def gerar_densidade(linhas, colunas, densidade=0.3, semente=None):
+    """
+    Cada célula vira parede com probabilidade `densidade`.
+    Bytes aleatórios são convertidos em paredes com bytes.translate (sem laço em Python).
+    S fica na primeira célula livre e E na última; a conexão entre eles não é garantida.
+    """
+    if not 0.0 <= densidade <= 1.0:
+        raise ValueError("A densidade deve estar entre 0 e 1.")
+    rnd = random.Random(semente)
+    limite = round(densidade * 256)
+    tabela = bytes(PAREDE if b < limite else LIVRE for b in range(256))
+    celulas = bytearray(rnd.randbytes(linhas * colunas).translate(tabela))
+    grade = GradeLabirinto(linhas, colunas, celulas)
+    livre = bytes([LIVRE])
+    primeira, ultima = celulas.find(livre), celulas.rfind(livre)
+    if primeira != -1:
+        grade.inicio = grade.posicao(primeira)
+        if ultima != primeira:
+            grade.fim = grade.posicao(ultima)
+    return grade
+
+
+# -------------------
+# SELEÇÃO DE GERADOR
+# -------------------
+GERADORES = {
+    "backtracker": gerar_backtracker,
+    "prim": gerar_prim,
+    "kruskal": gerar_kruskal,
+    "densidade": gerar_densidade,
+}
+
+
+def gerar(tipo, linhas, colunas, semente=None, **opcoes):
+    """Gera um labirinto pelo nome do gerador (chaves de GERADORES)."""
+    if tipo not in GERADORES:
+        raise ValueError(f"Gerador desconhecido: {tipo!r}. Opções: {', '.join(GERADORES)}.")
+    return GERADORES[tipo](linhas, colunas, semente=semente, **opcoes)
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    for nome in GERADORES:
+        grade = gerar(nome, 11, 31, semente=1)
+        print(f"--- {nome} ---")
+        print("\n".join(grade.para_texto()))
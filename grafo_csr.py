@@ -0,0 +1,271 @@
+"""
+Grafo geral em formato CSR (compressed sparse row) e BFS por níveis
+
+- deslocamentos[u]:deslocamentos[u + 1] é o trecho de destinos com os vizinhos de u
+  (n + 1 deslocamentos int64 e m destinos int32, sem um objeto Python por aresta)
+- Montagem a partir de pares (origem, destino) por contagem (ordenação estável por origem)
+- Leitura de listas de arestas em texto ("u v" por linha, com colunas extras ignoradas
+  e comentários iniciados por '#' ou '%', como nos arquivos do SNAP/MatrixMarket)
+- BFS síncrona por níveis: a fronteira inteira é expandida de uma vez com operações
+  de vetor do NumPy (gather das listas de adjacência, filtro dos não visitados,
+  deduplicação); sem NumPy, o mesmo algoritmo por níveis em Python puro
+- Labirintos (GradeLabirinto) também podem ser convertidos para CSR
+
+Os vértices são inteiros 0..n-1 (n = maior identificador + 1 quando não informado).
+Com NumPy os vetores são numpy.ndarray; sem ele, array('q') / array('i').
+
+Uso:
+    grafo = carregar_lista_arestas("roadNet-PA.txt", direcionado=False)
+    distancias, pais = bfs_niveis(grafo, 0)
+    print(caminho_ate(pais, 12345, 0))
+"""
+
+import re
+import time
+from array import array
+
+from labirinto import PAREDE
+
+try:
+    import numpy
+except ImportError:  # NumPy é opcional; sem ele usamos os caminhos em Python puro
+    numpy = None
+
+_COMENTARIOS = (b"#", b"%")
+_PRIMEIRA_LINHA = re.compile(rb"\S[^\n]*")
+
+
+class GrafoCSR:
+    """Grafo direcionado em CSR (arestas não direcionadas são guardadas nos dois sentidos)."""
+    def __init__(self, n, deslocamentos, destinos):
+        if len(deslocamentos) != n + 1:
+            raise ValueError(f"Esperados {n + 1} deslocamentos, recebeu {len(deslocamentos)}.")
+        self.n = n
+        self.deslocamentos = deslocamentos
+        self.destinos = destinos
+
+    @property
+    def quantidade_arestas(self):
+        return len(self.destinos)
+
+    def grau(self, u):
+        return int(self.deslocamentos[u + 1] - self.deslocamentos[u])
+
+    def vizinhos(self, u):
+        return self.destinos[self.deslocamentos[u]:self.deslocamentos[u + 1]]
+
+    def __repr__(self):
+        return f"GrafoCSR(n={self.n}, arestas={self.quantidade_arestas})"
+
+    # -------------------
+    # CONSTRUÇÃO
+    # -------------------
+    @classmethod
+    def de_arestas(cls, origens, destinos, n=None, direcionado=True):
+        """Monta o grafo a partir de duas sequências paralelas de vértices."""
+        if len(origens) != len(destinos):
+            raise ValueError("Origens e destinos com tamanhos diferentes.")
+        if numpy is not None:
+            origens = numpy.asarray(origens, dtype=numpy.int64)
+            destinos = numpy.asarray(destinos, dtype=numpy.int64)
+            if not direcionado:
+                origens, destinos = numpy.concatenate((origens, destinos)), numpy.concatenate((destinos, origens))
+            maior = int(max(origens.max(initial=-1), destinos.max(initial=-1)))
+            if origens.size and int(min(origens.min(), destinos.min())) < 0:
+                raise ValueError("Vértices devem ser inteiros não negativos.")
+            n = _validar_n(n, maior)
+            ordem = numpy.argsort(origens, kind="stable")
+            deslocamentos = numpy.zeros(n + 1, dtype=numpy.int64)
+            numpy.cumsum(numpy.bincount(origens, minlength=n), out=deslocamentos[1:])
+            return cls(n, deslocamentos, destinos[ordem].astype(numpy.int32))
+
+        origens, destinos = array('q', origens), array('q', destinos)
+        if not direcionado:
+            origens, destinos = origens + destinos, destinos + origens
+        maior = max(max(origens, default=-1), max(destinos, default=-1))
+        if min(origens, default=0) < 0 or min(destinos, default=0) < 0:
+            raise ValueError("Vértices devem ser inteiros não negativos.")
+        n = _validar_n(n, maior)
+        # ordenação por contagem: grau -> deslocamentos -> posição de cada aresta
+        contagem = array('q', [0]) * (n + 1)
+        for u in origens:
+            contagem[u + 1] += 1
+        for u in range(n):
+            contagem[u + 1] += contagem[u]
+        deslocamentos = array('q', contagem)
+        saida = array('i', [0]) * len(destinos)
+        proxima = contagem
+        for u, v in zip(origens, destinos):
+            saida[proxima[u]] = v
+            proxima[u] += 1
+        return cls(n, deslocamentos, saida)
+
+    @classmethod
+    def de_grade(cls, grade):
+        """Grafo 4-conexo das células livres (vértice = r * colunas + c; paredes ficam isoladas)."""
+        linhas, colunas = grade.linhas, grade.colunas
+        if numpy is not None:
+            livre = numpy.frombuffer(bytes(grade.celulas), dtype=numpy.uint8).reshape(linhas, colunas) != PAREDE
+            indices = numpy.arange(linhas * colunas, dtype=numpy.int64).reshape(linhas, colunas)
+            # pares de células livres vizinhas na horizontal e na vertical (cada um nos dois sentidos)
+            h = livre[:, :-1] & livre[:, 1:]
+            v = livre[:-1, :] & livre[1:, :]
+            origens = numpy.concatenate((indices[:, :-1][h], indices[:-1, :][v]))
+            destinos = numpy.concatenate((indices[:, 1:][h], indices[1:, :][v]))
+            return cls.de_arestas(origens, destinos, n=linhas * colunas, direcionado=False)
+        deslocamentos = array('q', [0])
+        destinos = array('i')
+        celulas = grade.celulas
+        for u in range(linhas * colunas):
+            if celulas[u] != PAREDE:
+                destinos.extend(grade.vizinhos(u))
+            deslocamentos.append(len(destinos))
+        return cls(linhas * colunas, deslocamentos, destinos)
+
+
+def _validar_n(n, maior):
+    if n is None:
+        return maior + 1
+    if maior >= n:
+        raise ValueError(f"Vértice {maior} fora do intervalo 0..{n - 1}.")
+    return n
+
+
+# -------------------
+# LEITURA DE LISTA DE ARESTAS
+# -------------------
+def _sem_comentarios(dados):
+    if not any(marca in dados for marca in _COMENTARIOS):
+        return dados
+    return b"\n".join(linha for linha in dados.splitlines() if not linha.lstrip().startswith(_COMENTARIOS))
+
+
+def ler_lista_arestas(conteudo, n=None, direcionado=True):
+    """Cria o grafo a partir do conteúdo (str ou bytes) de uma lista de arestas."""
+    if isinstance(conteudo, str):
+        conteudo = conteudo.encode("ascii")
+    dados = _sem_comentarios(conteudo)
+    # a primeira linha com conteúdo define quantas colunas cada aresta tem
+    m = _PRIMEIRA_LINHA.search(dados)
+    colunas = len(m.group().split()) if m else 0
+    if colunas == 0:
+        return GrafoCSR.de_arestas([], [], n=n or 0, direcionado=direcionado)
+    if colunas < 2:
+        raise ValueError("Cada linha deve ter ao menos dois vértices (origem destino).")
+    if numpy is not None:
+        # um único passo em C: todos os números do arquivo (qualquer espaço em branco separa)
+        valores = numpy.fromstring(dados, dtype=numpy.int64, sep=" ")
+    else:
+        valores = array('q', map(int, dados.split()))
+    if len(valores) % colunas:
+        raise ValueError(f"Linhas com quantidades diferentes de colunas (esperadas {colunas}).")
+    return GrafoCSR.de_arestas(valores[0::colunas], valores[1::colunas], n=n, direcionado=direcionado)
+
+
+def carregar_lista_arestas(caminho, n=None, direcionado=True):
+    with open(caminho, "rb") as f:
+        return ler_lista_arestas(f.read(), n=n, direcionado=direcionado)
+
+
+# -------------------
+# BFS POR NÍVEIS
+# -------------------
+def bfs_niveis(grafo, origem):
+    """
+    BFS a partir de origem, uma fronteira (nível) por iteração.
+    Cada nível custa algumas chamadas do NumPy: ótimo para grafos de diâmetro
+    pequeno e fronteiras largas; corredores longos (labirintos perfeitos) têm
+    milhares de níveis de poucos vértices e andam mais rápido na BFS da grade.
+    Retorna (distancias, pais): -1 para vértices não alcançados; pais[origem] = -1.
+    """
+    if not 0 <= origem < grafo.n:
+        raise ValueError(f"Origem {origem} fora do intervalo 0..{grafo.n - 1}.")
+    if numpy is None:
+        return _bfs_niveis_python(grafo, origem)
+    deslocamentos = numpy.asarray(grafo.deslocamentos)
+    destinos = numpy.asarray(grafo.destinos)
+    distancias = numpy.full(grafo.n, -1, dtype=numpy.int32)
+    pais = numpy.full(grafo.n, -1, dtype=numpy.int32)
+    distancias[origem] = 0
+    fronteira = numpy.array([origem], dtype=numpy.int64)
+    nivel = 0
+    while fronteira.size:
+        nivel += 1
+        inicios = deslocamentos[fronteira]
+        graus = deslocamentos[fronteira + 1] - inicios
+        total = int(graus.sum())
+        if total == 0:
+            break
+        # posição de cada aresta da fronteira em destinos: início da lista do vértice
+        # + posição da aresta dentro da lista (arange menos o acumulado dos graus anteriores)
+        antes = numpy.cumsum(graus) - graus
+        posicoes = numpy.repeat(inicios - antes, graus) + numpy.arange(total)
+        vizinhos = destinos[posicoes]
+        novos = distancias[vizinhos] < 0
+        vizinhos = vizinhos[novos]
+        if not vizinhos.size:
+            break
+        de = numpy.repeat(fronteira, graus)[novos]
+        # um vértice descoberto por várias arestas fica com o primeiro pai da fronteira
+        vizinhos, primeiro = numpy.unique(vizinhos, return_index=True)
+        distancias[vizinhos] = nivel
+        pais[vizinhos] = de[primeiro]
+        fronteira = vizinhos.astype(numpy.int64)
+    return distancias, pais
+
+
+def _bfs_niveis_python(grafo, origem):
+    deslocamentos, destinos = grafo.deslocamentos, grafo.destinos
+    distancias = array('i', [-1]) * grafo.n
+    pais = array('i', [-1]) * grafo.n
+    distancias[origem] = 0
+    fronteira = [origem]
+    nivel = 0
+    while fronteira:
+        nivel += 1
+        proxima = []
+        for u in fronteira:
+            for v in destinos[deslocamentos[u]:deslocamentos[u + 1]]:
+                if distancias[v] < 0:
+                    distancias[v] = nivel
+                    pais[v] = u
+                    proxima.append(v)
+        fronteira = proxima
+    return distancias, pais
+
+
+def caminho_ate(pais, destino, origem):
+    """
+    Vértices da origem da BFS até destino seguindo pais ([] se destino não foi alcançado).
+    A origem é obrigatória: ela e os vértices não alcançados têm pai -1.
+    """
+    caminho = [destino]
+    while pais[caminho[-1]] != -1:
+        caminho.append(int(pais[caminho[-1]]))
+    if caminho[-1] != origem:
+        return []
+    caminho.reverse()
+    return caminho
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    import sys
+
+    from gerador_labirinto import gerar
+
+    if len(sys.argv) > 1:
+        t0 = time.perf_counter()
+        grafo = carregar_lista_arestas(sys.argv[1], direcionado="--dirigido" in sys.argv)
+        print(f"{grafo} carregado em {(time.perf_counter() - t0) * 1000:.0f} ms")
+    else:
+        grade = gerar("backtracker", 501, 501, semente=1)
+        grafo = GrafoCSR.de_grade(grade)
+        print(f"Labirinto 501x501 como {grafo}")
+    t0 = time.perf_counter()
+    distancias, pais = bfs_niveis(grafo, 0 if len(sys.argv) > 1 else grade.indice(*grade.inicio))
+    alcancados = sum(1 for d in distancias if d >= 0)
+    print(f"BFS por níveis ({'NumPy' if numpy is not None else 'Python puro'}): {alcancados} vértices "
+          f"alcançados, excentricidade {max(distancias)}, {(time.perf_counter() - t0) * 1000:.0f} ms")
@@ -2,28 +2,445 @@
 Maze Editor + BFS Solver (Tkinter)
 
 Funcionalidades:
-- Modo Edição com ferramentas: Parede (#), Caminho ( ), Início (S), Fim (E)
-- Clique e arraste para desenhar
-- Modo Simulação: busca BFS animada com .after()
+- Modo Edição com ferramentas: Parede (#), Caminho ( ), Terreno (custo 2..9), Início (S), Fim (E)
+- Clique e arraste para desenhar: os eventos de movimento são acumulados e aplicados
+  uma vez por quadro, com as células entre dois pontos preenchidas (linha de Bresenham)
+- Desfazer/refazer por traço (historico_labirinto.py): Ctrl+Z / Ctrl+Y
+- Modo Simulação: busca (BFS, A*, BFS bidirecional, JPS ou Dijkstra) feita pelo solver
+  headless (labirinto.py) e reproduzida com .after(): de um passo por tick até
+  quantas expansões couberem no orçamento de tempo de cada quadro
+- Busca opcionalmente fora da thread da interface (busca_segundo_plano.py): o registro
+  chega em lotes por uma fila drenada uma vez por quadro; Resetar cancela a busca
 - Reconstrução do caminho encontrado
+- Índice de alcance (componentes_labirinto.py): labirintos sem caminho de S a E
+  são rejeitados na hora, sem animar a busca
+- Caminho ao vivo: replanejamento incremental (D* Lite, replanejamento.py)
+  atualizado uma vez por quadro enquanto o labirinto é editado
 - Resetar busca (limpa somente resultados da busca)
 - Limpar labirinto (volta ao estado vazio)
+- Renderização por retângulos (grades pequenas) ou por imagem com viewport,
+  rolagem e zoom (grades grandes)
+- Geradores procedurais com semente (gerador_labirinto.py)
+- Salvar/carregar labirintos em texto ou no formato binário compacto (arquivo_labirinto.py)
+- Perfil da busca (tempo por passo, atualizações de canvas, intervalo real) exportável em CSV
+- Tkinter é importado só ao abrir o editor: o módulo pode ser importado sem display
 """
 
-import tkinter as tk
-from tkinter import messagebox
-from collections import deque
+import csv
+import time
+
+import arquivo_labirinto
+from busca_segundo_plano import BuscaEmSegundoPlano
+from componentes_labirinto import IndiceAlcance
+from gerador_labirinto import GERADORES, gerar
+from historico_labirinto import HistoricoEdicoes
+from labirinto import PAREDE, GradeLabirinto, buscar
+from replanejamento import PlanejadorIncremental
+
+# Tkinter só é carregado quando o editor é aberto (importar o módulo não exige display)
+tk = messagebox = filedialog = None
+
+
+def _carregar_tk():
+    global tk, messagebox, filedialog
+    if tk is None:
+        import tkinter
+        from tkinter import messagebox as _messagebox, filedialog as _filedialog
+        tk, messagebox, filedialog = tkinter, _messagebox, _filedialog
+
+# -------------------
+# PERFIL DA BUSCA
+# -------------------
+class PerfilBusca:
+    """
+    Coleta métricas de desempenho da busca animada.
+    Cada passo (quadro) registra quantas expansões foram reproduzidas, o tempo gasto
+    na lógica da busca, o tempo e a quantidade de atualizações do canvas e o
+    intervalo real entre ticks (comparado ao pedido).
+    """
+    CAMPOS_CSV = ("passo", "expansoes", "tempo_calculo_ms", "tempo_canvas_ms",
+                  "atualizacoes_canvas", "intervalo_pedido_ms", "intervalo_real_ms")
+
+    def __init__(self):
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.passos = []
+        self.inicio = None
+        self.fim = None
+        self.nos_expandidos = 0
+        self.tempo_busca_ms = 0.0
+        self._ultimo_tick = None
+        self._inicio_passo = None
+        self._intervalo_pedido = 0
+        self._tempo_canvas = 0.0
+        self._atualizacoes_canvas = 0
+
+    def iniciar(self, intervalo_pedido_ms):
+        self.reiniciar()
+        self.inicio = time.perf_counter()
+        self._ultimo_tick = self.inicio
+        self._intervalo_pedido = intervalo_pedido_ms
+
+    def abrir_passo(self, intervalo_pedido_ms=None):
+        if intervalo_pedido_ms is not None:
+            self._intervalo_pedido = intervalo_pedido_ms
+        agora = time.perf_counter()
+        self._intervalo_real = (agora - self._ultimo_tick) * 1000.0
+        self._ultimo_tick = agora
+        self._inicio_passo = agora
+        self._tempo_canvas = 0.0
+        self._atualizacoes_canvas = 0
+
+    def registrar_pintura(self, duracao, quantidade=1):
+        # Chamado ao descarregar as pinturas; só conta enquanto há um passo aberto
+        if self._inicio_passo is None:
+            return
+        self._tempo_canvas += duracao
+        self._atualizacoes_canvas += quantidade
+
+    def fechar_passo(self, expansoes=0):
+        if self._inicio_passo is None:
+            return
+        total = time.perf_counter() - self._inicio_passo
+        self.nos_expandidos += expansoes
+        self.passos.append((
+            len(self.passos) + 1,
+            expansoes,
+            (total - self._tempo_canvas) * 1000.0,
+            self._tempo_canvas * 1000.0,
+            self._atualizacoes_canvas,
+            self._intervalo_pedido,
+            self._intervalo_real,
+        ))
+        self._inicio_passo = None
+
+    def finalizar(self, expansoes=0):
+        self.fechar_passo(expansoes)
+        self.fim = time.perf_counter()
+
+    # -------------------
+    # RESUMO / EXPORTAÇÃO
+    # -------------------
+    def tempo_total_ms(self):
+        if self.inicio is None:
+            return 0.0
+        fim = self.fim if self.fim is not None else time.perf_counter()
+        return (fim - self.inicio) * 1000.0
+
+    def resumo(self):
+        n = len(self.passos)
+        if n == 0:
+            return "Perfil: nenhum passo registrado."
+        calc = sum(p[2] for p in self.passos)
+        canvas = sum(p[3] for p in self.passos)
+        itens = sum(p[4] for p in self.passos)
+        intervalo_medio = sum(p[6] for p in self.passos) / n
+        return (f"{self.nos_expandidos} nós expandidos em {self.tempo_total_ms():.0f} ms "
+                f"(busca {self.tempo_busca_ms:.1f} ms) | {n} quadros, {self.nos_expandidos / n:.1f} expansões/quadro | "
+                f"cálculo {calc:.1f} ms, canvas {canvas:.1f} ms ({itens / n:.1f} itens/quadro) | "
+                f"intervalo real {intervalo_medio:.1f} ms (pedido {self._intervalo_pedido} ms)")
+
+    def exportar_csv(self, caminho):
+        with open(caminho, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.CAMPOS_CSV)
+            for passo in self.passos:
+                writer.writerow([passo[0]] + [f"{v:.4f}" if isinstance(v, float) else v for v in passo[1:]])
+            writer.writerow([])
+            writer.writerow(["tempo_total_ms", f"{self.tempo_total_ms():.4f}"])
+            writer.writerow(["tempo_busca_ms", f"{self.tempo_busca_ms:.4f}"])
+            writer.writerow(["nos_expandidos", self.nos_expandidos])
+
+
+# -------------------
+# RENDERIZAÇÃO
+# -------------------
+class RenderizadorRetangulos:
+    """
+    Modo original: um retângulo do canvas por célula.
+    Simples e nítido, mas o Tk não aguenta muito além de algumas dezenas de milhares de itens.
+    """
+    def __init__(self, canvas, rows, cols, cell_size, cor_inicial, cor_grade):
+        self.canvas = canvas
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = cell_size
+        self.cor_inicial = cor_inicial
+        self.cor_grade = cor_grade
+        # IDs dos retângulos no canvas para cada célula
+        self.grid_cells = [[None for _ in range(cols)] for _ in range(rows)]
+
+    def desenhar_inicial(self):
+        for r in range(self.rows):
+            for c in range(self.cols):
+                x1 = c * self.cell_size
+                y1 = r * self.cell_size
+                x2 = x1 + self.cell_size
+                y2 = y1 + self.cell_size
+                rect_id = self.canvas.create_rectangle(x1, y1, x2, y2, fill=self.cor_inicial, outline=self.cor_grade)
+                self.grid_cells[r][c] = rect_id
+
+    def pintar(self, r, c, color):
+        self.canvas.itemconfigure(self.grid_cells[r][c], fill=color)
+        return 1
+
+    def definir_paredes(self, celulas, cor_parede):
+        """Pinta de uma vez todas as paredes de uma grade recém-carregada."""
+        parede = bytes([PAREDE])
+        i = celulas.find(parede)
+        while i != -1:
+            r, c = divmod(i, self.cols)
+            self.pintar(r, c, cor_parede)
+            i = celulas.find(parede, i + 1)
+
+    def celula_em(self, x, y):
+        c = int(x // self.cell_size)
+        r = int(y // self.cell_size)
+        if 0 <= r < self.rows and 0 <= c < self.cols:
+            return (r, c)
+        return None
+
+    def descarregar(self):
+        # itemconfigure já atualiza o canvas; nada pendente
+        return 0
+
+
+class RenderizadorImagem:
+    """
+    Desenha a grade em um único PhotoImage do tamanho da área visível (viewport).
+
+    - A cor de cada célula fica em um bytearray (índice numa paleta), então a
+      memória do lado do Tk é proporcional ao viewport, não à grade.
+    - pintar() só marca a célula como suja; as células sujas visíveis são
+      desenhadas de uma vez por quadro (after_idle) com PhotoImage.put.
+    - Rolagem e zoom redesenham apenas as linhas visíveis (um put por linha de células).
+    """
+    ZOOM_MIN = 1
+    ZOOM_MAX = 64
+
+    def __init__(self, canvas, root, rows, cols, cell_size, cor_inicial, cor_grade, largura, altura):
+        self.canvas = canvas
+        self.root = root
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = cell_size
+        self.cor_grade = cor_grade
+        self.largura = largura
+        self.altura = altura
+        # Primeira linha/coluna visível
+        self.linha0 = 0
+        self.col0 = 0
+        # Paleta de cores e índice de cor por célula
+        self.paleta = [cor_inicial]
+        self._indice_cor = {cor_inicial: 0}
+        self.cores = bytearray(rows * cols)
+        # Células alteradas desde o último quadro
+        self.sujas = set()
+        self._job_quadro = None
+        self.image = None
+        self.item = None
+
+    def desenhar_inicial(self):
+        self.image = tk.PhotoImage(width=self.largura, height=self.altura)
+        self.item = self.canvas.create_image(0, 0, image=self.image, anchor=tk.NW)
+        self.redesenhar()
+
+    # -------------------
+    # VIEWPORT
+    # -------------------
+    def _visiveis(self):
+        # quantidade de linhas e colunas (inteiras ou parciais) no viewport
+        linhas = min(self.rows - self.linha0, -(-self.altura // self.cell_size))
+        colunas = min(self.cols - self.col0, -(-self.largura // self.cell_size))
+        return linhas, colunas
+
+    def _limitar(self):
+        max_linha = max(0, self.rows - self.altura // self.cell_size)
+        max_col = max(0, self.cols - self.largura // self.cell_size)
+        self.linha0 = min(max(0, self.linha0), max_linha)
+        self.col0 = min(max(0, self.col0), max_col)
+
+    def rolar(self, linhas, colunas):
+        antes = (self.linha0, self.col0)
+        self.linha0 += linhas
+        self.col0 += colunas
+        self._limitar()
+        if (self.linha0, self.col0) != antes:
+            self.redesenhar()
+
+    def definir_zoom(self, cell_size, x=0, y=0):
+        """Muda o tamanho da célula mantendo fixa a célula sob o ponto (x, y) do canvas."""
+        cell_size = min(max(self.ZOOM_MIN, cell_size), self.ZOOM_MAX)
+        if cell_size == self.cell_size:
+            return
+        ancora_r = self.linha0 + y / self.cell_size
+        ancora_c = self.col0 + x / self.cell_size
+        self.cell_size = cell_size
+        self.linha0 = int(ancora_r - y / cell_size)
+        self.col0 = int(ancora_c - x / cell_size)
+        self._limitar()
+        self.redesenhar()
+
+    def definir_paredes(self, celulas, cor_parede):
+        """Converte a grade inteira em índices de cor com bytes.translate e redesenha o viewport."""
+        tabela = bytearray(256)
+        tabela[PAREDE] = self._indice_da_cor(cor_parede)
+        self.cores = bytearray(bytes(celulas).translate(tabela))
+        self.redesenhar()
+
+    def celula_em(self, x, y):
+        c = self.col0 + int(x // self.cell_size)
+        r = self.linha0 + int(y // self.cell_size)
+        if 0 <= r < self.rows and 0 <= c < self.cols and x < self.largura and y < self.altura:
+            return (r, c)
+        return None
+
+    # -------------------
+    # DESENHO
+    # -------------------
+    def _interior(self):
+        # Com células grandes o último pixel fica com a cor da grade (linhas da grade)
+        return self.cell_size - 1 if self.cell_size >= 4 else self.cell_size
+
+    def redesenhar(self):
+        """Redesenha todo o viewport: um put por linha de células visível."""
+        if self.image is None:
+            return
+        self.sujas.clear()
+        self.image.put(self.cor_grade, to=(0, 0, self.largura, self.altura))
+        linhas, colunas = self._visiveis()
+        cell, interior = self.cell_size, self._interior()
+        borda = [self.cor_grade] * (cell - interior)
+        paleta = self.paleta
+        for i in range(linhas):
+            r = self.linha0 + i
+            base = r * self.cols + self.col0
+            pixels = []
+            for cor in self.cores[base:base + colunas]:
+                pixels.extend([paleta[cor]] * interior)
+                pixels.extend(borda)
+            y1 = i * cell
+            self.image.put("{" + " ".join(pixels) + "}", to=(0, y1, len(pixels), y1 + interior))
+
+    def _indice_da_cor(self, color):
+        cor = self._indice_cor.get(color)
+        if cor is None:
+            cor = len(self.paleta)
+            self.paleta.append(color)
+            self._indice_cor[color] = cor
+        return cor
+
+    def pintar(self, r, c, color):
+        cor = self._indice_da_cor(color)
+        i = r * self.cols + c
+        if self.cores[i] == cor:
+            return 0
+        self.cores[i] = cor
+        if self.linha0 <= r < self.linha0 + self.altura // self.cell_size + 1 and \
+                self.col0 <= c < self.col0 + self.largura // self.cell_size + 1:
+            self.sujas.add(i)
+            if self._job_quadro is None:
+                self._job_quadro = self.root.after_idle(self.descarregar)
+        return 0
+
+    def descarregar(self):
+        """Desenha as células sujas (uma vez por quadro). Retorna o número de puts."""
+        self._job_quadro = None
+        if not self.sujas or self.image is None:
+            self.sujas.clear()
+            return 0
+        cell, interior = self.cell_size, self._interior()
+        for i in self.sujas:
+            r, c = divmod(i, self.cols)
+            x1 = (c - self.col0) * cell
+            y1 = (r - self.linha0) * cell
+            self.image.put(self.paleta[self.cores[i]], to=(x1, y1, x1 + interior, y1 + interior))
+        total = len(self.sujas)
+        self.sujas.clear()
+        return total
+
+
+# -------------------
+# LINHA DO ARRASTO
+# -------------------
+def celulas_da_linha(origem, destino):
+    """
+    Células de origem até destino (inclusive) pelo algoritmo de Bresenham.
+    Passos diagonais ganham uma célula intermediária: a linha fica 4-conexa e
+    uma parede desenhada na diagonal não deixa frestas para a busca.
+    """
+    r, c = origem
+    r1, c1 = destino
+    dr, dc = abs(r1 - r), abs(c1 - c)
+    sr = 1 if r1 > r else -1
+    sc = 1 if c1 > c else -1
+    erro = dc - dr
+    celulas = [(r, c)]
+    while (r, c) != (r1, c1):
+        e2 = 2 * erro
+        anda_c = e2 > -dr
+        anda_r = e2 < dc
+        if anda_c:
+            erro -= dr
+            c += sc
+        if anda_r:
+            if anda_c:
+                celulas.append((r, c))
+            erro += dc
+            r += sr
+        celulas.append((r, c))
+    return celulas
+
 
 class MazeEditorGUI:
+    # Rótulo exibido no menu -> nome do algoritmo em labirinto.ALGORITMOS
+    ALGORITMOS_GUI = {
+        "BFS": "bfs",
+        "A* (Manhattan)": "a_estrela",
+        "BFS bidirecional": "bfs_bidirecional",
+        "Jump Point Search": "jps",
+        "Dijkstra (heap)": "dijkstra",
+        "Dijkstra (baldes)": "dijkstra_baldes",
+    }
+    # Onde a busca roda; "auto" usa uma thread a partir de LIMITE_SEGUNDO_PLANO células
+    EXECUCAO_GUI = {
+        "Automática": "auto",
+        "Na interface": "principal",
+        "Thread": "thread",
+        "Processo": "processo",
+    }
+    LIMITE_SEGUNDO_PLANO = 100_000
+    # Custos que a ferramenta Terreno pode pintar
+    CUSTO_MINIMO_TERRENO = 2
+    CUSTO_MAXIMO_TERRENO = 9
+
+    # Acima deste número de células o modo "auto" usa o renderizador de imagem
+    LIMITE_RETANGULOS = 40_000
+    # Tamanho máximo do viewport (pixels) no modo imagem
+    VIEWPORT_MAX = (900, 650)
+    # Animação: duração de um quadro e fração dele disponível para reproduzir expansões
+    QUADRO_MS = 16
+    ORCAMENTO_QUADRO_MS = 12
+    # Velocidade 1 = um passo por tick de tempo_ms; n = 2^(n-2) expansões por quadro; máximo = orçamento
+    VELOCIDADE_MAXIMA = 12
+
     def __init__(self,
                  cols=30, rows=20,
                  cell_size=25,
-                 tempo_ms=30):
+                 tempo_ms=30,
+                 renderizacao="auto"):
+        _carregar_tk()
         # Configurações do grid
         self.cols = cols
         self.rows = rows
         self.cell_size = cell_size
         self.tempo_ms = tempo_ms  # intervalo entre passos em ms
+        # "retangulos" (um item por célula), "imagem" (PhotoImage + viewport) ou "auto"
+        if renderizacao not in ("auto", "retangulos", "imagem"):
+            raise ValueError(f"Modo de renderização desconhecido: {renderizacao!r}")
+        self._renderizacao_pedida = renderizacao
+        self.renderizacao = self._escolher_renderizacao()
 
         # Cores sugeridas
         self.COLOR_WALL = "#1E3A5F"      # Parede (#)
@@ -33,32 +450,75 @@ class MazeEditorGUI:
         self.COLOR_FRONTIER = "#AED6F1"  # Fronteira (na fila)
         self.COLOR_VISITED = "#D6EAF8"   # Visitado
         self.COLOR_FINAL = "#FFD700"     # Caminho final (dourado)
+        self.COLOR_GRID = "#cccccc"      # Linhas da grade
+        # Terreno: do custo mínimo (claro) ao máximo (escuro)
+        self.COLOR_TERRAIN_LIGHT = (0xF5, 0xDE, 0xB3)
+        self.COLOR_TERRAIN_DARK = (0x8B, 0x5A, 0x2B)
 
-        # Estado do labirinto: ' ' caminho, '#' parede, 'S' start, 'E' end
-        self.labirinto = [[' ' for _ in range(self.cols)] for _ in range(self.rows)]
-        # IDs dos retângulos no canvas para cada célula
-        self.grid_cells = [[None for _ in range(self.cols)] for _ in range(self.rows)]
+        # Estado do labirinto: grade compacta (1 byte por célula) + posições de S e E
+        self.grade = GradeLabirinto(self.rows, self.cols)
 
-        # Posições de start e end (tuplas) ou None
-        self.inicio_pos = None
-        self.fim_pos = None
+        # Para BFS: resultado do solver e posição da reprodução
+        self.resultado = None
+        self.passo_atual = 0
+        # Busca em segundo plano em andamento (None quando a busca roda na interface)
+        self.busca = None
+        # Células (índice plano) pintadas pela busca: o reset repinta só estas
+        self.celulas_busca = set()
+        # Pinturas pendentes do quadro atual (índice plano -> cor); a última cor vence
+        self._pinturas_pendentes = {}
+        self._job_pinturas = None
 
-        # Para BFS
-        self.fila = None
-        self.visitados = set()
-        self.predecessores = {}
-        self.in_queue = set()
+        # Caminho ao vivo: planejador incremental, caminho exibido e células editadas desde o último reparo
+        self.planejador = None
+        self._caminho_vivo = []
+        self._editadas = set()
+        self._job_replanejar = None
+        # Índice de alcance: construído na primeira consulta e mantido a cada edição
+        self.indice = None
+
+        # Arrasto: pontos recebidos no quadro atual e última célula já aplicada do traço
+        self._pontos_arrasto = []
+        self._ultima_celula_arrasto = None
+        self._job_arrasto = None
+        # Desfazer/refazer: diferenças por traço (sem cópias da grade)
+        self.historico = HistoricoEdicoes(self.grade)
 
         # agendamento
         self.job_after = None
 
+        # métricas da última busca
+        self.perfil = PerfilBusca()
+
         # GUI init
         self.root = tk.Tk()
-        self.root.title("Maze Editor & BFS Solver")
+        self.root.title("Maze Editor & Solver")
 
         self._build_ui()
         self._draw_grid_initial()
 
+    # Posições de start e end (tuplas) ou None, guardadas na própria grade
+    @property
+    def inicio_pos(self):
+        return self.grade.inicio
+
+    @inicio_pos.setter
+    def inicio_pos(self, pos):
+        self.grade.inicio = pos
+
+    @property
+    def fim_pos(self):
+        return self.grade.fim
+
+    @fim_pos.setter
+    def fim_pos(self, pos):
+        self.grade.fim = pos
+
+    def _escolher_renderizacao(self):
+        if self._renderizacao_pedida != "auto":
+            return self._renderizacao_pedida
+        return "imagem" if self.rows * self.cols > self.LIMITE_RETANGULOS else "retangulos"
+
     # -------------------
     # UI BUILD
     # -------------------
@@ -74,14 +534,21 @@ class MazeEditorGUI:
         right_frame.pack(side=tk.RIGHT, padx=6, pady=6, fill=tk.Y)
 
         # Canvas
-        canvas_width = self.cols * self.cell_size
-        canvas_height = self.rows * self.cell_size
-        self.canvas = tk.Canvas(left_frame, width=canvas_width, height=canvas_height, bg="lightgray")
+        self.canvas = tk.Canvas(left_frame, bg="lightgray")
         self.canvas.pack()
+        self._criar_renderizador()
 
         # Bind mouse events
         self.canvas.bind("<Button-1>", self.on_canvas_click)
         self.canvas.bind("<B1-Motion>", self.on_canvas_drag)
+        self.canvas.bind("<ButtonRelease-1>", self.on_canvas_release)
+        self.root.bind("<Control-z>", self.desfazer)
+        self.root.bind("<Control-y>", self.refazer)
+        # Navegação no modo imagem: roda = rolar, Shift+roda = horizontal, Ctrl+roda = zoom, botão direito = arrastar
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(seq, self.on_canvas_scroll)
+        self.canvas.bind("<ButtonPress-3>", self.on_pan_start)
+        self.canvas.bind("<B3-Motion>", self.on_pan_drag)
 
         # Tools (Radiobuttons)
         tk.Label(right_frame, text="Modo Edição (Ferramenta):").pack(anchor="w")
@@ -89,18 +556,35 @@ class MazeEditorGUI:
         tools = [
             ("Parede (#)", "wall"),
             ("Caminho ( )", "path"),
+            ("Terreno (custo)", "terrain"),
             ("Início (S)", "start"),
             ("Fim (E)", "end")
         ]
         for txt, val in tools:
             rb = tk.Radiobutton(right_frame, text=txt, variable=self.tool_var, value=val)
             rb.pack(anchor="w")
+        self.custo_var = tk.IntVar(value=5)
+        tk.Label(right_frame, text="Custo do terreno:").pack(anchor="w")
+        tk.Spinbox(right_frame, from_=self.CUSTO_MINIMO_TERRENO, to=self.CUSTO_MAXIMO_TERRENO,
+                   textvariable=self.custo_var, width=5).pack(anchor="w")
+
+        # Algoritmo de busca
+        tk.Label(right_frame, text="Algoritmo:").pack(anchor="w", pady=(8, 0))
+        self.algoritmo_var = tk.StringVar(value="BFS")
+        self.menu_algoritmo = tk.OptionMenu(right_frame, self.algoritmo_var, *self.ALGORITMOS_GUI)
+        self.menu_algoritmo.pack(anchor="w", fill=tk.X)
+        tk.Label(right_frame, text="Execução da busca:").pack(anchor="w")
+        self.execucao_var = tk.StringVar(value="Automática")
+        tk.OptionMenu(right_frame, self.execucao_var, *self.EXECUCAO_GUI).pack(anchor="w", fill=tk.X)
+        self.ao_vivo_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(right_frame, text="Caminho ao vivo (D* Lite)", variable=self.ao_vivo_var,
+                       command=self._alternar_ao_vivo).pack(anchor="w")
 
         # Buttons
         btn_frame = tk.Frame(right_frame)
         btn_frame.pack(pady=8, fill=tk.X)
 
-        self.btn_start = tk.Button(btn_frame, text="Iniciar Busca (BFS)", command=self.iniciar_busca)
+        self.btn_start = tk.Button(btn_frame, text="Iniciar Busca", command=self.iniciar_busca)
         self.btn_start.pack(fill=tk.X, pady=2)
 
         self.btn_reset = tk.Button(btn_frame, text="Resetar Busca", command=self.resetar_busca)
@@ -109,59 +593,232 @@ class MazeEditorGUI:
         self.btn_clear = tk.Button(btn_frame, text="Limpar Labirinto", command=self.limpar_labirinto)
         self.btn_clear.pack(fill=tk.X, pady=2)
 
+        historico_frame = tk.Frame(btn_frame)
+        historico_frame.pack(fill=tk.X)
+        self.btn_desfazer = tk.Button(historico_frame, text="Desfazer", command=self.desfazer, state=tk.DISABLED)
+        self.btn_desfazer.pack(side=tk.LEFT, fill=tk.X, expand=True, pady=2)
+        self.btn_refazer = tk.Button(historico_frame, text="Refazer", command=self.refazer, state=tk.DISABLED)
+        self.btn_refazer.pack(side=tk.LEFT, fill=tk.X, expand=True, pady=2)
+
+        self.btn_perfil = tk.Button(btn_frame, text="Exportar Perfil (CSV)", command=self.exportar_perfil)
+        self.btn_perfil.pack(fill=tk.X, pady=2)
+
+        self.btn_salvar = tk.Button(btn_frame, text="Salvar Labirinto", command=self.salvar_labirinto)
+        self.btn_salvar.pack(fill=tk.X, pady=2)
+
+        self.btn_carregar = tk.Button(btn_frame, text="Carregar Labirinto", command=self.carregar_labirinto)
+        self.btn_carregar.pack(fill=tk.X, pady=2)
+
+        # Gerador procedural (semente vazia = aleatória)
+        tk.Label(btn_frame, text="Gerador / semente:").pack(anchor="w")
+        self.gerador_var = tk.StringVar(value="backtracker")
+        tk.OptionMenu(btn_frame, self.gerador_var, *GERADORES).pack(fill=tk.X)
+        self.semente_var = tk.StringVar(value="")
+        tk.Entry(btn_frame, textvariable=self.semente_var).pack(fill=tk.X)
+        self.btn_gerar = tk.Button(btn_frame, text="Gerar Labirinto", command=self.gerar_labirinto)
+        self.btn_gerar.pack(fill=tk.X, pady=2)
+
+        # Velocidade da animação (pode ser alterada durante a busca)
+        self.velocidade_var = tk.IntVar(value=1)
+        self.velocidade_texto = tk.StringVar()
+        tk.Label(right_frame, text="Velocidade:").pack(anchor="w")
+        tk.Scale(right_frame, from_=1, to=self.VELOCIDADE_MAXIMA, orient=tk.HORIZONTAL, showvalue=False,
+                 variable=self.velocidade_var, command=self._atualizar_texto_velocidade).pack(anchor="w", fill=tk.X)
+        tk.Label(right_frame, textvariable=self.velocidade_texto).pack(anchor="w")
+        self._atualizar_texto_velocidade()
+
         # Status label
         self.status_var = tk.StringVar(value="Modo Edição: desenhe paredes, início e fim.")
         self.status_label = tk.Label(top_frame, textvariable=self.status_var, anchor="w")
         self.status_label.pack(fill=tk.X)
 
         # Small legend
-        legend = tk.Label(right_frame, text="\nLegenda:\nS = Início (verde)\nE = Fim (vermelho)\n# = Parede (azul escuro)")
+        legend = tk.Label(right_frame, text="\nLegenda:\nS = Início (verde)\nE = Fim (vermelho)\n# = Parede (azul escuro)\n"
+                                          "Terreno: quanto mais escuro, maior o custo")
         legend.pack(anchor="w", pady=6)
+        self.navegacao_var = tk.StringVar()
+        tk.Label(right_frame, textvariable=self.navegacao_var, justify=tk.LEFT).pack(anchor="w")
+        self._atualizar_texto_navegacao()
+
+    def _atualizar_texto_navegacao(self):
+        if self.renderizacao == "imagem":
+            self.navegacao_var.set("Roda: rolar\nShift+Roda: horizontal\nCtrl+Roda: zoom\nBotão direito: arrastar")
+        else:
+            self.navegacao_var.set("")
+
+    def _criar_renderizador(self):
+        canvas_width = self.cols * self.cell_size
+        canvas_height = self.rows * self.cell_size
+        if self.renderizacao == "imagem":
+            canvas_width = min(canvas_width, self.VIEWPORT_MAX[0])
+            canvas_height = min(canvas_height, self.VIEWPORT_MAX[1])
+        self.canvas.config(width=canvas_width, height=canvas_height)
+        if self.renderizacao == "imagem":
+            self.renderizador = RenderizadorImagem(self.canvas, self.root, self.rows, self.cols, self.cell_size,
+                                                   self.COLOR_PATH, self.COLOR_GRID, canvas_width, canvas_height)
+        else:
+            self.renderizador = RenderizadorRetangulos(self.canvas, self.rows, self.cols, self.cell_size,
+                                                       self.COLOR_PATH, self.COLOR_GRID)
 
     # -------------------
     # GRID DRAW
     # -------------------
     def _draw_grid_initial(self):
-        for r in range(self.rows):
-            for c in range(self.cols):
-                x1 = c * self.cell_size
-                y1 = r * self.cell_size
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-                rect_id = self.canvas.create_rectangle(x1, y1, x2, y2, fill=self.COLOR_PATH, outline="#cccccc")
-                self.grid_cells[r][c] = rect_id
+        self.renderizador.desenhar_inicial()
 
     # -------------------
     # MOUSE HELPERS
     # -------------------
     def _coords_to_cell(self, event_x, event_y):
-        c = int(event_x // self.cell_size)
-        r = int(event_y // self.cell_size)
-        if 0 <= r < self.rows and 0 <= c < self.cols:
-            return (r, c)
-        return None
+        return self.renderizador.celula_em(event_x, event_y)
 
     def on_canvas_click(self, event):
         cell = self._coords_to_cell(event.x, event.y)
-        if cell:
-            self.editar_celula(cell[0], cell[1])
+        if not cell or not self._edicao_permitida():
+            return
+        # cada clique abre um traço: tudo até soltar o botão é desfeito de uma vez
+        self._descarregar_arrasto()
+        self.historico.abrir_traco()
+        self._ultima_celula_arrasto = cell
+        self.editar_celulas([cell])
 
     def on_canvas_drag(self, event):
+        # Movimentos só são acumulados; o traço é aplicado uma vez por quadro
         cell = self._coords_to_cell(event.x, event.y)
-        if cell:
-            self.editar_celula(cell[0], cell[1])
+        if not cell or self._ultima_celula_arrasto is None:
+            return
+        self._pontos_arrasto.append(cell)
+        if self._job_arrasto is None:
+            self._job_arrasto = self.root.after(self.QUADRO_MS, self._descarregar_arrasto)
+
+    def on_canvas_release(self, event):
+        if self._ultima_celula_arrasto is None:
+            return
+        self._descarregar_arrasto()
+        self._ultima_celula_arrasto = None
+        self.historico.fechar_traco()
+        self._atualizar_botoes_historico()
+
+    def _descarregar_arrasto(self):
+        """Aplica os pontos do quadro, preenchendo as células entre pontos consecutivos."""
+        if self._job_arrasto is not None:
+            self.root.after_cancel(self._job_arrasto)
+            self._job_arrasto = None
+        pontos, self._pontos_arrasto = self._pontos_arrasto, []
+        anterior = self._ultima_celula_arrasto
+        if not pontos or anterior is None:
+            return
+        if self.tool_var.get() in ("start", "end"):
+            # S e E: só a última posição do quadro importa
+            celulas = [pontos[-1]]
+        else:
+            celulas = []
+            for ponto in pontos:
+                if ponto != anterior:
+                    celulas.extend(celulas_da_linha(anterior, ponto)[1:])
+                    anterior = ponto
+        self._ultima_celula_arrasto = pontos[-1]
+        self.editar_celulas(celulas)
+
+    # -------------------
+    # VIEWPORT (MODO IMAGEM)
+    # -------------------
+    def on_canvas_scroll(self, event):
+        if self.renderizacao != "imagem":
+            return
+        # Linux envia Button-4/5; Windows/macOS enviam MouseWheel com delta
+        passo = -1 if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0 else 1
+        rend = self.renderizador
+        if event.state & 0x0004:  # Ctrl
+            rend.definir_zoom(rend.cell_size - passo * max(1, rend.cell_size // 4), event.x, event.y)
+        elif event.state & 0x0001:  # Shift
+            rend.rolar(0, passo * 3)
+        else:
+            rend.rolar(passo * 3, 0)
+
+    def on_pan_start(self, event):
+        self._pan_origem = (event.x, event.y)
+
+    def on_pan_drag(self, event):
+        if self.renderizacao != "imagem":
+            return
+        rend = self.renderizador
+        x0, y0 = self._pan_origem
+        dc = int((x0 - event.x) / rend.cell_size)
+        dr = int((y0 - event.y) / rend.cell_size)
+        if dr or dc:
+            rend.rolar(dr, dc)
+            self._pan_origem = (x0 - dc * rend.cell_size, y0 - dr * rend.cell_size)
 
     # -------------------
     # EDIT CELL (MODE EDIT)
     # -------------------
     def editar_celula(self, r, c):
-        tool = self.tool_var.get()
-        current = self.labirinto[r][c]
+        self.editar_celulas([(r, c)])
 
+    def editar_celulas(self, celulas):
+        """Aplica a ferramenta atual a uma sequência de células (um quadro de um traço)."""
         # If editing disabled because simulation running, ignore
         if not self._edicao_permitida():
             return
 
+        tool = self.tool_var.get()
+        grade, historico = self.grade, self.historico
+        indice, ao_vivo = self.indice, self.ao_vivo_var.get()
+        planejador = self.planejador if ao_vivo else None
+        cols = self.cols
+        for r, c in celulas:
+            i = r * cols + c
+            historico.registrar(i)
+            parede_antes = grade.eh_parede(r, c)
+            custo_antes = grade.custo(r, c)
+            self._aplicar_ferramenta(tool, r, c, grade.caractere(r, c))
+            mudou_parede = grade.eh_parede(r, c) != parede_antes
+            if mudou_parede and indice is not None:
+                indice.atualizar_celula(r, c)
+            if planejador is not None and (mudou_parede or grade.custo(r, c) != custo_antes):
+                planejador.atualizar_celula(r, c)
+            if ao_vivo:
+                self._editadas.add(i)
+        if ao_vivo and celulas:
+            self._agendar_replanejamento()
+
+    # -------------------
+    # DESFAZER / REFAZER
+    # -------------------
+    def desfazer(self, event=None):
+        self._aplicar_historico(self.historico.desfazer, "Desfeito")
+
+    def refazer(self, event=None):
+        self._aplicar_historico(self.historico.refazer, "Refeito")
+
+    def _aplicar_historico(self, operacao, verbo):
+        # durante a simulação ou no meio de um traço o histórico fica parado
+        if not self._edicao_permitida() or self._ultima_celula_arrasto is not None:
+            return
+        alteradas = operacao()
+        if alteradas is None:
+            return
+        cols = self.cols
+        ao_vivo = self.ao_vivo_var.get()
+        for i in alteradas:
+            r, c = divmod(i, cols)
+            self._pintar_celula(r, c, self._cor_base(r, c))
+            if self.indice is not None:
+                self.indice.atualizar_celula(r, c)
+            if ao_vivo and self.planejador is not None:
+                self.planejador.atualizar_celula(r, c)
+        if ao_vivo:
+            self._editadas.update(alteradas)
+            self._agendar_replanejamento()
+        self._atualizar_botoes_historico()
+        self.status_var.set(f"{verbo}: {len(alteradas)} células.")
+
+    def _atualizar_botoes_historico(self):
+        self.btn_desfazer.config(state=tk.NORMAL if self.historico.pode_desfazer else tk.DISABLED)
+        self.btn_refazer.config(state=tk.NORMAL if self.historico.pode_refazer else tk.DISABLED)
+
+    def _aplicar_ferramenta(self, tool, r, c, current):
         if tool == "wall":
             # set wall
             if current != '#':
@@ -170,51 +827,185 @@ class MazeEditorGUI:
                     self.inicio_pos = None
                 if current == 'E':
                     self.fim_pos = None
-                self.labirinto[r][c] = '#'
+                self.grade.definir_parede(r, c)
+                self.grade.definir_custo(r, c, 1)
                 self._pintar_celula(r, c, self.COLOR_WALL)
         elif tool == "path":
-            # set path (erase)
-            if current != ' ':
+            # set path (erase), inclusive o terreno
+            if current != ' ' or self.grade.custo(r, c) != 1:
                 if current == 'S':
                     self.inicio_pos = None
                 if current == 'E':
                     self.fim_pos = None
-                self.labirinto[r][c] = ' '
+                self.grade.definir_parede(r, c, False)
+                self.grade.definir_custo(r, c, 1)
                 self._pintar_celula(r, c, self.COLOR_PATH)
+        elif tool == "terrain":
+            # custo de entrar na célula; S e E mantêm a cor, mas também podem ter custo
+            try:
+                custo = int(self.custo_var.get())
+            except (tk.TclError, ValueError):
+                return
+            custo = min(max(custo, self.CUSTO_MINIMO_TERRENO), self.CUSTO_MAXIMO_TERRENO)
+            if current == '#':
+                self.grade.definir_parede(r, c, False)
+            self.grade.definir_custo(r, c, custo)
+            if current not in ('S', 'E'):
+                self._pintar_celula(r, c, self._cor_terreno(custo))
         elif tool == "start":
             # place start; only one allowed
             if current == 'S':
                 return
             # remove old start
-            if self.inicio_pos:
-                old_r, old_c = self.inicio_pos
-                self.labirinto[old_r][old_c] = ' '
-                self._pintar_celula(old_r, old_c, self.COLOR_PATH)
+            antiga = self.inicio_pos
             # if new pos was end, clear end
-            if self.labirinto[r][c] == 'E':
+            if current == 'E':
                 self.fim_pos = None
-            self.labirinto[r][c] = 'S'
+            self.grade.definir_parede(r, c, False)
             self.inicio_pos = (r, c)
+            if antiga:
+                # a célula antiga volta à cor do terreno (ou de caminho), já sem o S
+                self._pintar_celula(antiga[0], antiga[1], self._cor_base(*antiga))
             self._pintar_celula(r, c, self.COLOR_START)
         elif tool == "end":
             # place end; only one allowed
             if current == 'E':
                 return
             # remove old end
-            if self.fim_pos:
-                old_r, old_c = self.fim_pos
-                self.labirinto[old_r][old_c] = ' '
-                self._pintar_celula(old_r, old_c, self.COLOR_PATH)
+            antiga = self.fim_pos
             # if new pos was start, clear start
-            if self.labirinto[r][c] == 'S':
+            if current == 'S':
                 self.inicio_pos = None
-            self.labirinto[r][c] = 'E'
+            self.grade.definir_parede(r, c, False)
             self.fim_pos = (r, c)
+            if antiga:
+                # a célula antiga volta à cor do terreno (ou de caminho), já sem o E
+                self._pintar_celula(antiga[0], antiga[1], self._cor_base(*antiga))
             self._pintar_celula(r, c, self.COLOR_END)
 
+    # -------------------
+    # CAMINHO AO VIVO (REPLANEJAMENTO INCREMENTAL)
+    # -------------------
+    def _indice_alcance(self):
+        if self.indice is None or self.indice.grade is not self.grade:
+            self.indice = IndiceAlcance(self.grade)
+        return self.indice
+
+    def _alternar_ao_vivo(self):
+        if self.ao_vivo_var.get():
+            self._agendar_replanejamento()
+        else:
+            self._apagar_caminho_vivo()
+            self.planejador = None
+
+    def _agendar_replanejamento(self):
+        # Várias edições no mesmo quadro (arrasto) geram um único reparo
+        if self._job_replanejar is None:
+            self._job_replanejar = self.root.after_idle(self._replanejar)
+
+    def _apagar_caminho_vivo(self):
+        cols = self.cols
+        for i in self._caminho_vivo:
+            r, c = divmod(i, cols)
+            self.celulas_busca.discard(i)
+            self._pintar_celula(r, c, self._cor_base(r, c))
+        self._caminho_vivo = []
+
+    def _replanejar(self):
+        self._job_replanejar = None
+        editadas, self._editadas = self._editadas, set()
+        if not self.ao_vivo_var.get() or not self._edicao_permitida():
+            return
+        if self.inicio_pos is None or self.fim_pos is None:
+            self._apagar_caminho_vivo()
+            self.planejador = None
+            self.status_var.set("Caminho ao vivo: defina Início (S) e Fim (E).")
+            return
+        p = self.planejador
+        if p is None or p.grade is not self.grade or p.fim != self.grade.indice(*self.fim_pos):
+            # primeira vez, grade nova ou E movido: as distâncias até E precisam ser refeitas
+            p = self.planejador = PlanejadorIncremental(self.grade)
+        elif p.inicio != self.grade.indice(*self.inicio_pos):
+            p.mover_inicio(self.inicio_pos)
+        if not self._indice_alcance().alcancavel(self.inicio_pos, self.fim_pos):
+            # sem caminho: o D* Lite exploraria todo o componente de E à toa
+            self._apagar_caminho_vivo()
+            self.status_var.set("Caminho ao vivo: E não é alcançável a partir de S.")
+            return
+        res = p.calcular()
+
+        cols = self.cols
+        extremos = (self.grade.indice(*self.inicio_pos), self.grade.indice(*self.fim_pos))
+        novo = [r * cols + c for r, c in res.caminho if r * cols + c not in extremos]
+        antigo, novo_set = set(self._caminho_vivo), set(novo)
+        for i in antigo - novo_set:
+            r, c = divmod(i, cols)
+            self.celulas_busca.discard(i)
+            self._pintar_celula(r, c, self._cor_base(r, c))
+        # só o trecho que mudou (e células editadas que continuam no caminho) é repintado
+        for i in novo:
+            if i not in antigo or i in editadas:
+                self._pintar_busca(i // cols, i % cols, self.COLOR_FINAL)
+        self._caminho_vivo = novo
+        if res.encontrado:
+            custo = f", custo {res.custo}" if self.grade.custos is not None else ""
+            self.status_var.set(f"Caminho ao vivo: {res.comprimento} passos{custo} "
+                                f"({res.nos_expandidos} expansões, {res.tempo_ms:.1f} ms).")
+        else:
+            self.status_var.set(f"Caminho ao vivo: sem caminho ({res.tempo_ms:.1f} ms).")
+
     def _pintar_celula(self, r, c, color):
-        rect_id = self.grid_cells[r][c]
-        self.canvas.itemconfigure(rect_id, fill=color)
+        # Repinturas da mesma célula no mesmo quadro são agrupadas
+        self._pinturas_pendentes[r * self.cols + c] = color
+        if self._job_pinturas is None:
+            self._job_pinturas = self.root.after_idle(self._descarregar_pinturas)
+
+    def _pintar_busca(self, r, c, color):
+        self.celulas_busca.add(r * self.cols + c)
+        self._pintar_celula(r, c, color)
+
+    def _cor_base(self, r, c):
+        v = self.grade.caractere(r, c)
+        if v == '#':
+            return self.COLOR_WALL
+        if v == 'S':
+            return self.COLOR_START
+        if v == 'E':
+            return self.COLOR_END
+        custo = self.grade.custo(r, c)
+        return self.COLOR_PATH if custo == 1 else self._cor_terreno(custo)
+
+    def _cor_terreno(self, custo):
+        # interpolação linear entre as cores clara e escura (custos acima do máximo ficam escuros)
+        t = (min(custo, self.CUSTO_MAXIMO_TERRENO) - self.CUSTO_MINIMO_TERRENO) / (
+            self.CUSTO_MAXIMO_TERRENO - self.CUSTO_MINIMO_TERRENO)
+        t = max(t, 0.0)
+        claro, escuro = self.COLOR_TERRAIN_LIGHT, self.COLOR_TERRAIN_DARK
+        return "#%02X%02X%02X" % tuple(round(a + (b - a) * t) for a, b in zip(claro, escuro))
+
+    def _pintar_terreno(self):
+        """Pinta as células com custo > 1 (grades carregadas ou geradas)."""
+        custos, celulas, cols = self.grade.custos, self.grade.celulas, self.cols
+        for i in self.grade.celulas_com_terreno():
+            if celulas[i] != PAREDE:
+                self._pintar_celula(i // cols, i % cols, self._cor_terreno(custos[i]))
+
+    def _descarregar_pinturas(self):
+        """Aplica no canvas as pinturas pendentes (uma vez por quadro)."""
+        if self._job_pinturas is not None:
+            self.root.after_cancel(self._job_pinturas)
+            self._job_pinturas = None
+        if not self._pinturas_pendentes:
+            return
+        pendentes, self._pinturas_pendentes = self._pinturas_pendentes, {}
+        t0 = time.perf_counter()
+        pintar = self.renderizador.pintar
+        cols = self.cols
+        chamadas = 0
+        for i, color in pendentes.items():
+            chamadas += pintar(i // cols, i % cols, color)
+        chamadas += self.renderizador.descarregar()
+        self.perfil.registrar_pintura(time.perf_counter() - t0, chamadas)
 
     # -------------------
     # CONTROLES DE EDIÇÃO / SIMULAÇÃO
@@ -238,11 +1029,22 @@ class MazeEditorGUI:
             self.btn_clear.config(state=tk.NORMAL)
             self.btn_reset.config(state=tk.NORMAL)
             self.btn_start.config(state=tk.NORMAL)
+            self.btn_perfil.config(state=tk.NORMAL)
+            self.btn_salvar.config(state=tk.NORMAL)
+            self.btn_carregar.config(state=tk.NORMAL)
+            self.btn_gerar.config(state=tk.NORMAL)
+            self._atualizar_botoes_historico()
         else:
             # When simulation running, don't allow start/clear
+            # (Resetar continua ativo: é ele que cancela a busca/animação em andamento)
             self.btn_clear.config(state=tk.DISABLED)
-            self.btn_reset.config(state=tk.DISABLED)
             self.btn_start.config(state=tk.DISABLED)
+            self.btn_perfil.config(state=tk.DISABLED)
+            self.btn_salvar.config(state=tk.DISABLED)
+            self.btn_carregar.config(state=tk.DISABLED)
+            self.btn_gerar.config(state=tk.DISABLED)
+            self.btn_desfazer.config(state=tk.DISABLED)
+            self.btn_refazer.config(state=tk.DISABLED)
 
     # -------------------
     # BFS LOGIC (SIMULATION)
@@ -252,105 +1054,246 @@ class MazeEditorGUI:
         if self.inicio_pos is None or self.fim_pos is None:
             messagebox.showwarning("Atenção", "Defina posição de Início (S) e Fim (E) antes de iniciar a busca.")
             return
-        # Reset previous search (colors) but keep labirinto
+        # Reset previous search (colors) but keep the grid
         self.resetar_busca()
 
-        # initialize BFS structures
-        self.fila = deque()
-        self.visitados = set()
-        self.predecessores = {}
-        self.in_queue = set()
+        execucao = self._execucao()
+        # Sem caminho possível: responde na hora em vez de animar toda a inundação
+        # (em segundo plano o índice só é usado se já existir: construí-lo travaria a interface)
+        if execucao == "principal" or self.indice is not None:
+            if not self._indice_alcance().alcancavel(self.inicio_pos, self.fim_pos):
+                self.status_var.set("Busca finalizada: Caminho não encontrado "
+                                    "(E não é alcançável a partir de S).")
+                return
+
+        # A busca roda no solver headless; a animação só reproduz o registro
+        # (edição fica bloqueada durante a animação, então a grade pode ser usada diretamente)
+        algoritmo = self.ALGORITMOS_GUI[self.algoritmo_var.get()]
+        if execucao == "principal":
+            self.resultado = buscar(self.grade, algoritmo, self.inicio_pos, self.fim_pos)
+        else:
+            # o registro chega aos poucos no espelho self.busca.resultado
+            self.busca = BuscaEmSegundoPlano(self.grade, algoritmo, self.inicio_pos, self.fim_pos,
+                                             modo=execucao).iniciar()
+            self.resultado = self.busca.resultado
+        self.passo_atual = 0
 
         start = self.inicio_pos
-        self.fila.append(start)
-        self.in_queue.add(start)
         # mark start as frontier (or keep green)
         self._pintar_celula(start[0], start[1], self.COLOR_START)
 
         # disable editing controls while sim
         self._set_edicao_enabled(False)
-        self.status_var.set("Busca em andamento...")
+        self.status_var.set(f"Busca em andamento ({self.algoritmo_var.get()})...")
+        self.perfil.iniciar(self._intervalo_quadro())
+        self.perfil.tempo_busca_ms = self.resultado.tempo_ms
 
         # schedule first BFS step
-        self.job_after = self.root.after(self.tempo_ms, self.processar_passo_bfs)
+        self.job_after = self.root.after(self._intervalo_quadro(), self.processar_passo_bfs)
+
+    # -------------------
+    # VELOCIDADE / ORÇAMENTO POR QUADRO
+    # -------------------
+    def _execucao(self):
+        execucao = self.EXECUCAO_GUI[self.execucao_var.get()]
+        if execucao == "auto":
+            return "thread" if self.rows * self.cols >= self.LIMITE_SEGUNDO_PLANO else "principal"
+        return execucao
+
+    def _expansoes_por_quadro(self):
+        # None = sem limite fixo, só o orçamento de tempo do quadro
+        nivel = self.velocidade_var.get()
+        if nivel >= self.VELOCIDADE_MAXIMA:
+            return None
+        return 1 if nivel <= 1 else 2 ** (nivel - 2)
+
+    def _intervalo_quadro(self):
+        return self.tempo_ms if self.velocidade_var.get() <= 1 else self.QUADRO_MS
+
+    def _atualizar_texto_velocidade(self, *_):
+        limite = self._expansoes_por_quadro()
+        if limite is None:
+            texto = "máxima (orçamento de quadro)"
+        elif limite == 1 and self.velocidade_var.get() <= 1:
+            texto = f"1 passo a cada {self.tempo_ms} ms"
+        else:
+            texto = f"{limite} expansões por quadro"
+        self.velocidade_texto.set(texto)
 
     def processar_passo_bfs(self):
-        if not self.fila:
-            # fila vazia e nada achado
-            self.status_var.set("Busca finalizada: Caminho não encontrado.")
+        """
+        Reproduz o registro da busca: expande quantas células a velocidade
+        permitir, sem passar do orçamento de tempo do quadro, e descarrega
+        as pinturas uma única vez no fim do quadro.
+        """
+        self.perfil.abrir_passo(self._intervalo_quadro())
+        if self.busca is not None:
+            # drena a fila do trabalhador uma vez por quadro
+            self.busca.coletar()
+        res = self.resultado
+        total = len(res.ordem_expansao) if self.busca is not None else res.nos_expandidos
+        limite = self._expansoes_por_quadro()
+        prazo = time.perf_counter() + self.ORCAMENTO_QUADRO_MS / 1000.0
+        feitos = 0
+        while self.passo_atual < total:
+            self._reproduzir_expansao(self.passo_atual)
+            self.passo_atual += 1
+            feitos += 1
+            if limite is not None and feitos >= limite:
+                break
+            # o relógio é consultado a cada 32 expansões para não pesar no laço
+            if feitos & 31 == 0 and time.perf_counter() >= prazo:
+                break
+
+        if self.passo_atual >= total and self.busca is not None and not self.busca.concluida:
+            # a reprodução alcançou o trabalhador: espera o próximo lote
+            self._descarregar_pinturas()
+            self.perfil.fechar_passo(feitos)
+            self.status_var.set(f"Busca em andamento ({self.busca.modo}): {total} expansões recebidas...")
+            self.job_after = self.root.after(self._intervalo_quadro(), self.processar_passo_bfs)
+            return
+
+        if self.passo_atual >= total:
+            # registro reproduzido por completo
+            if self.busca is not None:
+                erro = self.busca.erro
+                self.busca = None
+                self.perfil.tempo_busca_ms = res.tempo_ms
+                if erro is not None:
+                    self._descarregar_pinturas()
+                    self.perfil.finalizar(feitos)
+                    self.job_after = None
+                    self.status_var.set(f"Erro na busca: {erro}")
+                    self._set_edicao_enabled(True)
+                    return
+            if res.encontrado:
+                self._reconstruir_caminho(self.fim_pos)
+            self._descarregar_pinturas()
+            self.perfil.finalizar(feitos)
             self.job_after = None
+            if res.encontrado:
+                custo = f"Custo {res.custo}. " if self.grade.custos is not None else ""
+                self.status_var.set("Caminho reconstruído com sucesso. " + custo + self.perfil.resumo())
+            else:
+                self.status_var.set("Busca finalizada: Caminho não encontrado. " + self.perfil.resumo())
             # re-enable editing controls
             self._set_edicao_enabled(True)
             return
 
-        atual = self.fila.popleft()
-        # remove from in_queue (já foi processado)
-        if atual in self.in_queue:
-            self.in_queue.remove(atual)
+        self._descarregar_pinturas()
+        self.perfil.fechar_passo(feitos)
+        # schedule next frame
+        self.job_after = self.root.after(self._intervalo_quadro(), self.processar_passo_bfs)
 
-        # if atual is end -> reconstruct path
-        if atual == self.fim_pos:
-            self.status_var.set("Destino encontrado! Reconstruindo caminho...")
-            self._reconstruir_caminho(atual)
-            self.job_after = None
-            # re-enable editing
-            self._set_edicao_enabled(True)
-            return
+    def _reproduzir_expansao(self, k):
+        res = self.resultado
+        grade = res.grade
+        atual = grade.posicao(res.ordem_expansao[k])
 
         # mark current visited (unless it's start which remains green)
         if atual != self.inicio_pos:
             ar, ac = atual
-            self._pintar_celula(ar, ac, self.COLOR_VISITED)
-        self.visitados.add(atual)
-
-        # Explore neighbors: up, down, left, right
-        r, c = atual
-        vizinhos = [(r-1, c), (r+1, c), (r, c-1), (r, c+1)]
-        for vr, vc in vizinhos:
-            if 0 <= vr < self.rows and 0 <= vc < self.cols:
-                if (vr, vc) in self.visitados:
-                    continue
-                if (vr, vc) in self.in_queue:
-                    continue
-                cell_value = self.labirinto[vr][vc]
-                # can step if not wall '#'
-                if cell_value != '#':
-                    # record predecessor
-                    self.predecessores[(vr, vc)] = atual
-                    # add to queue
-                    self.fila.append((vr, vc))
-                    self.in_queue.add((vr, vc))
-                    # color frontier (but keep start/end special)
-                    if (vr, vc) == self.fim_pos:
-                        # show as end (red)
-                        self._pintar_celula(vr, vc, self.COLOR_END)
-                    elif (vr, vc) == self.inicio_pos:
-                        self._pintar_celula(vr, vc, self.COLOR_START)
-                    else:
-                        self._pintar_celula(vr, vc, self.COLOR_FRONTIER)
-
-        # schedule next step
-        self.job_after = self.root.after(self.tempo_ms, self.processar_passo_bfs)
+            self._pintar_busca(ar, ac, self.COLOR_VISITED)
 
-    def _reconstruir_caminho(self, destino):
-        # Reconstrói o caminho de destino até start usando self.predecessores
-        caminho = []
-        atual = destino
-        while atual != self.inicio_pos:
-            caminho.append(atual)
-            if atual in self.predecessores:
-                atual = self.predecessores[atual]
+        # vizinhos descobertos nesta expansão entram na fronteira
+        for indice in res.descobertas[res.inicio_descobertas[k]:res.inicio_descobertas[k + 1]]:
+            vr, vc = grade.posicao(indice)
+            # color frontier (but keep start/end special)
+            if (vr, vc) == self.fim_pos:
+                # show as end (red)
+                self._pintar_celula(vr, vc, self.COLOR_END)
             else:
-                # Não há predecessor -> não foi possível reconstruir
-                break
+                self._pintar_busca(vr, vc, self.COLOR_FRONTIER)
+
+    def _reconstruir_caminho(self, destino):
+        # O solver já reconstruiu o caminho percorrendo o vetor int32 de predecessores
+        caminho = self.resultado.caminho if self.resultado else []
         # pintar caminho (exclui S e E cores especiais)
         for pos in caminho:
             if pos == self.fim_pos or pos == self.inicio_pos:
                 continue
             r, c = pos
-            self._pintar_celula(r, c, self.COLOR_FINAL)
+            self._pintar_busca(r, c, self.COLOR_FINAL)
         self.status_var.set("Caminho reconstruído com sucesso.")
 
+    def exportar_perfil(self):
+        if not self.perfil.passos:
+            messagebox.showinfo("Perfil", "Execute uma busca antes de exportar o perfil.")
+            return
+        caminho = filedialog.asksaveasfilename(defaultextension=".csv",
+                                               filetypes=[("CSV", "*.csv")],
+                                               initialfile="perfil_busca.csv")
+        if caminho:
+            self.perfil.exportar_csv(caminho)
+            self.status_var.set(f"Perfil exportado para {caminho}.")
+
+    # -------------------
+    # ARQUIVOS
+    # -------------------
+    def salvar_labirinto(self):
+        caminho = filedialog.asksaveasfilename(defaultextension=".lab",
+                                               filetypes=[("Labirinto binário", "*.lab"), ("Texto", "*.txt")],
+                                               initialfile="labirinto.lab")
+        if not caminho:
+            return
+        try:
+            arquivo_labirinto.salvar(self.grade, caminho)
+        except (OSError, ValueError) as e:
+            # ex.: terreno que o formato texto não representa (custo acima de 9 ou em S/E)
+            messagebox.showerror("Erro", f"Não foi possível salvar o labirinto:\n{e}")
+            return
+        self.status_var.set(f"Labirinto salvo em {caminho}.")
+
+    def carregar_labirinto(self):
+        caminho = filedialog.askopenfilename(filetypes=[("Labirintos", "*.lab *.txt"), ("Todos", "*")])
+        if not caminho:
+            return
+        try:
+            grade = arquivo_labirinto.carregar(caminho)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Erro", f"Não foi possível carregar o labirinto:\n{e}")
+            return
+        self.definir_grade(grade)
+        self.status_var.set(f"Labirinto {grade.linhas}x{grade.colunas} carregado de {caminho}.")
+
+    def gerar_labirinto(self):
+        texto = self.semente_var.get().strip()
+        try:
+            semente = int(texto) if texto else None
+        except ValueError:
+            messagebox.showwarning("Atenção", "A semente deve ser um número inteiro.")
+            return
+        tipo = self.gerador_var.get()
+        try:
+            grade = gerar(tipo, self.rows, self.cols, semente)
+        except ValueError as e:
+            messagebox.showwarning("Atenção", str(e))
+            return
+        self.definir_grade(grade)
+        self.status_var.set(f"Labirinto gerado ({tipo}, semente {texto or 'aleatória'}).")
+
+    def definir_grade(self, grade):
+        """Troca o labirinto inteiro (recria o canvas se as dimensões mudarem)."""
+        self.resetar_busca()
+        self._pinturas_pendentes = {}
+        self.grade = grade
+        self.planejador = None
+        self.indice = None
+        self.historico = HistoricoEdicoes(grade)
+        self._atualizar_botoes_historico()
+        self.rows, self.cols = grade.linhas, grade.colunas
+        self.renderizacao = self._escolher_renderizacao()
+        self.canvas.delete("all")
+        self._criar_renderizador()
+        self._draw_grid_initial()
+        self._atualizar_texto_navegacao()
+        self.renderizador.definir_paredes(grade.celulas, self.COLOR_WALL)
+        self._pintar_terreno()
+        if self.inicio_pos is not None:
+            self._pintar_celula(self.inicio_pos[0], self.inicio_pos[1], self.COLOR_START)
+        if self.fim_pos is not None:
+            self._pintar_celula(self.fim_pos[0], self.fim_pos[1], self.COLOR_END)
+
     # -------------------
     # RESET / CLEAR
     # -------------------
@@ -362,29 +1305,27 @@ class MazeEditorGUI:
             except Exception:
                 pass
             self.job_after = None
+        # a busca em segundo plano para no próximo lote de expansões
+        if self.busca is not None:
+            self.busca.cancelar()
+            self.busca = None
 
-        # Clear BFS-specific states/paintings but keep '#', 'S', 'E'
-        for r in range(self.rows):
-            for c in range(self.cols):
-                v = self.labirinto[r][c]
-                if v == '#':
-                    self._pintar_celula(r, c, self.COLOR_WALL)
-                elif v == 'S':
-                    self._pintar_celula(r, c, self.COLOR_START)
-                elif v == 'E':
-                    self._pintar_celula(r, c, self.COLOR_END)
-                else:
-                    # default path
-                    self._pintar_celula(r, c, self.COLOR_PATH)
+        # Clear BFS-specific paintings but keep '#', 'S', 'E': só as células tocadas pela busca
+        cols = self.cols
+        for i in self.celulas_busca:
+            r, c = divmod(i, cols)
+            self._pintar_celula(r, c, self._cor_base(r, c))
+        self.celulas_busca = set()
+        self._caminho_vivo = []
 
         # reset BFS structures
-        self.fila = None
-        self.visitados = set()
-        self.predecessores = {}
-        self.in_queue = set()
+        self.resultado = None
+        self.passo_atual = 0
         self.status_var.set("Busca resetada. Modo Edição.")
         # re-enable editing
         self._set_edicao_enabled(True)
+        if self.ao_vivo_var.get():
+            self._agendar_replanejamento()
 
     def limpar_labirinto(self):
         # Cancel any running job
@@ -394,18 +1335,34 @@ class MazeEditorGUI:
             except Exception:
                 pass
             self.job_after = None
+        if self.busca is not None:
+            self.busca.cancelar()
+            self.busca = None
 
-        # Reset model and canvas to empty
-        self.labirinto = [[' ' for _ in range(self.cols)] for _ in range(self.rows)]
-        self.inicio_pos = None
-        self.fim_pos = None
-        for r in range(self.rows):
-            for c in range(self.cols):
-                self._pintar_celula(r, c, self.COLOR_PATH)
-        self.fila = None
-        self.visitados = set()
-        self.predecessores = {}
-        self.in_queue = set()
+        # Reset model and canvas to empty: repinta só células da busca e células não vazias
+        cols = self.cols
+        for i in self.celulas_busca:
+            self._pintar_celula(i // cols, i % cols, self.COLOR_PATH)
+        self.celulas_busca = set()
+        self._caminho_vivo = []
+        # paredes localizadas com bytearray.find (varredura em C)
+        celulas = self.grade.celulas
+        parede = bytes([PAREDE])
+        i = celulas.find(parede)
+        while i != -1:
+            self._pintar_celula(i // cols, i % cols, self.COLOR_PATH)
+            i = celulas.find(parede, i + 1)
+        for pos in (self.inicio_pos, self.fim_pos):
+            if pos is not None:
+                self._pintar_celula(pos[0], pos[1], self.COLOR_PATH)
+        for i in self.grade.celulas_com_terreno():
+            self._pintar_celula(i // cols, i % cols, self.COLOR_PATH)
+        self.grade = GradeLabirinto(self.rows, self.cols)
+        self.planejador = None
+        self.indice = None
+        self.historico = HistoricoEdicoes(self.grade)
+        self.resultado = None
+        self.passo_atual = 0
         self.status_var.set("Labirinto limpo. Modo Edição.")
         self._set_edicao_enabled(True)
 
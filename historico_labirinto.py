@@ -0,0 +1,136 @@
+"""
+Histórico de edições do labirinto (desfazer/refazer)
+
+- Cada traço (clique ou arrasto) vira uma entrada com só as células que mudaram:
+  índices em array('i') e estado antes/depois em array('H'), mais S e E antes/depois
+- Nada de cópias da grade: o custo é proporcional ao número de células editadas
+- Estado de uma célula = parede (bit 0) | custo do terreno << 1
+"""
+
+from array import array
+from collections import deque
+
+from labirinto import LIVRE, PAREDE
+
+# Traços guardados para desfazer (os mais antigos são descartados)
+LIMITE_TRACOS = 500
+
+
+def _estado(grade, i):
+    custo = 1 if grade.custos is None else grade.custos[i]
+    return (grade.celulas[i] == PAREDE) | (custo << 1)
+
+
+def _aplicar_estado(grade, i, estado):
+    grade.celulas[i] = PAREDE if estado & 1 else LIVRE
+    r, c = divmod(i, grade.colunas)
+    grade.definir_custo(r, c, estado >> 1)
+
+
+class Traco:
+    """Diferença de um traço: células alteradas e posições de S/E antes e depois."""
+    __slots__ = ("indices", "antes", "depois", "extremos_antes", "extremos_depois")
+
+    def __init__(self, indices, antes, depois, extremos_antes, extremos_depois):
+        self.indices = indices
+        self.antes = antes
+        self.depois = depois
+        self.extremos_antes = extremos_antes
+        self.extremos_depois = extremos_depois
+
+    def memoria_bytes(self):
+        return (len(self.indices) * self.indices.itemsize + len(self.antes) * self.antes.itemsize
+                + len(self.depois) * self.depois.itemsize)
+
+
+class HistoricoEdicoes:
+    """
+    Uso:
+        historico.abrir_traco()
+        historico.registrar(i)      # antes de mudar a célula i (só a 1ª vez no traço conta)
+        ... muda a grade ...
+        historico.fechar_traco()
+        alteradas = historico.desfazer()   # índices a repintar (None se não havia o que desfazer)
+    """
+    def __init__(self, grade, limite=LIMITE_TRACOS):
+        self.grade = grade
+        self._desfazer = deque(maxlen=limite)
+        self._refazer = []
+        self._aberto = None  # índice -> estado antes, durante um traço
+        self._extremos_abertura = None
+
+    @property
+    def pode_desfazer(self):
+        return bool(self._desfazer)
+
+    @property
+    def pode_refazer(self):
+        return bool(self._refazer)
+
+    # -------------------
+    # GRAVAÇÃO
+    # -------------------
+    def abrir_traco(self):
+        if self._aberto is not None:
+            self.fechar_traco()
+        self._aberto = {}
+        self._extremos_abertura = (self.grade.inicio, self.grade.fim)
+
+    def registrar(self, i):
+        if self._aberto is not None and i not in self._aberto:
+            self._aberto[i] = _estado(self.grade, i)
+
+    def fechar_traco(self):
+        """Fecha o traço; células que voltaram ao estado original são descartadas."""
+        if self._aberto is None:
+            return None
+        grade = self.grade
+        indices, antes, depois = array('i'), array('H'), array('H')
+        for i, estado in self._aberto.items():
+            atual = _estado(grade, i)
+            if atual != estado:
+                indices.append(i)
+                antes.append(estado)
+                depois.append(atual)
+        extremos = (grade.inicio, grade.fim)
+        self._aberto = None
+        if not indices and extremos == self._extremos_abertura:
+            return None
+        traco = Traco(indices, antes, depois, self._extremos_abertura, extremos)
+        self._desfazer.append(traco)
+        self._refazer.clear()
+        return traco
+
+    # -------------------
+    # DESFAZER / REFAZER
+    # -------------------
+    def _aplicar(self, traco, estados, extremos):
+        grade = self.grade
+        for i, estado in zip(traco.indices, estados):
+            _aplicar_estado(grade, i, estado)
+        grade.inicio, grade.fim = extremos
+        # S e E antigos e novos também precisam ser repintados
+        alteradas = set(traco.indices)
+        for pos in traco.extremos_antes + traco.extremos_depois:
+            if pos is not None:
+                alteradas.add(grade.indice(*pos))
+        return alteradas
+
+    def desfazer(self):
+        if self._aberto is not None:
+            self.fechar_traco()
+        if not self._desfazer:
+            return None
+        traco = self._desfazer.pop()
+        self._refazer.append(traco)
+        return self._aplicar(traco, traco.antes, traco.extremos_antes)
+
+    def refazer(self):
+        if not self._refazer:
+            return None
+        traco = self._refazer.pop()
+        self._desfazer.append(traco)
+        return self._aplicar(traco, traco.depois, traco.extremos_depois)
+
+    def memoria_bytes(self):
+        return sum(t.memoria_bytes() for t in self._desfazer) + sum(t.memoria_bytes() for t in self._refazer)
@@ -0,0 +1,358 @@
+"""
+Busca hierárquica no labirinto (HPA*, Botea, Müller & Schaeffer)
+
+Pré-processamento (para labirintos grandes e quase estáticos):
+- A grade é dividida em clusters de tamanho_cluster x tamanho_cluster células
+- Em cada borda entre dois clusters vizinhos, cada sequência de pares de células
+  livres (uma de cada lado) vira uma entrada: uma no meio se a sequência é curta,
+  duas (nas pontas) se é longa. As duas células de uma entrada são nós abstratos
+  ligados por uma aresta de custo 1
+- Dentro de cada cluster, a distância entre cada par de nós é calculada com uma só
+  BFS de várias origens (multiplas_origens.py) sobre as células do cluster e guardada
+  em uma matriz array('i') por cluster (calculada na primeira vez que uma busca passa
+  pelo cluster, ou para todos com preparar())
+
+Consulta:
+- S e E entram temporariamente no grafo abstrato (BFS dentro dos seus clusters)
+- A* no grafo abstrato (h = Manhattan) dá a sequência de nós
+- Refinamento: cada aresta interna vira um trecho de BFS restrita ao cluster
+
+O caminho é quase ótimo (em geral poucos % acima do mínimo: ele passa pelas entradas).
+Custo uniforme (como BFS e JPS): o terreno (grade.custos) é ignorado.
+
+Edições: depois de mudar uma célula, atualizar_celula(r, c) refaz só as bordas que
+contêm a célula e as distâncias dos clusters afetados (o da célula e os vizinhos
+dessas bordas).
+
+Uso:
+    hpa = AbstracaoHPA(grade, tamanho_cluster=32)
+    resultado = hpa.buscar((0, 0), (999, 999))
+"""
+
+import heapq
+import time
+from array import array
+from collections import deque
+
+from labirinto import PAREDE, GradeLabirinto, ResultadoBusca, _exigir_fim, _extremo_em_parede, _validar_extremos
+from multiplas_origens import bfs_multiplas_origens
+
+TAMANHO_CLUSTER = 32
+# Sequências de entrada com pelo menos este comprimento ganham duas entradas (nas pontas)
+ENTRADA_LONGA = 6
+
+# Bordas: (cluster, DIREITA) entre o cluster e o da direita; (cluster, BAIXO) com o de baixo
+DIREITA = 0
+BAIXO = 1
+
+
+class AbstracaoHPA:
+    """
+    Grafo abstrato de uma GradeLabirinto.
+
+    - _ligacoes[u]: células do outro lado das entradas de u (aresta de custo 1); as
+      chaves são exatamente os nós abstratos
+    - _nos[X]: nós do cluster X
+    - _internas[X]: (nós, matriz) com as distâncias dentro do cluster (-1 = sem caminho)
+      ou None enquanto não foi calculada
+    """
+    def __init__(self, grade, tamanho_cluster=TAMANHO_CLUSTER, preparar=False):
+        if tamanho_cluster < 2:
+            raise ValueError("tamanho_cluster deve ser pelo menos 2.")
+        self.grade = grade
+        self.tamanho = tamanho_cluster
+        self.clusters_linhas = -(-grade.linhas // tamanho_cluster)
+        self.clusters_colunas = -(-grade.colunas // tamanho_cluster)
+        quantidade = self.clusters_linhas * self.clusters_colunas
+        self._ligacoes = {}
+        self._nos = [set() for _ in range(quantidade)]
+        self._internas = [None] * quantidade
+        self._pares_borda = {}
+        for x in range(quantidade):
+            cr, cc = divmod(x, self.clusters_colunas)
+            if cc + 1 < self.clusters_colunas:
+                self._construir_borda((x, DIREITA))
+            if cr + 1 < self.clusters_linhas:
+                self._construir_borda((x, BAIXO))
+        if preparar:
+            self.preparar()
+
+    @property
+    def quantidade_clusters(self):
+        return len(self._nos)
+
+    @property
+    def quantidade_nos(self):
+        return len(self._ligacoes)
+
+    def __repr__(self):
+        return (f"AbstracaoHPA({self.grade.linhas}x{self.grade.colunas}, cluster={self.tamanho}, "
+                f"clusters={self.quantidade_clusters}, nos={self.quantidade_nos})")
+
+    # -------------------
+    # CLUSTERS E BORDAS
+    # -------------------
+    def cluster(self, u):
+        r, c = divmod(u, self.grade.colunas)
+        return (r // self.tamanho) * self.clusters_colunas + c // self.tamanho
+
+    def _limites(self, x):
+        """(r0, r1, c0, c1) do cluster x, com r1 e c1 exclusivos."""
+        cr, cc = divmod(x, self.clusters_colunas)
+        t = self.tamanho
+        return (cr * t, min((cr + 1) * t, self.grade.linhas),
+                cc * t, min((cc + 1) * t, self.grade.colunas))
+
+    def _pares_da_borda(self, borda):
+        """Pares (célula deste cluster, célula vizinha) ao longo da borda, na ordem."""
+        x, lado = borda
+        r0, r1, c0, c1 = self._limites(x)
+        colunas = self.grade.colunas
+        if lado == DIREITA:
+            return [(r * colunas + c1 - 1, r * colunas + c1) for r in range(r0, r1)]
+        return [((r1 - 1) * colunas + c, r1 * colunas + c) for c in range(c0, c1)]
+
+    def _construir_borda(self, borda):
+        """(Re)calcula as entradas de uma borda e atualiza nós e ligações dos dois lados."""
+        for a, b in self._pares_borda.pop(borda, ()):
+            self._desligar(a, b)
+            self._desligar(b, a)
+        celulas = self.grade.celulas
+        entradas = []
+        sequencia = []
+        for a, b in self._pares_da_borda(borda) + [(-1, -1)]:
+            if a >= 0 and celulas[a] != PAREDE and celulas[b] != PAREDE:
+                sequencia.append((a, b))
+                continue
+            if len(sequencia) >= ENTRADA_LONGA:
+                entradas += (sequencia[0], sequencia[-1])
+            elif sequencia:
+                entradas.append(sequencia[len(sequencia) // 2])
+            sequencia = []
+        for a, b in entradas:
+            self._ligar(a, b)
+            self._ligar(b, a)
+        self._pares_borda[borda] = entradas
+
+    def _ligar(self, a, b):
+        ligacoes = self._ligacoes.get(a)
+        if ligacoes is None:
+            ligacoes = self._ligacoes[a] = {}
+            self._nos[self.cluster(a)].add(a)
+        ligacoes[b] = ligacoes.get(b, 0) + 1  # a mesma ligação pode vir de duas entradas
+
+    def _desligar(self, a, b):
+        ligacoes = self._ligacoes[a]
+        if ligacoes[b] > 1:
+            ligacoes[b] -= 1
+            return
+        del ligacoes[b]
+        if not ligacoes:
+            del self._ligacoes[a]
+            self._nos[self.cluster(a)].discard(a)
+
+    # -------------------
+    # DISTÂNCIAS DENTRO DO CLUSTER
+    # -------------------
+    def _bfs_cluster(self, origem, x, alvos, predecessores=False):
+        """
+        BFS a partir de origem sem sair do cluster x.
+        Retorna {alvo: distância} dos alvos alcançados (ou o dict de predecessores).
+        """
+        r0, r1, c0, c1 = self._limites(x)
+        colunas, celulas = self.grade.colunas, self.grade.celulas
+        dist = {origem: 0}
+        pais = {origem: -1}
+        faltam = len(alvos) - (origem in alvos)
+        fila = deque([origem])
+        while fila and faltam > 0:
+            u = fila.popleft()
+            r, c = divmod(u, colunas)
+            d = dist[u] + 1
+            for v, ok in ((u - colunas, r > r0), (u + colunas, r < r1 - 1),
+                          (u - 1, c > c0), (u + 1, c < c1 - 1)):
+                if ok and celulas[v] != PAREDE and v not in dist:
+                    dist[v] = d
+                    pais[v] = u
+                    if v in alvos:
+                        faltam -= 1
+                    fila.append(v)
+        if predecessores:
+            return pais
+        return {a: dist[a] for a in alvos if a in dist}
+
+    def _subgrade(self, x):
+        """Cópia das células do cluster x como uma GradeLabirinto própria."""
+        r0, r1, c0, c1 = self._limites(x)
+        colunas, celulas = self.grade.colunas, self.grade.celulas
+        corpo = b"".join(celulas[r * colunas + c0:r * colunas + c1] for r in range(r0, r1))
+        return GradeLabirinto(r1 - r0, c1 - c0, bytearray(corpo))
+
+    def _calcular_internas(self, x):
+        nos = tuple(sorted(self._nos[x]))
+        k = len(nos)
+        matriz = array('i', [-1]) * (k * k)
+        if k > 1:
+            # todas as origens do cluster em uma só BFS com paralelismo de bits
+            r0, _, c0, _ = self._limites(x)
+            sub = self._subgrade(x)
+            colunas = self.grade.colunas
+            locais = [(u // colunas - r0) * sub.colunas + u % colunas - c0 for u in nos]
+            res = bfs_multiplas_origens(sub, [sub.posicao(v) for v in locais])
+            for i in range(k):
+                distancias = res.distancias[i]
+                for j, v in enumerate(locais):
+                    matriz[i * k + j] = distancias[v]
+        elif k == 1:
+            matriz[0] = 0
+        self._internas[x] = (nos, matriz)
+        return self._internas[x]
+
+    def _arestas_internas(self, u, x):
+        nos, matriz = self._internas[x] or self._calcular_internas(x)
+        k = len(nos)
+        i = nos.index(u)
+        for j in range(k):
+            d = matriz[i * k + j]
+            if d > 0:
+                yield nos[j], d
+
+    def preparar(self):
+        """Calcula as distâncias internas de todos os clusters (senão, sob demanda)."""
+        for x in range(self.quantidade_clusters):
+            if self._internas[x] is None:
+                self._calcular_internas(x)
+
+    # -------------------
+    # EDIÇÕES
+    # -------------------
+    def atualizar_celula(self, r, c):
+        """Chame depois de mudar a célula (r, c) na grade (parede <-> caminho)."""
+        grade = self.grade
+        if not grade.dentro(r, c):
+            raise ValueError("Célula fora da grade.")
+        x = self.cluster(grade.indice(r, c))
+        r0, r1, c0, c1 = self._limites(x)
+        cc = x % self.clusters_colunas
+        bordas = []
+        if c == c0 and cc > 0:
+            bordas.append((x - 1, DIREITA))
+        if c == c1 - 1 and cc + 1 < self.clusters_colunas:
+            bordas.append((x, DIREITA))
+        if r == r0 and x >= self.clusters_colunas:
+            bordas.append((x - self.clusters_colunas, BAIXO))
+        if r == r1 - 1 and x + self.clusters_colunas < self.quantidade_clusters:
+            bordas.append((x, BAIXO))
+        afetados = {x}
+        for borda in bordas:
+            self._construir_borda(borda)
+            y, lado = borda
+            afetados.update((y, y + 1 if lado == DIREITA else y + self.clusters_colunas))
+        for y in afetados:
+            # clusters já calculados são refeitos na hora; os outros continuam sob demanda
+            if self._internas[y] is not None:
+                self._calcular_internas(y)
+
+    # -------------------
+    # CONSULTA
+    # -------------------
+    def buscar(self, inicio=None, fim=None, indice=None):
+        """
+        Caminho quase ótimo de S até E pelo grafo abstrato.
+        expandidos conta os nós abstratos expandidos pelo A*.
+        indice (IndiceAlcance, opcional) rejeita na hora pares sem caminho.
+        """
+        grade = self.grade
+        inicio, fim = _validar_extremos(grade, inicio, fim)
+        _exigir_fim(fim, "HPA*")
+        resultado = ResultadoBusca("hpa", grade)
+        t0 = time.perf_counter()
+        s, e = grade.indice(*inicio), grade.indice(*fim)
+        if _extremo_em_parede(grade, inicio, fim) or (indice is not None and not indice.alcancavel(inicio, fim)):
+            resultado.tempo_ms = (time.perf_counter() - t0) * 1000.0
+            return resultado
+        if s == e:
+            resultado.caminho = [inicio]
+            resultado.tempo_ms = (time.perf_counter() - t0) * 1000.0
+            return resultado
+
+        # S e E ligados aos nós dos próprios clusters
+        xs, xe = self.cluster(s), self.cluster(e)
+        saida = self._bfs_cluster(s, xs, self._nos[xs] | {e} if xs == xe else self._nos[xs])
+        saida.pop(s, None)
+        chegada = self._bfs_cluster(e, xe, self._nos[xe])
+
+        colunas = grade.colunas
+        er, ec = divmod(e, colunas)
+        g = {s: 0}
+        pais = {s: -1}
+        fechados = set()
+        # empate em f: o nó com maior g (mais perto de E) sai primeiro
+        heap = [(abs(er - inicio[0]) + abs(ec - inicio[1]), 0, s)]
+        expandidos = 0
+        while heap:
+            _, gu, u = heapq.heappop(heap)
+            gu = -gu
+            if u in fechados:
+                continue
+            fechados.add(u)
+            expandidos += 1
+            if u == e:
+                break
+            if u == s:
+                arestas = list(saida.items())
+            else:
+                arestas = list(self._arestas_internas(u, self.cluster(u)))
+                if u in chegada:
+                    arestas.append((e, chegada[u]))
+            arestas.extend((v, 1) for v in self._ligacoes.get(u, ()))
+            for v, custo in arestas:
+                nova = gu + custo
+                if nova < g.get(v, nova + 1):
+                    g[v] = nova
+                    pais[v] = u
+                    r, c = divmod(v, colunas)
+                    heapq.heappush(heap, (nova + abs(er - r) + abs(ec - c), -nova, v))
+        resultado.expandidos = expandidos
+        if e in fechados:
+            resultado.caminho = self._refinar(pais, s, e)
+        resultado.tempo_ms = (time.perf_counter() - t0) * 1000.0
+        return resultado
+
+    def _refinar(self, pais, s, e):
+        """Troca cada aresta abstrata pelo trecho de células correspondente."""
+        abstrato = [e]
+        while abstrato[-1] != s:
+            abstrato.append(pais[abstrato[-1]])
+        abstrato.reverse()
+        caminho = [s]
+        for a, b in zip(abstrato, abstrato[1:]):
+            if b in self._ligacoes.get(a, ()) and self.cluster(a) != self.cluster(b):
+                caminho.append(b)  # atravessa a entrada
+                continue
+            trecho = []
+            predecessores = self._bfs_cluster(a, self.cluster(a), {b}, predecessores=True)
+            v = b
+            while v != a:
+                trecho.append(v)
+                v = predecessores[v]
+            caminho.extend(reversed(trecho))
+        posicao = self.grade.posicao
+        return [posicao(u) for u in caminho]
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    from gerador_labirinto import gerar_densidade
+    from labirinto import buscar_a_estrela
+
+    grade = gerar_densidade(1000, 1000, 0.25, semente=1)
+    t0 = time.perf_counter()
+    hpa = AbstracaoHPA(grade, preparar=True)
+    print(f"{hpa} preparada em {time.perf_counter() - t0:.1f} s")
+    res = hpa.buscar()
+    ref = buscar_a_estrela(grade, registrar=False)
+    print(f"HPA*: {res.comprimento} passos, {res.nos_expandidos} nós abstratos, {res.tempo_ms:.1f} ms")
+    print(f"A*:   {ref.comprimento} passos, {ref.nos_expandidos} expandidos, {ref.tempo_ms:.1f} ms")
@@ -0,0 +1,849 @@
+"""
+Labirinto headless (sem Tkinter)
+
+Funcionalidades:
+- Grade compacta do labirinto: uma célula por byte, indexada por r * colunas + c
+- Custo de travessia opcional por célula (terreno): outro bytearray com valores 1..255,
+  criado só quando algum custo diferente de 1 é definido
+- Estado das buscas em estruturas compactas: visitados/fechados como bitsets
+  (1 bit por célula) e predecessores/distâncias como array('i') (int32)
+- Conversão de/para o formato texto do editor ('#', ' ', 'S', 'E')
+- Buscas executadas até o fim em uma única chamada: BFS, A* (Manhattan),
+  BFS bidirecional e Jump Point Search (grade 4-conexa de custo uniforme)
+- Buscas ponderadas pelo custo do terreno: Dijkstra com heap binário,
+  Dijkstra com fila de baldes (algoritmo de Dial, custos inteiros pequenos) e A*
+  (BFS, BFS bidirecional e JPS contam apenas passos e ignoram o terreno)
+- Resultado com caminho, distâncias e registro da ordem de expansão
+  (o editor em grafos.py reproduz esse registro na velocidade desejada)
+- Progresso opcional: progresso(resultado) é chamado a cada LOTE_PROGRESSO expansões
+  (com o registro até ali) e, se devolver True, a busca é cancelada
+"""
+
+import heapq
+import time
+from array import array
+from collections import deque
+
+# Valores das células na grade compacta
+LIVRE = 0
+PAREDE = 1
+
+# Expansões entre duas chamadas do callback de progresso
+LOTE_PROGRESSO = 4096
+
+# custo -> 1 se a célula tem terreno (custo diferente de 1), 0 caso contrário
+_MARCA_TERRENO = bytes(0 if b == 1 else 1 for b in range(256))
+
+
+# -------------------
+# ESTRUTURAS COMPACTAS
+# -------------------
+BITS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+def novo_bitset(n):
+    """Conjunto de índices 0..n-1 com 1 bit por elemento."""
+    return bytearray((n + 7) >> 3)
+
+
+def bitset_contem(bits, i):
+    return bits[i >> 3] & BITS[i & 7] != 0
+
+
+def bitset_adicionar(bits, i):
+    bits[i >> 3] |= BITS[i & 7]
+
+
+def vetor_int32(n, valor=-1):
+    """array('i') com n posições preenchidas com valor (sem lista intermediária)."""
+    return array('i', [valor]) * n
+
+
+# -------------------
+# GRADE COMPACTA
+# -------------------
+class GradeLabirinto:
+    """
+    Grade do labirinto em um bytearray plano (LIVRE ou PAREDE por célula).
+    Posições são tuplas (r, c); internamente os algoritmos usam índices planos.
+    custos (opcional): bytearray paralelo com o custo de entrar em cada célula
+    (1..255); None significa custo 1 em todas.
+    """
+    def __init__(self, linhas, colunas, celulas=None, inicio=None, fim=None, custos=None):
+        self.linhas = linhas
+        self.colunas = colunas
+        if celulas is None:
+            celulas = bytearray(linhas * colunas)
+        elif len(celulas) != linhas * colunas:
+            raise ValueError(f"Grade {linhas}x{colunas} precisa de {linhas * colunas} células, recebeu {len(celulas)}.")
+        if custos is not None and len(custos) != linhas * colunas:
+            raise ValueError(f"Grade {linhas}x{colunas} precisa de {linhas * colunas} custos, recebeu {len(custos)}.")
+        self.celulas = celulas
+        self.inicio = inicio
+        self.fim = fim
+        self.custos = custos
+
+    @classmethod
+    def de_texto(cls, linhas_texto):
+        """
+        Cria a grade a partir de linhas no formato do editor.
+        Aceita uma lista de strings ou uma lista de listas de caracteres.
+        """
+        linhas = len(linhas_texto)
+        colunas = len(linhas_texto[0]) if linhas else 0
+        grade = cls(linhas, colunas)
+        for r, linha in enumerate(linhas_texto):
+            if len(linha) != colunas:
+                raise ValueError(f"Linha {r} tem {len(linha)} colunas, esperado {colunas}.")
+            for c, valor in enumerate(linha):
+                if valor == '#':
+                    grade.celulas[r * colunas + c] = PAREDE
+                elif valor == 'S':
+                    grade.inicio = (r, c)
+                elif valor == 'E':
+                    grade.fim = (r, c)
+        return grade
+
+    def para_texto(self):
+        """Retorna a grade como lista de strings no formato do editor."""
+        resultado = []
+        for r in range(self.linhas):
+            base = r * self.colunas
+            linha = ['#' if v == PAREDE else ' ' for v in self.celulas[base:base + self.colunas]]
+            if self.inicio is not None and self.inicio[0] == r:
+                linha[self.inicio[1]] = 'S'
+            if self.fim is not None and self.fim[0] == r:
+                linha[self.fim[1]] = 'E'
+            resultado.append("".join(linha))
+        return resultado
+
+    def copia(self):
+        custos = bytearray(self.custos) if self.custos is not None else None
+        return GradeLabirinto(self.linhas, self.colunas, bytearray(self.celulas), self.inicio, self.fim, custos)
+
+    # -------------------
+    # ACESSO
+    # -------------------
+    def indice(self, r, c):
+        return r * self.colunas + c
+
+    def posicao(self, indice):
+        return divmod(indice, self.colunas)
+
+    def dentro(self, r, c):
+        return 0 <= r < self.linhas and 0 <= c < self.colunas
+
+    def eh_parede(self, r, c):
+        return self.celulas[r * self.colunas + c] == PAREDE
+
+    def caractere(self, r, c):
+        """Valor da célula no formato do editor: 'S', 'E', '#' ou ' '."""
+        if self.inicio == (r, c):
+            return 'S'
+        if self.fim == (r, c):
+            return 'E'
+        return '#' if self.celulas[r * self.colunas + c] == PAREDE else ' '
+
+    def definir_parede(self, r, c, parede=True):
+        self.celulas[r * self.colunas + c] = PAREDE if parede else LIVRE
+
+    def custo(self, r, c):
+        """Custo de entrar na célula (1 se a grade não tiver terreno)."""
+        return 1 if self.custos is None else self.custos[r * self.colunas + c]
+
+    def definir_custo(self, r, c, custo):
+        if not 1 <= custo <= 255:
+            raise ValueError(f"Custo deve estar entre 1 e 255, recebeu {custo}.")
+        if self.custos is None:
+            if custo == 1:
+                return
+            self.custos = bytearray([1]) * (self.linhas * self.colunas)
+        self.custos[r * self.colunas + c] = custo
+
+    def celulas_com_terreno(self):
+        """Índices das células com custo diferente de 1 (localizadas com translate + find, em C)."""
+        if self.custos is None:
+            return
+        marcas = self.custos.translate(_MARCA_TERRENO)
+        i = marcas.find(1)
+        while i != -1:
+            yield i
+            i = marcas.find(1, i + 1)
+
+    def vizinhos(self, indice):
+        """Vizinhos livres de uma célula: cima, baixo, esquerda, direita."""
+        colunas = self.colunas
+        celulas = self.celulas
+        r, c = divmod(indice, colunas)
+        if r > 0 and celulas[indice - colunas] != PAREDE:
+            yield indice - colunas
+        if r < self.linhas - 1 and celulas[indice + colunas] != PAREDE:
+            yield indice + colunas
+        if c > 0 and celulas[indice - 1] != PAREDE:
+            yield indice - 1
+        if c < colunas - 1 and celulas[indice + 1] != PAREDE:
+            yield indice + 1
+
+
+# -------------------
+# RESULTADO DA BUSCA
+# -------------------
+class ResultadoBusca:
+    """
+    Resultado de uma busca completa.
+
+    - caminho: lista de posições de S até E (vazia se não encontrado)
+    - distancias / predecessores: array('i') planos (-1 = não alcançado / sem predecessor)
+    - ordem_expansao: índices na ordem em que foram expandidos
+    - descobertas + inicio_descobertas: células descobertas em cada expansão
+      (as descobertas da expansão k estão em descobertas[inicio_descobertas[k]:inicio_descobertas[k + 1]])
+    O registro (ordem_expansao/descobertas) fica vazio quando a busca roda com registrar=False.
+    cancelado indica que o callback de progresso interrompeu a busca (caminho fica vazio).
+    """
+    def __init__(self, algoritmo, grade):
+        self.algoritmo = algoritmo
+        self.grade = grade
+        self.caminho = []
+        self.distancias = None
+        self.predecessores = None
+        self.ordem_expansao = array('i')
+        self.descobertas = array('i')
+        self.inicio_descobertas = array('i', [0])
+        self.expandidos = 0
+        self.tempo_ms = 0.0
+        self.cancelado = False
+
+    @property
+    def encontrado(self):
+        return bool(self.caminho)
+
+    @property
+    def nos_expandidos(self):
+        return self.expandidos
+
+    def memoria_bytes(self):
+        """Bytes ocupados pelos vetores do resultado (sem contar a grade)."""
+        total = 0
+        for vetor in (self.distancias, self.predecessores, self.ordem_expansao,
+                      self.descobertas, self.inicio_descobertas):
+            if vetor is not None:
+                total += len(vetor) * vetor.itemsize
+        return total
+
+    @property
+    def comprimento(self):
+        """Número de passos do caminho (-1 se não houver caminho)."""
+        return len(self.caminho) - 1 if self.caminho else -1
+
+    @property
+    def custo(self):
+        """Soma dos custos das células do caminho, sem contar S (-1 se não houver caminho)."""
+        if not self.caminho:
+            return -1
+        if self.grade.custos is None:
+            return len(self.caminho) - 1
+        custo = self.grade.custo
+        return sum(custo(r, c) for r, c in self.caminho[1:])
+
+    def passos(self):
+        """Itera (posição expandida, [posições descobertas]) na ordem da busca."""
+        posicao = self.grade.posicao
+        inicio = self.inicio_descobertas
+        for k, indice in enumerate(self.ordem_expansao):
+            novos = self.descobertas[inicio[k]:inicio[k + 1]]
+            yield posicao(indice), [posicao(i) for i in novos]
+
+    def __repr__(self):
+        return (f"ResultadoBusca({self.algoritmo}, encontrado={self.encontrado}, "
+                f"comprimento={self.comprimento}, custo={self.custo}, expandidos={self.nos_expandidos}, "
+                f"tempo={self.tempo_ms:.2f} ms)")
+
+
+def _reconstruir(grade, predecessores, destino):
+    caminho = []
+    atual = destino
+    while atual != -1:
+        caminho.append(grade.posicao(atual))
+        atual = predecessores[atual]
+    caminho.reverse()
+    return caminho
+
+
+def _interromper(progresso, resultado, expandidos):
+    """Informa o progresso; True se a busca deve parar."""
+    resultado.expandidos = expandidos
+    if progresso(resultado):
+        resultado.cancelado = True
+        return True
+    return False
+
+
+def _validar_extremos(grade, inicio, fim):
+    inicio = grade.inicio if inicio is None else inicio
+    fim = grade.fim if fim is None else fim
+    if inicio is None:
+        raise ValueError("Posição de início (S) não definida.")
+    if not grade.dentro(*inicio) or (fim is not None and not grade.dentro(*fim)):
+        raise ValueError("Início ou fim fora da grade.")
+    return inicio, fim
+
+
+def _extremo_em_parede(grade, inicio, fim):
+    """True se S ou E está em uma parede: não há caminho (como no HPA* e no IndiceAlcance)."""
+    celulas = grade.celulas
+    return celulas[grade.indice(*inicio)] == PAREDE or (fim is not None and celulas[grade.indice(*fim)] == PAREDE)
+
+
+# -------------------
+# BFS
+# -------------------
+def buscar_bfs(grade, inicio=None, fim=None, registrar=True, com_distancias=True, progresso=None):
+    """
+    BFS completa em uma chamada.
+    Se fim for None (e a grade não tiver E), calcula as distâncias para todas as células alcançáveis.
+    Em grades enormes, registrar=False dispensa o registro de expansões e
+    com_distancias=False dispensa o vetor de distâncias: sobram a grade (1 byte/célula),
+    o bitset de visitados (1 bit/célula) e os predecessores (4 bytes/célula).
+    """
+    inicio, fim = _validar_extremos(grade, inicio, fim)
+    resultado = ResultadoBusca("bfs", grade)
+    if _extremo_em_parede(grade, inicio, fim):
+        return resultado
+    t0 = time.perf_counter()
+
+    linhas, colunas, celulas = grade.linhas, grade.colunas, grade.celulas
+    n = linhas * colunas
+    visitado = novo_bitset(n)
+    predecessores = vetor_int32(n)
+    distancias = vetor_int32(n) if com_distancias else None
+    ordem = resultado.ordem_expansao
+    descobertas = resultado.descobertas
+    inicio_descobertas = resultado.inicio_descobertas
+
+    origem = grade.indice(*inicio)
+    destino = grade.indice(*fim) if fim is not None else -1
+    visitado[origem >> 3] |= BITS[origem & 7]
+    if distancias is not None:
+        distancias[origem] = 0
+    fila = deque([origem])
+    achou = origem == destino
+    expandidos = 0
+
+    while fila and not achou:
+        atual = fila.popleft()
+        expandidos += 1
+        if registrar:
+            ordem.append(atual)
+        r, c = divmod(atual, colunas)
+        for viz, ok in ((atual - colunas, r > 0), (atual + colunas, r < linhas - 1),
+                        (atual - 1, c > 0), (atual + 1, c < colunas - 1)):
+            if not ok or celulas[viz] == PAREDE:
+                continue
+            byte, bit = viz >> 3, BITS[viz & 7]
+            if visitado[byte] & bit:
+                continue
+            visitado[byte] |= bit
+            predecessores[viz] = atual
+            if distancias is not None:
+                distancias[viz] = distancias[atual] + 1
+            if registrar:
+                descobertas.append(viz)
+            fila.append(viz)
+            if viz == destino:
+                # Destino descoberto: a distância BFS já é mínima
+                achou = True
+                break
+        if registrar:
+            inicio_descobertas.append(len(descobertas))
+        if progresso is not None and expandidos % LOTE_PROGRESSO == 0 and _interromper(progresso, resultado, expandidos):
+            break
+
+    resultado.expandidos = expandidos
+    resultado.distancias = distancias
+    resultado.predecessores = predecessores
+    if achou:
+        resultado.caminho = _reconstruir(grade, predecessores, destino)
+    resultado.tempo_ms = (time.perf_counter() - t0) * 1000.0
+    return resultado
+
+
+def _exigir_fim(fim, algoritmo):
+    if fim is None:
+        raise ValueError(f"{algoritmo} precisa de uma posição de fim (E).")
+
+
+# -------------------
+# A* (HEURÍSTICA MANHATTAN)
+# -------------------
+def buscar_a_estrela(grade, inicio=None, fim=None, registrar=True, progresso=None):
+    """
+    A* com heurística Manhattan (admissível e consistente em grade 4-conexa).
+    Empates em f são desfeitos pelo menor h, o que favorece nós mais próximos
+    do destino e reduz as expansões em áreas abertas.
+    Com terreno, g soma o custo de cada célula e h = Manhattan * menor custo da grade.
+    """
+    inicio, fim = _validar_extremos(grade, inicio, fim)
+    _exigir_fim(fim, "A*")
+    resultado = ResultadoBusca("a_estrela", grade)
+    if _extremo_em_parede(grade, inicio, fim):
+        return resultado
+    t0 = time.perf_counter()
+
+    linhas, colunas, celulas = grade.linhas, grade.colunas, grade.celulas
+    n = linhas * colunas
+    distancias = vetor_int32(n)
+    predecessores = vetor_int32(n)
+    fechado = novo_bitset(n)
+    ordem = resultado.ordem_expansao
+    descobertas = resultado.descobertas
+    inicio_descobertas = resultado.inicio_descobertas
+
+    custos = grade.custos
+    minimo = min(custos) if custos is not None else 1
+
+    origem = grade.indice(*inicio)
+    destino = grade.indice(*fim)
+    fr, fc = fim
+    h0 = minimo * (abs(inicio[0] - fr) + abs(inicio[1] - fc))
+    distancias[origem] = 0
+    heap = [(h0, h0, origem)]
+    achou = False
+    expandidos = 0
+
+    while heap:
+        _, _, atual = heapq.heappop(heap)
+        if fechado[atual >> 3] & BITS[atual & 7]:
+            continue  # entrada antiga (já expandido com g menor)
+        if atual == destino:
+            achou = True
+            break
+        fechado[atual >> 3] |= BITS[atual & 7]
+        expandidos += 1
+        if registrar:
+            ordem.append(atual)
+        r, c = divmod(atual, colunas)
+        g_atual = distancias[atual]
+        for viz, vr, vc, ok in ((atual - colunas, r - 1, c, r > 0), (atual + colunas, r + 1, c, r < linhas - 1),
+                                (atual - 1, r, c - 1, c > 0), (atual + 1, r, c + 1, c < colunas - 1)):
+            if not ok or celulas[viz] == PAREDE or fechado[viz >> 3] & BITS[viz & 7]:
+                continue
+            g = g_atual + (custos[viz] if custos is not None else 1)
+            if distancias[viz] == -1 or g < distancias[viz]:
+                distancias[viz] = g
+                predecessores[viz] = atual
+                h = minimo * (abs(vr - fr) + abs(vc - fc))
+                heapq.heappush(heap, (g + h, h, viz))
+                if registrar:
+                    descobertas.append(viz)
+        if registrar:
+            inicio_descobertas.append(len(descobertas))
+        if progresso is not None and expandidos % LOTE_PROGRESSO == 0 and _interromper(progresso, resultado, expandidos):
+            break
+
+    resultado.expandidos = expandidos
+    resultado.distancias = distancias
+    resultado.predecessores = predecessores
+    if achou:
+        resultado.caminho = _reconstruir(grade, predecessores, destino)
+    resultado.tempo_ms = (time.perf_counter() - t0) * 1000.0
+    return resultado
+
+
+# -------------------
+# BFS BIDIRECIONAL
+# -------------------
+def buscar_bfs_bidirecional(grade, inicio=None, fim=None, registrar=True, progresso=None):
+    """
+    BFS simultânea a partir de S e de E, sempre expandindo um nível inteiro do
+    lado com a menor fronteira. Ao terminar um nível em que as buscas se
+    encontraram, o menor encontro desse nível é o caminho mínimo.
+    As distâncias retornadas são as do lado de S.
+    """
+    inicio, fim = _validar_extremos(grade, inicio, fim)
+    _exigir_fim(fim, "BFS bidirecional")
+    resultado = ResultadoBusca("bfs_bidirecional", grade)
+    if _extremo_em_parede(grade, inicio, fim):
+        return resultado
+    t0 = time.perf_counter()
+
+    linhas, colunas, celulas = grade.linhas, grade.colunas, grade.celulas
+    n = linhas * colunas
+    dist_ida, pred_ida = vetor_int32(n), vetor_int32(n)
+    dist_volta, pred_volta = vetor_int32(n), vetor_int32(n)
+    ordem = resultado.ordem_expansao
+    descobertas = resultado.descobertas
+    inicio_descobertas = resultado.inicio_descobertas
+
+    origem = grade.indice(*inicio)
+    destino = grade.indice(*fim)
+    dist_ida[origem] = 0
+    dist_volta[destino] = 0
+    fronteira_ida, fronteira_volta = [origem], [destino]
+    melhor, encontro = (0, origem) if origem == destino else (-1, -1)
+    expandidos = 0
+
+    while melhor == -1 and fronteira_ida and fronteira_volta and not resultado.cancelado:
+        # expande o lado com menos nós na fronteira
+        if len(fronteira_ida) <= len(fronteira_volta):
+            fronteira, dist, pred, dist_outro = fronteira_ida, dist_ida, pred_ida, dist_volta
+        else:
+            fronteira, dist, pred, dist_outro = fronteira_volta, dist_volta, pred_volta, dist_ida
+        proxima = []
+        for atual in fronteira:
+            expandidos += 1
+            if registrar:
+                ordem.append(atual)
+            r, c = divmod(atual, colunas)
+            d = dist[atual] + 1
+            for viz, ok in ((atual - colunas, r > 0), (atual + colunas, r < linhas - 1),
+                            (atual - 1, c > 0), (atual + 1, c < colunas - 1)):
+                if ok and dist[viz] == -1 and celulas[viz] != PAREDE:
+                    dist[viz] = d
+                    pred[viz] = atual
+                    proxima.append(viz)
+                    if registrar:
+                        descobertas.append(viz)
+                    if dist_outro[viz] != -1:
+                        total = d + dist_outro[viz]
+                        if melhor == -1 or total < melhor:
+                            melhor, encontro = total, viz
+            if registrar:
+                inicio_descobertas.append(len(descobertas))
+            if progresso is not None and expandidos % LOTE_PROGRESSO == 0 and _interromper(progresso, resultado, expandidos):
+                break
+        if fronteira is fronteira_ida:
+            fronteira_ida = proxima
+        else:
+            fronteira_volta = proxima
+
+    resultado.expandidos = expandidos
+    resultado.distancias = dist_ida
+    resultado.predecessores = pred_ida
+    if melhor != -1 and not resultado.cancelado:
+        caminho = _reconstruir(grade, pred_ida, encontro)
+        atual = pred_volta[encontro]
+        while atual != -1:
+            caminho.append(grade.posicao(atual))
+            atual = pred_volta[atual]
+        resultado.caminho = caminho
+    resultado.tempo_ms = (time.perf_counter() - t0) * 1000.0
+    return resultado
+
+
+# -------------------
+# JUMP POINT SEARCH (4-CONEXA)
+# -------------------
+def buscar_jps(grade, inicio=None, fim=None, registrar=True, progresso=None):
+    """
+    Jump Point Search para grade 4-conexa de custo uniforme.
+    A partir de cada ponto de salto a busca "pula" em linha reta e só para em
+    células com vizinhos forçados (ou no destino), então o A* subjacente expande
+    apenas os pontos de salto. Caminhos canônicos: vertical primeiro, depois horizontal.
+    Distâncias e predecessores são registrados apenas para os pontos de salto;
+    o caminho retornado contém todas as células.
+    """
+    inicio, fim = _validar_extremos(grade, inicio, fim)
+    _exigir_fim(fim, "JPS")
+    resultado = ResultadoBusca("jps", grade)
+    if _extremo_em_parede(grade, inicio, fim):
+        return resultado
+    t0 = time.perf_counter()
+
+    linhas, colunas, celulas = grade.linhas, grade.colunas, grade.celulas
+    n = linhas * colunas
+    fr, fc = fim
+
+    def livre(r, c):
+        return 0 <= r < linhas and 0 <= c < colunas and celulas[r * colunas + c] != PAREDE
+
+    def saltar_horizontal(r, c, dc):
+        while livre(r, c):
+            if r == fr and c == fc:
+                return r, c
+            if (livre(r - 1, c) and not livre(r - 1, c - dc)) or (livre(r + 1, c) and not livre(r + 1, c - dc)):
+                return r, c
+            c += dc
+        return None
+
+    def saltar_vertical(r, c, dr):
+        while livre(r, c):
+            if r == fr and c == fc:
+                return r, c
+            if (livre(r, c - 1) and not livre(r - dr, c - 1)) or (livre(r, c + 1) and not livre(r - dr, c + 1)):
+                return r, c
+            # caminhos canônicos viram para a horizontal: se houver salto horizontal útil, paramos aqui
+            if saltar_horizontal(r, c + 1, 1) or saltar_horizontal(r, c - 1, -1):
+                return r, c
+            r += dr
+        return None
+
+    distancias = vetor_int32(n)
+    predecessores = vetor_int32(n)
+    fechado = novo_bitset(n)
+    ordem = resultado.ordem_expansao
+    descobertas = resultado.descobertas
+    inicio_descobertas = resultado.inicio_descobertas
+
+    origem = grade.indice(*inicio)
+    destino = grade.indice(*fim)
+    h0 = abs(inicio[0] - fr) + abs(inicio[1] - fc)
+    distancias[origem] = 0
+    heap = [(h0, h0, origem)]
+    achou = False
+    expandidos = 0
+
+    while heap:
+        _, _, atual = heapq.heappop(heap)
+        if fechado[atual >> 3] & BITS[atual & 7]:
+            continue
+        if atual == destino:
+            achou = True
+            break
+        fechado[atual >> 3] |= BITS[atual & 7]
+        expandidos += 1
+        if registrar:
+            ordem.append(atual)
+        r, c = divmod(atual, colunas)
+        pai = predecessores[atual]
+        if pai == -1:
+            direcoes = ((-1, 0), (1, 0), (0, -1), (0, 1))
+        else:
+            pr, pc = divmod(pai, colunas)
+            dr = (r > pr) - (r < pr)
+            dc = (c > pc) - (c < pc)
+            # poda: todas as direções, exceto voltar pelo mesmo segmento
+            if dc:
+                direcoes = ((-1, 0), (1, 0), (0, dc))
+            else:
+                direcoes = ((0, -1), (0, 1), (dr, 0))
+        for dr, dc in direcoes:
+            if dc:
+                salto = saltar_horizontal(r, c + dc, dc)
+            else:
+                salto = saltar_vertical(r + dr, c, dr)
+            if salto is None:
+                continue
+            sr, sc = salto
+            viz = sr * colunas + sc
+            if fechado[viz >> 3] & BITS[viz & 7]:
+                continue
+            g = distancias[atual] + abs(sr - r) + abs(sc - c)
+            if distancias[viz] == -1 or g < distancias[viz]:
+                distancias[viz] = g
+                predecessores[viz] = atual
+                h = abs(sr - fr) + abs(sc - fc)
+                heapq.heappush(heap, (g + h, h, viz))
+                if registrar:
+                    descobertas.append(viz)
+        if registrar:
+            inicio_descobertas.append(len(descobertas))
+        if progresso is not None and expandidos % LOTE_PROGRESSO == 0 and _interromper(progresso, resultado, expandidos):
+            break
+
+    resultado.expandidos = expandidos
+    resultado.distancias = distancias
+    resultado.predecessores = predecessores
+    if achou:
+        # expande os segmentos retos entre pontos de salto
+        pontos = _reconstruir(grade, predecessores, destino)
+        caminho = [pontos[0]]
+        for (r1, c1), (r2, c2) in zip(pontos, pontos[1:]):
+            dr = (r2 > r1) - (r2 < r1)
+            dc = (c2 > c1) - (c2 < c1)
+            r, c = r1, c1
+            while (r, c) != (r2, c2):
+                r, c = r + dr, c + dc
+                caminho.append((r, c))
+        resultado.caminho = caminho
+    resultado.tempo_ms = (time.perf_counter() - t0) * 1000.0
+    return resultado
+
+
+# -------------------
+# DIJKSTRA (HEAP BINÁRIO)
+# -------------------
+def buscar_dijkstra(grade, inicio=None, fim=None, registrar=True, progresso=None):
+    """
+    Dijkstra pelo custo do terreno (custo de entrar em cada célula), com heapq
+    e remoção preguiçosa. Sem fim, calcula o custo mínimo até todas as células alcançáveis.
+    """
+    inicio, fim = _validar_extremos(grade, inicio, fim)
+    resultado = ResultadoBusca("dijkstra", grade)
+    if _extremo_em_parede(grade, inicio, fim):
+        return resultado
+    t0 = time.perf_counter()
+
+    linhas, colunas, celulas, custos = grade.linhas, grade.colunas, grade.celulas, grade.custos
+    n = linhas * colunas
+    distancias = vetor_int32(n)
+    predecessores = vetor_int32(n)
+    fechado = novo_bitset(n)
+    ordem = resultado.ordem_expansao
+    descobertas = resultado.descobertas
+    inicio_descobertas = resultado.inicio_descobertas
+
+    origem = grade.indice(*inicio)
+    destino = grade.indice(*fim) if fim is not None else -1
+    distancias[origem] = 0
+    heap = [(0, origem)]
+    achou = False
+    expandidos = 0
+
+    while heap:
+        d, atual = heapq.heappop(heap)
+        if fechado[atual >> 3] & BITS[atual & 7]:
+            continue  # entrada antiga
+        if atual == destino:
+            achou = True
+            break
+        fechado[atual >> 3] |= BITS[atual & 7]
+        expandidos += 1
+        if registrar:
+            ordem.append(atual)
+        r, c = divmod(atual, colunas)
+        for viz, ok in ((atual - colunas, r > 0), (atual + colunas, r < linhas - 1),
+                        (atual - 1, c > 0), (atual + 1, c < colunas - 1)):
+            if not ok or celulas[viz] == PAREDE or fechado[viz >> 3] & BITS[viz & 7]:
+                continue
+            nd = d + (custos[viz] if custos is not None else 1)
+            if distancias[viz] == -1 or nd < distancias[viz]:
+                distancias[viz] = nd
+                predecessores[viz] = atual
+                heapq.heappush(heap, (nd, viz))
+                if registrar:
+                    descobertas.append(viz)
+        if registrar:
+            inicio_descobertas.append(len(descobertas))
+        if progresso is not None and expandidos % LOTE_PROGRESSO == 0 and _interromper(progresso, resultado, expandidos):
+            break
+
+    resultado.expandidos = expandidos
+    resultado.distancias = distancias
+    resultado.predecessores = predecessores
+    if achou:
+        resultado.caminho = _reconstruir(grade, predecessores, destino)
+    resultado.tempo_ms = (time.perf_counter() - t0) * 1000.0
+    return resultado
+
+
+# -------------------
+# DIJKSTRA (FILA DE BALDES)
+# -------------------
+def buscar_dijkstra_baldes(grade, inicio=None, fim=None, registrar=True, progresso=None):
+    """
+    Algoritmo de Dial: como os custos são inteiros pequenos (1..C), a fila de
+    prioridade vira um anel de C + 1 baldes (listas) indexado por distância % (C + 1).
+    Inserir e remover custam O(1); não há comparações de heap.
+    """
+    inicio, fim = _validar_extremos(grade, inicio, fim)
+    resultado = ResultadoBusca("dijkstra_baldes", grade)
+    if _extremo_em_parede(grade, inicio, fim):
+        return resultado
+    t0 = time.perf_counter()
+
+    linhas, colunas, celulas, custos = grade.linhas, grade.colunas, grade.celulas, grade.custos
+    n = linhas * colunas
+    distancias = vetor_int32(n)
+    predecessores = vetor_int32(n)
+    ordem = resultado.ordem_expansao
+    descobertas = resultado.descobertas
+    inicio_descobertas = resultado.inicio_descobertas
+
+    anel = (max(custos) if custos is not None else 1) + 1
+    baldes = [[] for _ in range(anel)]
+    origem = grade.indice(*inicio)
+    destino = grade.indice(*fim) if fim is not None else -1
+    distancias[origem] = 0
+    baldes[0].append(origem)
+    pendentes = 1
+    d = 0
+    achou = False
+    expandidos = 0
+
+    while pendentes:
+        balde = baldes[d % anel]
+        if not balde:
+            d += 1
+            continue
+        atual = balde.pop()
+        pendentes -= 1
+        if distancias[atual] != d:
+            continue  # entrada antiga: a célula já saiu de um balde anterior
+        if atual == destino:
+            achou = True
+            break
+        expandidos += 1
+        if registrar:
+            ordem.append(atual)
+        r, c = divmod(atual, colunas)
+        for viz, ok in ((atual - colunas, r > 0), (atual + colunas, r < linhas - 1),
+                        (atual - 1, c > 0), (atual + 1, c < colunas - 1)):
+            if not ok or celulas[viz] == PAREDE:
+                continue
+            nd = d + (custos[viz] if custos is not None else 1)
+            if distancias[viz] == -1 or nd < distancias[viz]:
+                distancias[viz] = nd
+                predecessores[viz] = atual
+                baldes[nd % anel].append(viz)
+                pendentes += 1
+                if registrar:
+                    descobertas.append(viz)
+        if registrar:
+            inicio_descobertas.append(len(descobertas))
+        if progresso is not None and expandidos % LOTE_PROGRESSO == 0 and _interromper(progresso, resultado, expandidos):
+            break
+
+    resultado.expandidos = expandidos
+    resultado.distancias = distancias
+    resultado.predecessores = predecessores
+    if achou:
+        resultado.caminho = _reconstruir(grade, predecessores, destino)
+    resultado.tempo_ms = (time.perf_counter() - t0) * 1000.0
+    return resultado
+
+
+# -------------------
+# SELEÇÃO DE ALGORITMO
+# -------------------
+ALGORITMOS = {
+    "bfs": buscar_bfs,
+    "a_estrela": buscar_a_estrela,
+    "bfs_bidirecional": buscar_bfs_bidirecional,
+    "jps": buscar_jps,
+    "dijkstra": buscar_dijkstra,
+    "dijkstra_baldes": buscar_dijkstra_baldes,
+}
+
+
+def buscar(grade, algoritmo="bfs", inicio=None, fim=None, indice=None, **opcoes):
+    """
+    Executa o algoritmo escolhido pelo nome (chaves de ALGORITMOS).
+    Opções extras (ex.: registrar=False, progresso=callback) são repassadas ao algoritmo.
+    Com um índice de alcance (componentes_labirinto.IndiceAlcance) atualizado,
+    labirintos sem caminho de S a E são rejeitados sem executar a busca.
+    """
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo!r}. Opções: {', '.join(ALGORITMOS)}.")
+    if indice is not None:
+        inicio, fim = _validar_extremos(grade, inicio, fim)
+        if fim is not None and not indice.alcancavel(inicio, fim):
+            return ResultadoBusca(algoritmo, grade)
+    return ALGORITMOS[algoritmo](grade, inicio, fim, **opcoes)
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    exemplo = [
+        "S   #     ",
+        " ## # ### ",
+        "  #   #   ",
+        "# ##### # ",
+        "        #E",
+    ]
+    grade = GradeLabirinto.de_texto(exemplo)
+    for nome in ALGORITMOS:
+        res = buscar(grade, nome)
+        print(res)
+    print("Caminho:", res.caminho)
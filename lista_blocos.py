@@ -0,0 +1,238 @@
+"""
+Lista ordenada em blocos (alternativa à ArvoreAVL sem um objeto por chave)
+
+- As chaves ficam em uma lista de blocos, cada um uma lista Python ordenada com até
+  2*CARGA chaves, mais o máximo de cada bloco (`maximos`)
+- Busca: bisect em `maximos` escolhe o bloco, bisect no bloco acha a posição (dois
+  bisects em C); inserção/remoção deslocam só as chaves de um bloco
+- Blocos que passam de 2*CARGA são divididos ao meio; blocos que ficam com menos de
+  CARGA/2 após uma remoção são juntados ao vizinho
+- Índice posicional: árvore de Fenwick com o tamanho de cada bloco, para lista[i]
+  e posicao(chave) em O(log n); é mantida a cada inserção/remoção e refeita (O(blocos))
+  na próxima consulta posicional depois de uma divisão ou junção de blocos
+- Mesma API da ArvoreAVL (inserir, deletar, encontrar_nos_intervalo, percurso_em_ordem)
+
+Uso:
+    lista = ListaBlocos([5, 1, 9])
+    lista.inserir(3)
+    print(lista.encontrar_nos_intervalo(2, 9), lista[0], lista.posicao(9))
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+# Tamanho de referência dos blocos (como no sortedcontainers): blocos de ~1000 chaves
+# deslocam poucos KB por inserção e mantêm `maximos` pequeno para 10^6..10^8 chaves
+CARGA = 1000
+
+
+class ListaBlocos:
+    """Conjunto ordenado de chaves distintas em blocos ordenados."""
+    def __init__(self, chaves=(), carga=CARGA):
+        if carga < 4:
+            raise ValueError("A carga dos blocos deve ser pelo menos 4.")
+        self.carga = carga
+        ordenadas = sorted(set(chaves))
+        self._blocos = [ordenadas[i:i + carga] for i in range(0, len(ordenadas), carga)]
+        self._maximos = [bloco[-1] for bloco in self._blocos]
+        self._tamanho = len(ordenadas)
+        self._fenwick = None  # índice posicional; None = refazer na próxima consulta
+
+    def __len__(self):
+        return self._tamanho
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocos)
+
+    def __repr__(self):
+        return f"ListaBlocos({self._tamanho} chaves em {len(self._blocos)} blocos)"
+
+    # -------------------
+    # BUSCA
+    # -------------------
+    def _localizar(self, chave):
+        """(bloco, posição no bloco) da primeira chave >= chave; bloco = len(blocos) se não há."""
+        b = bisect_left(self._maximos, chave)
+        if b == len(self._maximos):
+            return b, 0
+        return b, bisect_left(self._blocos[b], chave)
+
+    def __contains__(self, chave):
+        b, i = self._localizar(chave)
+        return b < len(self._blocos) and self._blocos[b][i] == chave
+
+    def minimo(self):
+        if not self._blocos:
+            raise ValueError("Lista vazia.")
+        return self._blocos[0][0]
+
+    def maximo(self):
+        if not self._blocos:
+            raise ValueError("Lista vazia.")
+        return self._maximos[-1]
+
+    def encontrar_nos_intervalo(self, chave1, chave2):
+        """Lista das chaves em [chave1, chave2], em ordem."""
+        if chave1 > chave2 or not self._blocos:
+            return []
+        blocos, maximos = self._blocos, self._maximos
+        b1, i1 = self._localizar(chave1)
+        if b1 == len(blocos):
+            return []
+        b2 = min(bisect_left(maximos, chave2), len(blocos) - 1)
+        i2 = bisect_right(blocos[b2], chave2)
+        if b1 == b2:
+            return blocos[b1][i1:i2]
+        resultado = blocos[b1][i1:]
+        for b in range(b1 + 1, b2):
+            resultado.extend(blocos[b])
+        resultado.extend(blocos[b2][:i2])
+        return resultado
+
+    def percurso_em_ordem(self):
+        return list(chain.from_iterable(self._blocos))
+
+    # -------------------
+    # INSERÇÃO / REMOÇÃO
+    # -------------------
+    def inserir(self, chave):
+        """Insere a chave; chaves repetidas não são permitidas (como na ArvoreAVL)."""
+        blocos, maximos = self._blocos, self._maximos
+        if not blocos:
+            blocos.append([chave])
+            maximos.append(chave)
+            self._tamanho = 1
+            self._fenwick = None
+            return
+        b = bisect_left(maximos, chave)
+        if b == len(blocos):
+            # maior que todas: vai para o fim do último bloco
+            b -= 1
+            bloco = blocos[b]
+            bloco.append(chave)
+            maximos[b] = chave
+        else:
+            bloco = blocos[b]
+            i = bisect_left(bloco, chave)
+            if bloco[i] == chave:
+                raise ValueError(f"Chave {chave} já existe na lista.")
+            bloco.insert(i, chave)
+        self._tamanho += 1
+        if len(bloco) > 2 * self.carga:
+            self._dividir(b)
+        elif self._fenwick is not None:
+            self._fenwick_somar(b, 1)
+
+    def deletar(self, chave):
+        """Remove a chave (chave ausente: nada muda, como na ArvoreAVL)."""
+        b, i = self._localizar(chave)
+        blocos = self._blocos
+        if b == len(blocos) or blocos[b][i] != chave:
+            return
+        bloco = blocos[b]
+        del bloco[i]
+        self._tamanho -= 1
+        if not bloco:
+            del blocos[b]
+            del self._maximos[b]
+            self._fenwick = None
+            return
+        if i == len(bloco):
+            self._maximos[b] = bloco[-1]
+        if len(bloco) < self.carga // 2 and len(blocos) > 1:
+            self._juntar(b)
+        elif self._fenwick is not None:
+            self._fenwick_somar(b, -1)
+
+    def _dividir(self, b):
+        bloco = self._blocos[b]
+        metade = len(bloco) // 2
+        self._blocos.insert(b + 1, bloco[metade:])
+        del bloco[metade:]
+        self._maximos.insert(b, bloco[-1])
+        self._fenwick = None
+
+    def _juntar(self, b):
+        """Junta o bloco b ao vizinho (o anterior, ou o seguinte no primeiro bloco)."""
+        if b == 0:
+            b = 1
+        blocos, maximos = self._blocos, self._maximos
+        blocos[b - 1].extend(blocos[b])
+        maximos[b - 1] = maximos[b]
+        del blocos[b]
+        del maximos[b]
+        if len(blocos[b - 1]) > 2 * self.carga:
+            self._dividir(b - 1)
+        self._fenwick = None
+
+    # -------------------
+    # ÍNDICE POSICIONAL (FENWICK SOBRE OS TAMANHOS DOS BLOCOS)
+    # -------------------
+    def _fenwick_montar(self):
+        arvore = [0] + [len(bloco) for bloco in self._blocos]
+        n = len(arvore)
+        for i in range(1, n):
+            pai = i + (i & -i)
+            if pai < n:
+                arvore[pai] += arvore[i]
+        self._fenwick = arvore
+        return arvore
+
+    def _fenwick_somar(self, b, delta):
+        arvore = self._fenwick
+        i = b + 1
+        while i < len(arvore):
+            arvore[i] += delta
+            i += i & -i
+
+    def posicao(self, chave):
+        """Quantidade de chaves menores que chave (posição em que ela está ou estaria)."""
+        b, i = self._localizar(chave)
+        if b == len(self._blocos):
+            return self._tamanho
+        arvore = self._fenwick or self._fenwick_montar()
+        antes = 0
+        while b > 0:
+            antes += arvore[b]
+            b -= b & -b
+        return antes + i
+
+    def __getitem__(self, posicao):
+        if isinstance(posicao, slice):
+            return [self[i] for i in range(*posicao.indices(self._tamanho))]
+        if posicao < 0:
+            posicao += self._tamanho
+        if not 0 <= posicao < self._tamanho:
+            raise IndexError("Posição fora da lista.")
+        arvore = self._fenwick or self._fenwick_montar()
+        # descida binária na Fenwick: maior prefixo de blocos com soma <= posicao
+        b, passo = 0, 1 << (len(arvore) - 1).bit_length()
+        while passo:
+            proximo = b + passo
+            if proximo < len(arvore) and arvore[proximo] <= posicao:
+                b = proximo
+                posicao -= arvore[proximo]
+            passo >>= 1
+        return self._blocos[b][posicao]
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    import random
+    import time
+
+    from atividade_5 import ArvoreAVL
+
+    chaves = random.sample(range(10 ** 7), 200_000)
+    for nome, estrutura in (("ListaBlocos", ListaBlocos()), ("ArvoreAVL", ArvoreAVL())):
+        t0 = time.perf_counter()
+        for chave in chaves:
+            estrutura.inserir(chave)
+        t1 = time.perf_counter()
+        intervalo = estrutura.encontrar_nos_intervalo(5_000_000, 5_100_000)
+        print(f"{nome}: {len(chaves)} inserções em {(t1 - t0) * 1000:.0f} ms, "
+              f"{len(intervalo)} chaves em [5 000 000, 5 100 000]")
+    lista = ListaBlocos(chaves)
+    print(f"{lista}: mediana = {lista[len(lista) // 2]}, posição de {chaves[0]} = {lista.posicao(chaves[0])}")
@@ -0,0 +1,164 @@
+"""
+Resolução de labirintos em lote, distribuída entre processos
+
+- Aceita muitas grades, cada uma com uma ou várias consultas (S, E)
+- As células de todas as grades vão para um único bloco de memória compartilhada
+  (multiprocessing.shared_memory): os processos leem as grades direto do bloco,
+  sem serializar (pickle) os bytes das células; só os metadados e os caminhos trafegam
+- Custos de terreno (grade.custos), quando existem, vão para o mesmo bloco
+- Consultas da mesma grade com o mesmo S e algoritmo BFS compartilham uma única
+  BFS completa (um vetor de predecessores atende todos os destinos)
+- Grades com muitas consultas são divididas em várias tarefas
+
+Uso:
+    resultados = resolver_lote([grade1, (grade2, [((0, 0), (9, 9)), ((0, 0), (5, 3))])])
+    comprimento, caminho = resultados[1][0]
+"""
+
+import os
+from collections import defaultdict
+
+from labirinto import ALGORITMOS, GradeLabirinto, _reconstruir, buscar, buscar_bfs
+
+# Consultas por tarefa: grades com mais consultas que isso são divididas entre processos
+CONSULTAS_POR_TAREFA = 64
+
+# Bloco compartilhado visto pelo processo trabalhador (anexado uma vez no inicializador)
+_memoria = None
+
+
+def _anexar_memoria(nome):
+    global _memoria
+    from multiprocessing import shared_memory
+    _memoria = shared_memory.SharedMemory(name=nome)
+
+
+# -------------------
+# TRABALHO DE UMA TAREFA
+# -------------------
+def _resolver_consultas(grade, consultas, algoritmo):
+    """Resolve as consultas de uma grade: lista de (comprimento, caminho) na mesma ordem."""
+    resultados = [None] * len(consultas)
+    if algoritmo == "bfs":
+        # agrupa por origem: uma BFS completa por S distinto
+        por_origem = defaultdict(list)
+        for k, (inicio, fim) in enumerate(consultas):
+            por_origem[inicio].append((k, fim))
+        for inicio, destinos in por_origem.items():
+            if len(destinos) == 1:
+                k, fim = destinos[0]
+                res = buscar_bfs(grade, inicio, fim, registrar=False, com_distancias=False)
+                resultados[k] = (res.comprimento, res.caminho)
+                continue
+            # a grade não tem E: a BFS cobre todo o componente de S
+            res = buscar_bfs(grade, inicio, None, registrar=False, com_distancias=False)
+            origem = grade.indice(*inicio)
+            for k, fim in destinos:
+                destino = grade.indice(*fim)
+                if res.predecessores is None or (destino != origem and res.predecessores[destino] == -1):
+                    resultados[k] = (-1, [])
+                else:
+                    caminho = _reconstruir(grade, res.predecessores, destino)
+                    resultados[k] = (len(caminho) - 1, caminho)
+        return resultados
+    for k, (inicio, fim) in enumerate(consultas):
+        res = buscar(grade, algoritmo, inicio, fim, registrar=False)
+        resultados[k] = (res.comprimento, res.caminho)
+    return resultados
+
+
+def _executar_tarefa(tarefa):
+    deslocamento, deslocamento_custos, linhas, colunas, consultas, algoritmo = tarefa
+    n = linhas * colunas
+    # visões sem cópia dos trechos do bloco compartilhado
+    visao = _memoria.buf[deslocamento:deslocamento + n]
+    custos = _memoria.buf[deslocamento_custos:deslocamento_custos + n] if deslocamento_custos >= 0 else None
+    try:
+        return _resolver_consultas(GradeLabirinto(linhas, colunas, visao, custos=custos), consultas, algoritmo)
+    finally:
+        visao.release()
+        if custos is not None:
+            custos.release()
+
+
+# -------------------
+# API
+# -------------------
+def _normalizar(entrada):
+    """Aceita uma GradeLabirinto (usa S e E dela) ou um par (grade, [(S, E), ...])."""
+    if isinstance(entrada, GradeLabirinto):
+        if entrada.inicio is None or entrada.fim is None:
+            raise ValueError("Grade sem início (S) ou fim (E) definido e sem consultas.")
+        return entrada, [(entrada.inicio, entrada.fim)]
+    grade, consultas = entrada
+    consultas = [(tuple(inicio), tuple(fim)) for inicio, fim in consultas]
+    for inicio, fim in consultas:
+        if not grade.dentro(*inicio) or not grade.dentro(*fim):
+            raise ValueError("Início ou fim fora da grade.")
+    return grade, consultas
+
+
+def resolver_lote(entradas, algoritmo="bfs", processos=None, consultas_por_tarefa=CONSULTAS_POR_TAREFA):
+    """
+    Resolve todas as consultas de todas as grades.
+    Retorna uma lista (uma por grade, na ordem de entrada) de listas de
+    (comprimento, caminho); comprimento -1 e caminho [] quando não há caminho.
+    processos=None usa todos os núcleos; processos=1 resolve no próprio processo.
+    """
+    if algoritmo not in ALGORITMOS:
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo!r}. Opções: {', '.join(ALGORITMOS)}.")
+    normalizadas = [_normalizar(e) for e in entradas]
+    if processos is None:
+        processos = os.cpu_count() or 1
+    if processos <= 1:
+        # grades sem S/E (mesmas células, sem cópia), como as montadas nos trabalhadores
+        return [_resolver_consultas(GradeLabirinto(grade.linhas, grade.colunas, grade.celulas, custos=grade.custos),
+                                    consultas, algoritmo)
+                for grade, consultas in normalizadas]
+
+    # multiprocessing/concurrent.futures só são carregados quando há processos (importação rápida)
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    total = sum(grade.linhas * grade.colunas * (1 if grade.custos is None else 2) for grade, _ in normalizadas)
+    memoria = shared_memory.SharedMemory(create=True, size=max(total, 1))
+    try:
+        tarefas = []  # (índice da grade, posição da primeira consulta, tarefa)
+        deslocamento = 0
+        for g, (grade, consultas) in enumerate(normalizadas):
+            n = grade.linhas * grade.colunas
+            memoria.buf[deslocamento:deslocamento + n] = grade.celulas
+            deslocamento_custos = -1
+            if grade.custos is not None:
+                deslocamento_custos = deslocamento + n
+                memoria.buf[deslocamento_custos:deslocamento_custos + n] = grade.custos
+            for k in range(0, len(consultas), consultas_por_tarefa):
+                fatia = consultas[k:k + consultas_por_tarefa]
+                tarefas.append((g, k, (deslocamento, deslocamento_custos, grade.linhas, grade.colunas, fatia, algoritmo)))
+            deslocamento += n if grade.custos is None else 2 * n
+
+        resultados = [[None] * len(consultas) for _, consultas in normalizadas]
+        with ProcessPoolExecutor(max_workers=processos, initializer=_anexar_memoria,
+                                 initargs=(memoria.name,)) as executor:
+            # tarefas maiores primeiro equilibram melhor a carga entre os processos
+            ordem = sorted(range(len(tarefas)), key=lambda t: -tarefas[t][2][2] * tarefas[t][2][3])
+            respostas = executor.map(_executar_tarefa, [tarefas[t][2] for t in ordem])
+            for t, resposta in zip(ordem, respostas):
+                g, k, _ = tarefas[t]
+                resultados[g][k:k + len(resposta)] = resposta
+        return resultados
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    from gerador_labirinto import gerar
+
+    grades = [gerar("backtracker", 101, 101, semente) for semente in range(8)]
+    entradas = [(g, [(g.inicio, g.fim), (g.inicio, (51, 51)), ((99, 1), (1, 99))]) for g in grades]
+    for g, respostas in enumerate(resolver_lote(entradas, processos=2)):
+        print(f"grade {g}: comprimentos {[comprimento for comprimento, _ in respostas]}")
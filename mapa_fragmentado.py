@@ -0,0 +1,183 @@
+"""
+Mapa ordenado fragmentado por faixas de chaves, seguro para várias threads
+
+- O espaço de chaves é dividido em N faixas pelas `fronteiras` (N - 1 chaves em ordem
+  crescente); a faixa i guarda as chaves com fronteiras[i-1] <= chave < fronteiras[i]
+- Cada fragmento é uma ArvoreAVL (via ColecaoArvoreAVL, que guarda os valores do mapa)
+  com a sua própria trava: operações pontuais travam só um fragmento, então threads
+  que mexem em faixas diferentes não se esperam (em CPython sem GIL, rodam em núcleos
+  diferentes; com GIL, as travas só garantem a correção)
+- Intervalos: os fragmentos que cobrem [inicio, fim] são travados em ordem crescente
+  (nunca há espera circular) e os pedaços, já ordenados e disjuntos, são concatenados;
+  o resultado é um retrato consistente daquelas faixas
+- inserir_lote: particiona o lote por fragmento e aplica cada parte em uma thread,
+  pegando a trava do fragmento uma vez por parte
+- de_amostra(chaves, fragmentos) escolhe as fronteiras pelos quantis de uma amostra
+
+Uso:
+    mapa = MapaFragmentado.de_amostra(random.sample(range(10 ** 6), 1000), fragmentos=8)
+    mapa.inserir_lote((k, str(k)) for k in range(0, 10 ** 6, 7))
+    print(mapa.obter(700), mapa.intervalo(1000, 1100))
+"""
+
+import threading
+from bisect import bisect_right
+
+from colecao_ordenada import ColecaoArvoreAVL
+
+
+class Fragmento:
+    """Uma faixa do mapa: coleção ordenada + trava."""
+    __slots__ = ("colecao", "trava")
+
+    def __init__(self):
+        self.colecao = ColecaoArvoreAVL()
+        self.trava = threading.Lock()
+
+
+class MapaFragmentado:
+    def __init__(self, fronteiras=()):
+        fronteiras = list(fronteiras)
+        if any(a >= b for a, b in zip(fronteiras, fronteiras[1:])):
+            raise ValueError("As fronteiras devem estar em ordem crescente e sem repetição.")
+        self.fronteiras = fronteiras
+        self.fragmentos = [Fragmento() for _ in range(len(fronteiras) + 1)]
+
+    @classmethod
+    def de_amostra(cls, chaves, fragmentos):
+        """Fronteiras nos quantis da amostra: cada fragmento recebe ~ a mesma fração das chaves."""
+        ordenadas = sorted(set(chaves))
+        if fragmentos < 1:
+            raise ValueError("É preciso pelo menos um fragmento.")
+        passo = len(ordenadas) / fragmentos
+        fronteiras = sorted({ordenadas[int(i * passo)] for i in range(1, fragmentos) if int(i * passo) > 0})
+        return cls(fronteiras)
+
+    def fragmento(self, chave):
+        return self.fragmentos[bisect_right(self.fronteiras, chave)]
+
+    def __len__(self):
+        total = 0
+        for fragmento in self.fragmentos:
+            with fragmento.trava:
+                total += len(fragmento.colecao)
+        return total
+
+    def __repr__(self):
+        return f"MapaFragmentado({len(self.fragmentos)} fragmentos)"
+
+    # -------------------
+    # OPERAÇÕES PONTUAIS (uma trava)
+    # -------------------
+    def inserir(self, chave, valor=None):
+        """Insere a chave (ou troca o valor dela); devolve True se a chave é nova."""
+        fragmento = self.fragmento(chave)
+        with fragmento.trava:
+            return fragmento.colecao.inserir(chave, valor)
+
+    def remover(self, chave):
+        fragmento = self.fragmento(chave)
+        with fragmento.trava:
+            return fragmento.colecao.remover(chave)
+
+    def contem(self, chave):
+        fragmento = self.fragmento(chave)
+        with fragmento.trava:
+            return fragmento.colecao.contem(chave)
+
+    def obter(self, chave, padrao=None):
+        fragmento = self.fragmento(chave)
+        with fragmento.trava:
+            return fragmento.colecao.obter(chave, padrao)
+
+    __contains__ = contem
+
+    def __getitem__(self, chave):
+        fragmento = self.fragmento(chave)
+        with fragmento.trava:
+            return fragmento.colecao[chave]
+
+    def __setitem__(self, chave, valor):
+        self.inserir(chave, valor)
+
+    def __delitem__(self, chave):
+        if not self.remover(chave):
+            raise KeyError(chave)
+
+    # -------------------
+    # INTERVALOS (travas em ordem crescente)
+    # -------------------
+    def _travar_faixa(self, inicio, fim):
+        primeiro = bisect_right(self.fronteiras, inicio)
+        ultimo = bisect_right(self.fronteiras, fim)
+        fragmentos = self.fragmentos[primeiro:ultimo + 1]
+        for fragmento in fragmentos:
+            fragmento.trava.acquire()
+        return fragmentos
+
+    def intervalo(self, inicio, fim):
+        """Chaves em [inicio, fim], em ordem (retrato consistente das faixas envolvidas)."""
+        if inicio > fim:
+            return []
+        fragmentos = self._travar_faixa(inicio, fim)
+        try:
+            resultado = []
+            for fragmento in fragmentos:
+                resultado.extend(fragmento.colecao.intervalo(inicio, fim))
+            return resultado
+        finally:
+            for fragmento in reversed(fragmentos):
+                fragmento.trava.release()
+
+    def itens(self):
+        """Pares (chave, valor) em ordem; cada fragmento é copiado sob a sua trava."""
+        for fragmento in self.fragmentos:
+            with fragmento.trava:
+                pedaco = list(fragmento.colecao.itens())
+            yield from pedaco
+
+    def __iter__(self):
+        return (chave for chave, _ in self.itens())
+
+    # -------------------
+    # LOTES (um fragmento por thread)
+    # -------------------
+    def inserir_lote(self, itens, threads=None):
+        """
+        Insere chaves ou pares (chave, valor). Cada fragmento recebe a sua parte de uma
+        vez, em uma thread do pool (threads=None: uma por fragmento com itens).
+        Devolve quantas chaves eram novas.
+        """
+        partes = {}
+        fronteiras = self.fronteiras
+        for item in itens:
+            chave, valor = item if isinstance(item, tuple) else (item, None)
+            partes.setdefault(bisect_right(fronteiras, chave), []).append((chave, valor))
+        if not partes:
+            return 0
+
+        def aplicar(indice):
+            fragmento = self.fragmentos[indice]
+            inserir = fragmento.colecao.inserir
+            with fragmento.trava:
+                return sum(inserir(chave, valor) for chave, valor in partes[indice])
+
+        if threads == 1 or len(partes) == 1:
+            return sum(map(aplicar, partes))
+        from concurrent.futures import ThreadPoolExecutor  # só quando há threads (importação rápida)
+        with ThreadPoolExecutor(max_workers=threads or len(partes)) as executor:
+            return sum(executor.map(aplicar, partes))
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    import random
+
+    mapa = MapaFragmentado.de_amostra(random.sample(range(10 ** 6), 1000), fragmentos=8)
+    novas = mapa.inserir_lote((k, f"v{k}") for k in random.sample(range(10 ** 6), 50_000))
+    print(f"{mapa}: fronteiras {mapa.fronteiras}")
+    print(f"{novas} chaves inseridas; por fragmento: {[len(f.colecao) for f in mapa.fragmentos]}")
+    intervalo = mapa.intervalo(120_000, 130_000)
+    print(f"[120000, 130000]: {len(intervalo)} chaves, primeira {intervalo[0]} = {mapa[intervalo[0]]!r}")
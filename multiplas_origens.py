@@ -0,0 +1,327 @@
+"""
+BFS de várias origens ao mesmo tempo com paralelismo de bits (MS-BFS)
+
+- Cada vértice guarda uma máscara de bits: o bit j indica que a origem j já chegou
+  até ele; a fronteira de cada nível também é uma máscara por vértice
+- Um nível inteiro é propagado de uma vez para todas as origens: a máscara da
+  fronteira de u vai para os vizinhos com um OR, e os bits novos de v são
+  fronteira & ~visto (uma só passada pelo grafo por nível, não uma por origem)
+- Com NumPy: palavras uint64 (64 origens por palavra, k origens em ceil(k / 64)
+  palavras por vértice); em grades a fronteira é uma matriz (linhas, colunas, palavras)
+  deslocada nas 4 direções, em grafos CSR o OR é agrupado por destino com reduceat
+- Sem NumPy, em grades: a grade inteira é um único inteiro do Python com uma faixa
+  de bits por célula (uma origem por bit); um nível é propagado com 4 deslocamentos
+  e alguns AND/OR sobre esse inteiro (laços em C, nenhum laço por célula). O nível em
+  que cada bit foi alcançado é guardado em planos de bits (plano b recebe os bits
+  alcançados em níveis com o bit b ligado) e as distâncias de cada origem são
+  montadas no fim com fatias e translate de bytes
+- Sem NumPy, em grafos CSR: inteiros do Python como máscaras por vértice (dict por nível)
+- Distâncias por origem opcionais (com_distancias=False devolve só o alcance)
+
+Aceita um GrafoCSR (origens = vértices) ou uma GradeLabirinto (origens = (r, c);
+vértice = r * colunas + c).
+
+Uso:
+    res = bfs_multiplas_origens(grade, [(1, 1), (5, 7), (9, 3)])
+    res.distancia(1, grade.indice(9, 9))     # distância da origem 1 até (9, 9)
+    res.alcanca(2, grade.indice(0, 0))       # a origem 2 alcança (0, 0)?
+"""
+
+import sys
+import time
+from array import array
+
+from grafo_csr import numpy
+from labirinto import PAREDE, GradeLabirinto
+
+# byte -> byte com só o bit b (0 ou 1); e o complemento, para "não alcançado"
+_BIT_DO_BYTE = [bytes((x >> b) & 1 for x in range(256)) for b in range(8)]
+_SEM_BIT_DO_BYTE = [bytes(1 - ((x >> b) & 1) for x in range(256)) for b in range(8)]
+_LIVRE_PARA_FF = bytes(0 if x == PAREDE else 0xFF for x in range(256))
+
+
+class ResultadoMultiplasOrigens:
+    """
+    alcance: máscara por vértice (ndarray (n, palavras) uint64 com NumPy; lista de int sem)
+    distancias: uma array por origem (-1 = não alcançado) ou None
+    niveis: maior distância encontrada (excentricidade máxima entre as origens)
+    """
+    def __init__(self, origens, alcance, distancias, niveis, tempo_ms):
+        self.origens = origens
+        self.alcance = alcance
+        self.distancias = distancias
+        self.niveis = niveis
+        self.tempo_ms = tempo_ms
+
+    def alcanca(self, j, v):
+        """True se a origem j alcança o vértice v."""
+        mascara = self.alcance[v]
+        if numpy is not None and isinstance(self.alcance, numpy.ndarray):
+            return bool((int(mascara[j >> 6]) >> (j & 63)) & 1)
+        return bool((mascara >> j) & 1)
+
+    def distancia(self, j, v):
+        if self.distancias is None:
+            raise ValueError("Distâncias não calculadas (com_distancias=False).")
+        return int(self.distancias[j][v])
+
+    def __repr__(self):
+        return (f"ResultadoMultiplasOrigens(origens={len(self.origens)}, niveis={self.niveis}, "
+                f"tempo_ms={self.tempo_ms:.1f})")
+
+
+# -------------------
+# API
+# -------------------
+def bfs_multiplas_origens(grafo, origens, com_distancias=True):
+    """BFS de todas as origens em uma única passada por nível."""
+    t0 = time.perf_counter()
+    if isinstance(grafo, GradeLabirinto):
+        grade = grafo
+        for pos in origens:
+            if not grade.dentro(*pos):
+                raise ValueError(f"Origem {pos} fora da grade.")
+        vertices = [grade.indice(*pos) for pos in origens]
+        propagar = _grade_numpy if numpy is not None else _grade_inteiros
+        alcance, distancias, niveis = propagar(grade, vertices, com_distancias)
+    else:
+        vertices = [int(v) for v in origens]
+        for v in vertices:
+            if not 0 <= v < grafo.n:
+                raise ValueError(f"Origem {v} fora do intervalo 0..{grafo.n - 1}.")
+        propagar = _propagar_numpy if numpy is not None else _propagar_python
+        alcance, distancias, niveis = propagar(grafo, vertices, com_distancias)
+    return ResultadoMultiplasOrigens(list(origens), alcance, distancias, niveis,
+                                     (time.perf_counter() - t0) * 1000.0)
+
+
+# -------------------
+# PYTHON PURO: MÁSCARAS EM INTEIROS
+# -------------------
+def _propagar_python(grafo, vertices, com_distancias):
+    n, k = grafo.n, len(vertices)
+    deslocamentos, destinos = grafo.deslocamentos, grafo.destinos
+    visto = [0] * n
+    fronteira = {}  # vértice -> bits que chegaram nele no último nível
+    distancias = [array('i', [-1]) * n for _ in range(k)] if com_distancias else None
+    for j, v in enumerate(vertices):
+        visto[v] |= 1 << j
+        fronteira[v] = fronteira.get(v, 0) | (1 << j)
+        if distancias is not None:
+            distancias[j][v] = 0
+    nivel = 0
+    while fronteira:
+        nivel += 1
+        chegando = {}
+        for u, bits in fronteira.items():
+            for v in destinos[deslocamentos[u]:deslocamentos[u + 1]]:
+                chegando[v] = chegando.get(v, 0) | bits
+        fronteira = {}
+        for v, bits in chegando.items():
+            novos = bits & ~visto[v]
+            if not novos:
+                continue
+            visto[v] |= novos
+            fronteira[v] = novos
+            if distancias is not None:
+                while novos:
+                    menor = novos & -novos
+                    distancias[menor.bit_length() - 1][v] = nivel
+                    novos ^= menor
+    return visto, distancias, max(nivel - 1, 0)
+
+
+# -------------------
+# PYTHON PURO EM GRADES: A GRADE INTEIRA EM UM INTEIRO
+# -------------------
+def _faixas(por_celula, largura):
+    """Repete cada byte de por_celula em `largura` bytes seguidos e lê tudo como um inteiro."""
+    saida = bytearray(len(por_celula) * largura)
+    for o in range(largura):
+        saida[o::largura] = por_celula
+    return int.from_bytes(saida, "little")
+
+
+def _grade_inteiros(grade, vertices, com_distancias):
+    linhas, colunas = grade.linhas, grade.colunas
+    n, k = linhas * colunas, len(vertices)
+    largura = (k + 7) >> 3  # bytes por célula: bit j da faixa da célula v = origem j
+    bits = 8 * largura
+    # máscaras de destino: células livres (sem a coluna 0 / sem a última coluna para
+    # os deslocamentos horizontais, que senão passariam de uma linha para a próxima)
+    livres = bytes(grade.celulas).translate(_LIVRE_PARA_FF)
+    livre = _faixas(livres, largura)
+    sem_primeira = bytearray(livres)
+    sem_primeira[0::colunas] = bytes(linhas)
+    sem_ultima = bytearray(livres)
+    sem_ultima[colunas - 1::colunas] = bytes(linhas)
+    livre_sem_primeira = _faixas(sem_primeira, largura)
+    livre_sem_ultima = _faixas(sem_ultima, largura)
+
+    visto = 0
+    for j, v in enumerate(vertices):
+        visto |= 1 << (v * bits + j)
+    fronteira = visto & livre  # origem em parede não se propaga
+    linha = bits * colunas
+    planos = []
+    nivel = 0
+    while fronteira:
+        nivel += 1
+        chegando = (((fronteira << bits) & livre_sem_primeira) | ((fronteira >> bits) & livre_sem_ultima)
+                    | (((fronteira << linha) | (fronteira >> linha)) & livre))
+        fronteira = chegando & ~visto
+        visto |= fronteira
+        if com_distancias and fronteira:
+            # o nível é gravado em binário: plano b recebe os bits novos se o bit b de nivel estiver ligado
+            while len(planos) < nivel.bit_length():
+                planos.append(0)
+            b, resto = 0, nivel
+            while resto:
+                if resto & 1:
+                    planos[b] |= fronteira
+                b, resto = b + 1, resto >> 1
+
+    tamanho = n * largura
+    vistos = visto.to_bytes(tamanho, "little")
+    alcance = [int.from_bytes(vistos[v * largura:(v + 1) * largura], "little") for v in range(n)]
+    distancias = None
+    if com_distancias:
+        planos = [p.to_bytes(tamanho, "little") for p in planos]
+        distancias = [_distancias_da_origem(j, planos, vistos, largura, n) for j in range(k)]
+    return alcance, distancias, max(nivel - 1, 0)
+
+
+def _distancias_da_origem(j, planos, vistos, largura, n):
+    """Junta os planos de bits da origem j em array('i') (int32 little-endian, 4 bytes por célula)."""
+    o, b = j >> 3, j & 7
+    faixa = bytearray(4 * n)
+    total = 0
+    for p, plano in enumerate(planos):
+        faixa[0::4] = plano[o::largura].translate(_BIT_DO_BYTE[b])
+        total |= int.from_bytes(faixa, "little") << p
+    # não alcançado: todos os 32 bits ligados (-1)
+    faixa[0::4] = vistos[o::largura].translate(_SEM_BIT_DO_BYTE[b])
+    total |= int.from_bytes(faixa, "little") * 0xFFFFFFFF
+    distancias = array('i')
+    distancias.frombytes(total.to_bytes(4 * n, "little"))
+    if sys.byteorder != "little":
+        distancias.byteswap()
+    return distancias
+
+
+# -------------------
+# NUMPY EM GRADES: MATRIZ DE PALAVRAS DESLOCADA
+# -------------------
+def _grade_numpy(grade, vertices, com_distancias):
+    linhas, colunas = grade.linhas, grade.colunas
+    n, k = linhas * colunas, len(vertices)
+    palavras = max(1, (k + 63) >> 6)
+    livre = numpy.frombuffer(bytes(grade.celulas), dtype=numpy.uint8).reshape(linhas, colunas) != PAREDE
+    visto = numpy.zeros((linhas, colunas, palavras), dtype=numpy.uint64)
+    origens = numpy.asarray(vertices, dtype=numpy.int64)
+    j = numpy.arange(k)
+    numpy.bitwise_or.at(visto, (origens // colunas, origens % colunas, j >> 6),
+                        numpy.uint64(1) << (j & 63).astype(numpy.uint64))
+    distancias = None
+    if com_distancias:
+        distancias = numpy.full((k, n), -1, dtype=numpy.int32)
+        distancias[j, origens] = 0
+    bloqueio = ~livre[:, :, None]
+    fronteira = numpy.where(bloqueio, numpy.uint64(0), visto)  # origem em parede não se propaga
+    chegando = numpy.empty_like(visto)
+    nivel = 0
+    while fronteira.any():
+        nivel += 1
+        chegando.fill(0)
+        chegando[1:] |= fronteira[:-1]
+        chegando[:-1] |= fronteira[1:]
+        chegando[:, 1:] |= fronteira[:, :-1]
+        chegando[:, :-1] |= fronteira[:, 1:]
+        fronteira = chegando & ~visto
+        fronteira[numpy.broadcast_to(bloqueio, fronteira.shape)] = 0
+        visto |= fronteira
+        if distancias is not None:
+            plana = fronteira.reshape(n, palavras)
+            ativos = numpy.flatnonzero(plana.any(axis=1))
+            if ativos.size:
+                quais_linhas, quais = numpy.nonzero(_bits_por_origem(plana[ativos], k))
+                distancias[quais, ativos[quais_linhas]] = nivel
+    return visto.reshape(n, palavras), distancias, max(nivel - 1, 0)
+
+
+# -------------------
+# NUMPY EM GRAFOS CSR: 64 ORIGENS POR PALAVRA
+# -------------------
+def _bits_por_origem(mascaras, k):
+    """(linhas, palavras) uint64 -> (linhas, k) com 0/1, bit j da linha = coluna j."""
+    if sys.byteorder != "little":
+        mascaras = mascaras.astype("<u8")
+    octetos = numpy.ascontiguousarray(mascaras).view(numpy.uint8)
+    return numpy.unpackbits(octetos, axis=1, count=k, bitorder="little")
+
+
+def _propagar_numpy(grafo, vertices, com_distancias):
+    n, k = grafo.n, len(vertices)
+    palavras = max(1, (k + 63) >> 6)
+    deslocamentos = numpy.asarray(grafo.deslocamentos, dtype=numpy.int64)
+    destinos = numpy.asarray(grafo.destinos)
+    visto = numpy.zeros((n, palavras), dtype=numpy.uint64)
+    origens = numpy.asarray(vertices, dtype=numpy.int64)
+    j = numpy.arange(k)
+    um = numpy.uint64(1)
+    numpy.bitwise_or.at(visto, (origens, j >> 6), um << (j & 63).astype(numpy.uint64))
+    distancias = None
+    if com_distancias:
+        distancias = numpy.full((k, n), -1, dtype=numpy.int32)
+        distancias[j, origens] = 0
+    ativos = numpy.unique(origens)
+    fronteira = visto[ativos]
+    nivel = 0
+    while ativos.size:
+        nivel += 1
+        # arestas saindo da fronteira (mesmo gather da BFS por níveis)
+        inicios = deslocamentos[ativos]
+        graus = deslocamentos[ativos + 1] - inicios
+        total = int(graus.sum())
+        if total == 0:
+            break
+        antes = numpy.cumsum(graus) - graus
+        alvos = destinos[numpy.repeat(inicios - antes, graus) + numpy.arange(total)]
+        bits = numpy.repeat(fronteira, graus, axis=0)
+        # OR das máscaras que chegam em cada destino: ordena por destino e reduz por grupo
+        ordem = numpy.argsort(alvos, kind="stable")
+        alvos, bits = alvos[ordem], bits[ordem]
+        grupos = numpy.flatnonzero(numpy.concatenate(([True], alvos[1:] != alvos[:-1])))
+        alvos = alvos[grupos].astype(numpy.int64)
+        novos = numpy.bitwise_or.reduceat(bits, grupos, axis=0) & ~visto[alvos]
+        tem = novos.any(axis=1)
+        ativos, fronteira = alvos[tem], novos[tem]
+        visto[ativos] |= fronteira
+        if distancias is not None and ativos.size:
+            linhas, quais = numpy.nonzero(_bits_por_origem(fronteira, k))
+            distancias[quais, ativos[linhas]] = nivel
+    return visto, distancias, max(nivel - 1, 0)
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    import random
+
+    from gerador_labirinto import gerar_densidade
+    from labirinto import buscar_bfs
+
+    grade = gerar_densidade(300, 300, 0.25, semente=1)
+    grade.inicio = grade.fim = None
+    rnd = random.Random(2)
+    livres = [grade.posicao(i) for i in range(grade.linhas * grade.colunas) if not grade.celulas[i]]
+    origens = rnd.sample(livres, 64)
+    res = bfs_multiplas_origens(grade, origens)
+    print(f"{len(origens)} origens em uma passada ({'NumPy' if numpy is not None else 'Python puro'}): "
+          f"{res.tempo_ms:.0f} ms, {res.niveis} níveis")
+    t0 = time.perf_counter()
+    for j, pos in enumerate(origens):
+        ref = buscar_bfs(grade, pos, registrar=False)
+        assert list(ref.distancias) == list(map(int, res.distancias[j]))
+    print(f"{len(origens)} BFS independentes: {(time.perf_counter() - t0) * 1000:.0f} ms (distâncias iguais)")
@@ -0,0 +1,228 @@
+"""
+Replanejamento incremental do labirinto (D* Lite)
+
+O planejador mantém o estado da busca entre edições da grade:
+- A busca é feita de E para S (g[s] = distância de s até E), então mover S
+  só ajusta a heurística (acumulador km) e reaproveita tudo o que já foi calculado
+- Quando uma célula vira parede ou caminho, só ela e seus vizinhos são
+  reavaliados; a propagação para na região cujas distâncias realmente mudaram
+- Mover E invalida todas as distâncias: crie um novo planejador
+- Respeita o custo do terreno (grade.custos): mudar o custo de uma célula
+  também é avisado com atualizar_celula
+
+Uso:
+    planejador = PlanejadorIncremental(grade)
+    planejador.calcular()                 # primeira busca (equivale a um A* de E para S)
+    grade.definir_parede(r, c)
+    planejador.atualizar_celula(r, c)     # avisa a mudança
+    planejador.mover_inicio((r2, c2))     # S mudou de lugar
+    resultado = planejador.calcular()     # repara só o que mudou
+"""
+
+import heapq
+import time
+
+from labirinto import PAREDE, ResultadoBusca, _exigir_fim, _validar_extremos, vetor_int32
+
+# Distância "infinita" (cabe em int32 e g + 1 nunca é calculado sobre ela)
+INFINITO = 1 << 30
+
+
+class PlanejadorIncremental:
+    """
+    D* Lite (Koenig & Likhachev) em grade 4-conexa; entrar em uma célula custa
+    grade.custo(r, c) (1 sem terreno).
+
+    - g / rhs: array('i') planos; rhs[s] = menor (custo[v] + g[v]) entre os vizinhos livres v de s
+    - fila de prioridade: heapq com remoção preguiçosa (a chave válida de cada
+      célula na fila fica em um dict; entradas com chave diferente são descartadas)
+    - chave(s) = (min(g, rhs) + h(S, s) + km, min(g, rhs)), h = Manhattan
+      (admissível porque todo custo é pelo menos 1)
+    """
+    def __init__(self, grade, inicio=None, fim=None):
+        inicio, fim = _validar_extremos(grade, inicio, fim)
+        _exigir_fim(fim, "D* Lite")
+        self.grade = grade
+        n = grade.linhas * grade.colunas
+        self.g = vetor_int32(n, INFINITO)
+        self.rhs = vetor_int32(n, INFINITO)
+        self.inicio = grade.indice(*inicio)
+        self.fim = grade.indice(*fim)
+        self._ir, self._ic = inicio
+        self.km = 0
+        self._heap = []
+        self._aberta = {}  # célula -> chave atual na fila
+        self.expandidos_total = 0
+        self.rhs[self.fim] = 0
+        self._inserir(self.fim)
+
+    # -------------------
+    # FILA DE PRIORIDADE
+    # -------------------
+    def _chave(self, u):
+        m = min(self.g[u], self.rhs[u])
+        r, c = divmod(u, self.grade.colunas)
+        return (m + abs(r - self._ir) + abs(c - self._ic) + self.km, m)
+
+    def _inserir(self, u):
+        chave = self._chave(u)
+        self._aberta[u] = chave
+        heapq.heappush(self._heap, (chave[0], chave[1], u))
+
+    def _vizinhos_livres(self, u):
+        grade = self.grade
+        colunas, celulas = grade.colunas, grade.celulas
+        r, c = divmod(u, colunas)
+        if r > 0 and celulas[u - colunas] != PAREDE:
+            yield u - colunas
+        if r < grade.linhas - 1 and celulas[u + colunas] != PAREDE:
+            yield u + colunas
+        if c > 0 and celulas[u - 1] != PAREDE:
+            yield u - 1
+        if c < colunas - 1 and celulas[u + 1] != PAREDE:
+            yield u + 1
+
+    def _atualizar_vertice(self, u):
+        g, rhs = self.g, self.rhs
+        if u != self.fim:
+            grade = self.grade
+            colunas, celulas, custos = grade.colunas, grade.celulas, grade.custos
+            melhor = INFINITO
+            if celulas[u] != PAREDE and custos is None:
+                # vizinhos em linha (sem gerador): este é o trecho mais executado
+                r, c = divmod(u, colunas)
+                if r > 0 and celulas[u - colunas] != PAREDE and g[u - colunas] < melhor:
+                    melhor = g[u - colunas]
+                if r < grade.linhas - 1 and celulas[u + colunas] != PAREDE and g[u + colunas] < melhor:
+                    melhor = g[u + colunas]
+                if c > 0 and celulas[u - 1] != PAREDE and g[u - 1] < melhor:
+                    melhor = g[u - 1]
+                if c < colunas - 1 and celulas[u + 1] != PAREDE and g[u + 1] < melhor:
+                    melhor = g[u + 1]
+                if melhor < INFINITO:
+                    melhor += 1
+            elif celulas[u] != PAREDE:
+                for v in self._vizinhos_livres(u):
+                    if g[v] < INFINITO and g[v] + custos[v] < melhor:
+                        melhor = g[v] + custos[v]
+            rhs[u] = melhor
+        if g[u] != rhs[u]:
+            self._inserir(u)
+        else:
+            self._aberta.pop(u, None)
+
+    # -------------------
+    # NOTIFICAÇÕES DE MUDANÇA
+    # -------------------
+    def atualizar_celula(self, r, c):
+        """Chame depois de mudar a célula (r, c) na grade (parede <-> caminho)."""
+        u = self.grade.indice(r, c)
+        self._atualizar_vertice(u)
+        for s in self._vizinhos_livres(u):
+            self._atualizar_vertice(s)
+
+    def mover_inicio(self, pos):
+        """Muda S sem refazer a busca: km acumula o quanto a heurística pode ter caído."""
+        r, c = pos
+        if not self.grade.dentro(r, c):
+            raise ValueError("Início fora da grade.")
+        self.km += abs(r - self._ir) + abs(c - self._ic)
+        self._ir, self._ic = r, c
+        self.inicio = self.grade.indice(r, c)
+
+    # -------------------
+    # BUSCA
+    # -------------------
+    def _computar(self):
+        g, rhs = self.g, self.rhs
+        heap, aberta = self._heap, self._aberta
+        heappop, heappush = heapq.heappop, heapq.heappush
+        atualizar = self._atualizar_vertice
+        vizinhos = self._vizinhos_livres
+        inicio = self.inicio
+        ir, ic = self._ir, self._ic
+        colunas, km = self.grade.colunas, self.km
+        expandidos = 0
+        while aberta:
+            k1, k2, u = heap[0]
+            chave = (k1, k2)
+            if aberta.get(u) != chave:
+                heappop(heap)  # entrada antiga
+                continue
+            # a chave de S (h = 0) muda à medida que g/rhs de S são corrigidos
+            m = g[inicio] if g[inicio] < rhs[inicio] else rhs[inicio]
+            if chave >= (m + km, m) and g[inicio] == rhs[inicio]:
+                break
+            heappop(heap)
+            m = g[u] if g[u] < rhs[u] else rhs[u]
+            r, c = divmod(u, colunas)
+            nova = (m + abs(r - ir) + abs(c - ic) + km, m)
+            if chave < nova:
+                # chave calculada com um km antigo: reinsere com a chave atual
+                aberta[u] = nova
+                heappush(heap, (nova[0], nova[1], u))
+                continue
+            del aberta[u]
+            expandidos += 1
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]
+            else:
+                g[u] = INFINITO
+                atualizar(u)
+            for s in vizinhos(u):
+                atualizar(s)
+        return expandidos
+
+    def caminho(self):
+        """Caminho de S até E seguindo o menor custo + g entre os vizinhos ([] se não houver)."""
+        grade, g, custos = self.grade, self.g, self.grade.custos
+        atual, fim = self.inicio, self.fim
+        if grade.celulas[atual] == PAREDE or g[atual] >= INFINITO:
+            return []
+        caminho = [grade.posicao(atual)]
+        while atual != fim:
+            proximo, melhor = -1, INFINITO
+            for s in self._vizinhos_livres(atual):
+                total = g[s] + (custos[s] if custos is not None else 1)
+                if g[s] < INFINITO and total < melhor:
+                    proximo, melhor = s, total
+            if proximo == -1 or len(caminho) > len(g):
+                return []  # não deveria acontecer depois de calcular()
+            atual = proximo
+            caminho.append(grade.posicao(atual))
+        return caminho
+
+    def calcular(self):
+        """Repara as distâncias afetadas pelas mudanças avisadas e devolve o novo caminho."""
+        resultado = ResultadoBusca("d_estrela_lite", self.grade)
+        t0 = time.perf_counter()
+        if self.grade.celulas[self.inicio] != PAREDE:
+            resultado.expandidos = self._computar()
+            resultado.caminho = self.caminho()
+        self.expandidos_total += resultado.expandidos
+        resultado.tempo_ms = (time.perf_counter() - t0) * 1000.0
+        return resultado
+
+
+# -------------------
+# Demonstração
+# -------------------
+if __name__ == "__main__":
+    from labirinto import GradeLabirinto
+
+    grade = GradeLabirinto.de_texto([
+        "S   #     ",
+        " ## # ### ",
+        "  #   #   ",
+        "# ##### # ",
+        "        #E",
+    ])
+    planejador = PlanejadorIncremental(grade)
+    print("Inicial:", planejador.calcular())
+    grade.definir_parede(4, 0)
+    planejador.atualizar_celula(4, 0)
+    print("Parede em (4, 0):", planejador.calcular())
+    planejador.mover_inicio((2, 4))
+    res = planejador.calcular()
+    print("S em (2, 4):", res)
+    print("Caminho:", res.caminho)